@@ -0,0 +1,33 @@
+"""Create dataset_version table
+
+Revision ID: 5b8e1f3c9a20
+Revises: 27f5041d3872
+Create Date: 2025-07-14 09:12:41.503118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8e1f3c9a20'
+down_revision: Union[str, Sequence[str], None] = '27f5041d3872'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('dataset_version',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.execute('INSERT INTO dataset_version (id, version) VALUES (1, 0);')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('dataset_version')
@@ -0,0 +1,40 @@
+"""Add weighted search_vector column to swapi_resource
+
+Revision ID: 8c41d7e2f6b5
+Revises: 5b8e1f3c9a20
+Create Date: 2025-07-15 16:03:27.911842
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c41d7e2f6b5'
+down_revision: Union[str, Sequence[str], None] = '5b8e1f3c9a20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('swapi_resource', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(searchable_text, '')), 'C')",
+            persisted=True,
+        ),
+        nullable=True,
+    ))
+    op.create_index('ix_swapi_resource_search_vector_gin', 'swapi_resource', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_swapi_resource_search_vector_gin', table_name='swapi_resource', postgresql_using='gin')
+    op.drop_column('swapi_resource', 'search_vector')
@@ -0,0 +1,66 @@
+"""Migrate swapi_resource.data to JSONB with trigram indexes for browse filters
+
+Revision ID: a3f9c2d84e17
+Revises: 8c41d7e2f6b5
+Create Date: 2025-07-17 10:42:51.204317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f9c2d84e17'
+down_revision: Union[str, Sequence[str], None] = '8c41d7e2f6b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The filter fields and their `->>` text expressions; kept in step with
+# FILTER_PATHS in swapi_search.db.models.
+FILTER_EXPRESSIONS = {
+    'director': "(data ->> 'director')",
+    'producer': "(data ->> 'producer')",
+    'gender': "(data ->> 'gender')",
+    'homeworld': "((data -> 'homeworld') ->> 'name')",
+    'climate': "(data ->> 'climate')",
+    'terrain': "(data ->> 'terrain')",
+    'classification': "(data ->> 'classification')",
+    'language': "(data ->> 'language')",
+    'manufacturer': "(data ->> 'manufacturer')",
+    'starship_class': "(data ->> 'starship_class')",
+    'vehicle_class': "(data ->> 'vehicle_class')",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        'swapi_resource', 'data',
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        existing_nullable=False,
+        postgresql_using='data::jsonb',
+    )
+    op.create_index('ix_swapi_resource_name_trgm', 'swapi_resource', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    for field, expression in FILTER_EXPRESSIONS.items():
+        op.create_index(
+            f'ix_swapi_resource_{field}_trgm', 'swapi_resource',
+            [sa.text(f'{expression} gin_trgm_ops')], unique=False, postgresql_using='gin',
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for field in FILTER_EXPRESSIONS:
+        op.drop_index(f'ix_swapi_resource_{field}_trgm', table_name='swapi_resource')
+    op.drop_index('ix_swapi_resource_name_trgm', table_name='swapi_resource')
+    op.alter_column(
+        'swapi_resource', 'data',
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=False,
+        postgresql_using='data::json',
+    )
@@ -0,0 +1,31 @@
+"""Add a pre-encoded JSON column for raw browse and detail responses
+
+Revision ID: b58d3e6f0c21
+Revises: e61b4d0c7a93
+Create Date: 2025-07-21 14:02:51.107394
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b58d3e6f0c21'
+down_revision: Union[str, Sequence[str], None] = 'e61b4d0c7a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Not backfilled: the encoding is validated against the API response
+    # models, which only the ETL applies. Existing rows are served as before
+    # until the next load writes the column.
+    op.add_column('swapi_resource', sa.Column('data_json', sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('swapi_resource', 'data_json')
@@ -0,0 +1,28 @@
+"""Add loaded_at to dataset_version
+
+Revision ID: c3a7d91f5e48
+Revises: b58d3e6f0c21
+Create Date: 2025-07-22 10:41:07.922615
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a7d91f5e48'
+down_revision: Union[str, Sequence[str], None] = 'b58d3e6f0c21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('dataset_version', sa.Column('loaded_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('dataset_version', 'loaded_at')
@@ -0,0 +1,50 @@
+"""Add typed numeric columns for sorting and range filters
+
+Revision ID: e61b4d0c7a93
+Revises: a3f9c2d84e17
+Create Date: 2025-07-18 09:27:14.583026
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e61b4d0c7a93'
+down_revision: Union[str, Sequence[str], None] = 'a3f9c2d84e17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NUMERIC_COLUMNS = {
+    'population': sa.BigInteger(),
+    'diameter': sa.Float(),
+    'cost_in_credits': sa.BigInteger(),
+    'length': sa.Float(),
+    'height': sa.Float(),
+    'mass': sa.Float(),
+}
+
+# Same format as scripts.etl.normalizer.parse_number accepts, e.g. "1,000" or "78.2".
+NUMBER_PATTERN = r'^-?[0-9,]*\.?[0-9]+$'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column, type_ in NUMERIC_COLUMNS.items():
+        op.add_column('swapi_resource', sa.Column(column, type_, nullable=True))
+        # Backfill from the existing rows; the next ETL load writes them too.
+        op.execute(
+            f"UPDATE swapi_resource "
+            f"SET {column} = replace(data ->> '{column}', ',', '')::numeric "
+            f"WHERE data ->> '{column}' ~ '{NUMBER_PATTERN}'"
+        )
+        op.create_index(f'ix_swapi_resource_type_{column}', 'swapi_resource', ['type', column, 'swapi_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in NUMERIC_COLUMNS:
+        op.drop_index(f'ix_swapi_resource_type_{column}', table_name='swapi_resource')
+        op.drop_column('swapi_resource', column)
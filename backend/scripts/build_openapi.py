@@ -0,0 +1,33 @@
+"""
+Writes the API's OpenAPI schema to a file at build time, to be served via
+the OPENAPI_SCHEMA_PATH setting instead of being generated by every cold
+process on its first schema request, and the digest of the source it was
+generated from next to it (`<path>.revision`), so it is never served for
+other code.
+
+Usage: python scripts/build_openapi.py [output path, default openapi.json]
+"""
+
+import json
+import sys
+from pathlib import Path
+
+from fastapi import FastAPI
+
+from swapi_search.core.startup import schema_revision_path, source_digest
+from swapi_search.main import create_app
+
+
+def build_openapi(path: str):
+    """Generates the schema of a freshly created app and writes it, and its revision, to `path`."""
+    # The class's method, so a prebuilt schema the app is configured with
+    # is never copied instead of being generated.
+    schema = FastAPI.openapi(create_app())
+    Path(path).write_text(json.dumps(schema, separators=(",", ":")), encoding="utf-8")
+    schema_revision_path(path).write_text(source_digest(), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    output = sys.argv[1] if len(sys.argv) > 1 else "openapi.json"
+    build_openapi(output)
+    print(f"OpenAPI schema written to {output}")
@@ -1,7 +1,9 @@
 import logging
 from typing import List, Dict, Any
+from sqlalchemy import func, select, text, update
 from sqlalchemy.orm import Session
-from swapi_search.db.models import SwapiResource
+from swapi_search.db.dataset import DATASET_CHANNEL
+from swapi_search.db.models import DatasetVersion, SwapiResource
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +29,7 @@ class DataLoader:
         try:
             logger.info(f"Starting to load {len(data)} records into the database...")
             self.db_session.bulk_insert_mappings(SwapiResource, data)
+            self._bump_dataset_version()
             self.db_session.commit()
             logger.info("Successfully committed all records to the database.")
         except Exception as e:
@@ -34,4 +37,29 @@ class DataLoader:
             self.db_session.rollback()
             raise
         finally:
-            self.db_session.close()
\ No newline at end of file
+            self.db_session.close()
+
+    def _bump_dataset_version(self):
+        """
+        Increments the dataset version and records the load time in the same
+        transaction as the insert, so readers never observe a new version
+        without its data, and queues a NOTIFY that PostgreSQL delivers to
+        listening API processes on commit.
+        """
+        result = self.db_session.execute(
+            update(DatasetVersion)
+            .where(DatasetVersion.id == 1)
+            .values(version=DatasetVersion.version + 1, loaded_at=func.now())
+        )
+        if result.rowcount == 0:
+            self.db_session.add(DatasetVersion(id=1, version=1, loaded_at=func.now()))
+            self.db_session.flush()
+
+        version = self.db_session.execute(
+            select(DatasetVersion.version).where(DatasetVersion.id == 1)
+        ).scalar_one()
+        self.db_session.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": DATASET_CHANNEL, "payload": str(version)},
+        )
+        logger.info(f"Dataset version bumped to {version}.")
\ No newline at end of file
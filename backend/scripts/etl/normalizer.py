@@ -1,11 +1,45 @@
 import logging
-from typing import Dict, List, Any, Optional
+import re
+from typing import Dict, List, Any, Optional, Union
 
+from pydantic import ValidationError
+
+from swapi_search.api.v1.registry import RESOURCE_CONFIG
 from swapi_search.core.config import settings
+from swapi_search.db.models import NUMERIC_FIELDS
 from .data_models import SwapiBaseModel
 
 logger = logging.getLogger(__name__)
 
+# A plain decimal number, optionally with thousands separators: "1,000", "78.2".
+_NUMBER = re.compile(r"-?[\d,]*\.?\d+")
+
+
+def parse_number(value: Any) -> Optional[Union[int, float]]:
+    """
+    Parses a SWAPI numeric string such as "1,000" or "78.2". Returns None
+    for "unknown", "n/a", ranges and anything else that is not one number.
+    """
+    if not isinstance(value, str) or not _NUMBER.fullmatch(value.strip()):
+        return None
+    number = float(value.strip().replace(",", ""))
+    return int(number) if number.is_integer() else number
+
+
+def encode_resource(resource_type: str, data: Dict[str, Any]) -> Optional[str]:
+    """
+    Validates a resource with its browse response model and returns the JSON
+    the API serves for it, so requests need neither validate nor encode it.
+    Returns None, leaving the API to encode the resource per request, if it
+    does not validate.
+    """
+    model = RESOURCE_CONFIG[resource_type]["response_model"]
+    try:
+        return model.model_validate(data).model_dump_json()
+    except ValidationError as e:
+        logger.warning(f"Resource {data.get('url')} does not match {model.__name__}: {e}")
+        return None
+
 
 class DataNormalizer:
     """
@@ -96,7 +130,9 @@ class DataNormalizer:
                     "type": resource_type,
                     "name": enriched_data.get("name", "Unknown"),
                     "data": enriched_data,
+                    "data_json": encode_resource(resource_type, enriched_data),
                     "searchable_text": self._create_searchable_text(enriched_data),
+                    **{field: parse_number(enriched_data.get(field)) for field in NUMERIC_FIELDS},
                 }
                 all_final_records.append(db_record)
         
@@ -0,0 +1,114 @@
+"""
+Reports what a cold start of the API costs: the time and peak memory of
+importing `swapi_search.main` (which builds the settings and the app) in a
+fresh interpreter, and, from `python -X importtime`, the packages and
+modules that time goes to. Settings can be passed as environment
+variables, e.g. to compare configurations:
+
+    DOCS_ENABLED=false python scripts/profile_startup.py --top 20
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+# Runs in the profiled interpreter and prints its measurements as JSON.
+_PROBE = """
+import json, resource, sys, time
+started = time.perf_counter()
+import swapi_search.main
+import_seconds = time.perf_counter() - started
+from swapi_search.db import session
+peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({
+    "import_seconds": import_seconds,
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere.
+    "peak_rss_mb": peak_rss / (1024 * 1024 if sys.platform == "darwin" else 1024),
+    "modules_loaded": len(sys.modules),
+    "engines_created": [
+        name for name, engine in (("async", session._async_engine), ("sync", session._sync_engine))
+        if engine is not None
+    ],
+    "numpy_loaded": "numpy" in sys.modules,
+}))
+"""
+
+
+def parse_importtime(output: str) -> List[Tuple[str, int, int]]:
+    """
+    Parses `-X importtime` output into (module, self µs, cumulative µs)
+    tuples, in import completion order.
+    """
+    imports = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the header
+        imports.append((fields[2].strip(), int(fields[0]), int(fields[1])))
+    return imports
+
+
+def profile_cold_start(env: Optional[Dict[str, str]] = None, import_profile: bool = True) -> Dict[str, Any]:
+    """
+    Imports the app in a fresh interpreter with `env` added to the
+    environment and returns its measurements. With `import_profile`, the
+    per-module import times are included under "imports"; collecting them
+    slows the import slightly.
+    """
+    python_path = os.pathsep.join(filter(None, [str(BACKEND_DIR / "src"), os.environ.get("PYTHONPATH")]))
+    command = [sys.executable]
+    if import_profile:
+        command += ["-X", "importtime"]
+    result = subprocess.run(
+        command + ["-c", _PROBE],
+        cwd=BACKEND_DIR,
+        env={**os.environ, "PYTHONPATH": python_path, **(env or {})},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    profile = json.loads(result.stdout.strip().splitlines()[-1])
+    if import_profile:
+        profile["imports"] = parse_importtime(result.stderr)
+    return profile
+
+
+def print_report(profile: Dict[str, Any], top: int):
+    print(f"Import of swapi_search.main: {profile['import_seconds'] * 1000:.0f}ms")
+    print(f"Peak RSS:                    {profile['peak_rss_mb']:.1f}MB")
+    print(f"Modules loaded:              {profile['modules_loaded']}")
+    print(f"Engines created at import:   {', '.join(profile['engines_created']) or 'none'}")
+    print(f"numpy loaded:                {profile['numpy_loaded']}")
+
+    by_package: Dict[str, int] = defaultdict(int)
+    for module, self_us, _ in profile["imports"]:
+        by_package[module.split(".")[0]] += self_us
+    print(f"\nTop {top} packages by import time (ms):")
+    for package, self_us in sorted(by_package.items(), key=lambda item: -item[1])[:top]:
+        print(f"  {self_us / 1000:8.1f}  {package}")
+
+    print(f"\nTop {top} modules by own import time (ms, cumulative in parentheses):")
+    for module, self_us, cumulative_us in sorted(profile["imports"], key=lambda item: -item[1])[:top]:
+        print(f"  {self_us / 1000:8.1f}  ({cumulative_us / 1000:.1f})  {module}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--top", type=int, default=15, help="packages and modules to list")
+    parser.add_argument("--json", action="store_true", help="print the raw measurements as JSON")
+    args = parser.parse_args()
+
+    measurements = profile_cold_start()
+    if args.json:
+        print(json.dumps(measurements))
+    else:
+        print_report(measurements, args.top)
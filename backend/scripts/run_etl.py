@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from swapi_search.core.logging import setup_logging
-from swapi_search.db.session import sync_engine, SyncSessionLocal
+from swapi_search.db.session import get_sync_engine, SyncSessionLocal
 from swapi_search.db.models import Base
 from etl.swapi_client import SwapiClient
 from etl.normalizer import DataNormalizer
@@ -28,7 +28,7 @@ async def run_etl_pipeline():
     loader = DataLoader(db_session)
 
     try:
-        with sync_engine.connect() as connection:
+        with get_sync_engine().connect() as connection:
             connection.execute(text("TRUNCATE TABLE swapi_resource RESTART IDENTITY;"))
             connection.commit()
         # --- Extract ---
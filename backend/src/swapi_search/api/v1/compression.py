@@ -0,0 +1,261 @@
+import gzip
+import re
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Pattern, Tuple
+
+try:
+    import brotli
+except ImportError:  # brotli is an optional dependency (the "compression" extra)
+    brotli = None
+
+from starlette.datastructures import Headers, MutableHeaders, QueryParams
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from swapi_search.core.config import settings
+
+# Content codings the service can produce, in order of preference.
+ENCODINGS: Tuple[str, ...] = ("br", "gzip") if brotli is not None else ("gzip",)
+
+# Browse parameters that select a page of the whole type rather than filter it.
+PAGING_PARAMS = frozenset({"limit", "offset", "cursor", "sort", "order", "fields", "expand"})
+
+_QUALITY = re.compile(r"q\s*=\s*([0-9.]+)")
+
+
+def negotiate_encoding(accept_encoding: Optional[str], encodings: Iterable[str] = ENCODINGS) -> Optional[str]:
+    """
+    Picks the content coding to send for an Accept-Encoding header: the
+    client's highest-weighted one among `encodings`, ties going to the
+    earlier one. Returns None when the body should be sent uncompressed.
+    """
+    if not accept_encoding:
+        return None
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        match = _QUALITY.search(params)
+        try:
+            weights[coding.strip().lower()] = float(match.group(1)) if match else 1.0
+        except ValueError:
+            continue
+
+    best, best_weight = None, 0.0
+    for coding in encodings:
+        weight = weights.get(coding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """
+    Compresses a body at the highest level, which is affordable as each
+    variant is only compressed once per dataset version. gzip output has no
+    timestamp so a variant's bytes, like its ETag, only depend on the body.
+    """
+    if encoding == "br":
+        return brotli.compress(body, quality=11)
+    return gzip.compress(body, compresslevel=9, mtime=0)
+
+
+class CompressedResponseCache:
+    """
+    A byte-bounded LRU cache of compressed response variants for the current
+    dataset version, keyed by path, query string and content coding.
+
+    All entries are dropped when the dataset version changes. The cache also
+    counts requests per key, so a route can be admitted only once it has
+    proven popular instead of on its first request.
+    """
+
+    def __init__(self, max_bytes: int, max_tracked: int = 10_000):
+        self.max_bytes = max_bytes
+        self.max_tracked = max_tracked
+        self._version: Optional[int] = None
+        self._entries: "OrderedDict[Hashable, Tuple[List[Tuple[bytes, bytes]], bytes]]" = OrderedDict()
+        self._requests: Dict[Hashable, int] = {}
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _use_version(self, version: int):
+        if version != self._version:
+            self.clear()
+            self._version = version
+
+    def record_request(self, key: Hashable, version: int) -> int:
+        """Counts a request for a key and returns how often it was seen this version."""
+        self._use_version(version)
+        if key not in self._requests and len(self._requests) >= self.max_tracked:
+            self._requests.clear()
+        self._requests[key] = self._requests.get(key, 0) + 1
+        return self._requests[key]
+
+    def get(self, key: Hashable, version: int) -> Optional[Tuple[List[Tuple[bytes, bytes]], bytes]]:
+        """Returns the cached (raw headers, body) of a variant, or None on a miss."""
+        self._use_version(version)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: Hashable, version: int, headers: List[Tuple[bytes, bytes]], body: bytes):
+        """Stores a variant, evicting the least recently used ones if over budget."""
+        self._use_version(version)
+        if len(body) > self.max_bytes:
+            return
+        if key in self._entries:
+            self.size_bytes -= len(self._entries.pop(key)[1])
+        self._entries[key] = (headers, body)
+        self.size_bytes += len(body)
+        while self.size_bytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.size_bytes -= len(evicted)
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+        self._requests.clear()
+        self.size_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns the cache's size and hit/miss/eviction counters."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "size_bytes": self.size_bytes,
+            "max_bytes": self.max_bytes,
+            "encodings": list(ENCODINGS),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def admission_policy(
+    resource_types: Iterable[str], hot_search_requests: int
+) -> Callable[[str, QueryParams], Optional[int]]:
+    """
+    Decides which responses are worth keeping compressed, as the number of
+    requests after which they are cached, or None for never: detail pages
+    and unfiltered browse pages at once, searches only once they are hot,
+    as most queries are never repeated.
+    """
+    types = "|".join(re.escape(resource_type) for resource_type in resource_types)
+    detail = re.compile(rf"/api/v1/(?:{types})/[^/]+")
+    browse = re.compile(rf"/api/v1/(?:{types})")
+
+    def requests_before_caching(path: str, query: QueryParams) -> Optional[int]:
+        if detail.fullmatch(path):
+            return 1
+        if browse.fullmatch(path):
+            return 1 if set(query.keys()) <= PAGING_PARAMS else None
+        if path == "/api/v1/search":
+            return hot_search_requests
+        return None
+
+    return requests_before_caching
+
+
+class PrecompressedResponseMiddleware:
+    """
+    Negotiates compression of JSON GET responses via Accept-Encoding without
+    compressing on every request.
+
+    Responses the `admission` policy accepts are compressed once per dataset
+    version, on their admitting request, and later requests for the same URL
+    and coding are answered from `cache` without running the route. Every
+    other response is sent uncompressed, as are bodies under `min_size`
+    bytes, which gain little from compression. Responses of `path_pattern`
+    routes carry `Vary: Accept-Encoding` either way.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        path_pattern: Pattern[str],
+        version_provider: Callable[[], Optional[int]],
+        cache: CompressedResponseCache,
+        admission: Callable[[str, QueryParams], Optional[int]],
+        min_size: int = 1024,
+    ):
+        self.app = app
+        self.path_pattern = path_pattern
+        self.version_provider = version_provider
+        self.cache = cache
+        self.admission = admission
+        self.min_size = min_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not self.path_pattern.fullmatch(scope["path"])
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        version = self.version_provider()
+        threshold = self.admission(scope["path"], QueryParams(scope["query_string"]))
+        if encoding is None or version is None or threshold is None:
+            await self.app(scope, receive, self._vary(send))
+            return
+
+        key = (scope["path"], scope["query_string"], encoding)
+        cached = self.cache.get(key, version)
+        if cached is not None:
+            headers, body = cached
+            await self._send(send, 200, headers, body)
+            return
+        if self.cache.record_request(key, version) < threshold:
+            await self.app(scope, receive, self._vary(send))
+            return
+
+        start: Optional[Message] = None
+        chunks: List[bytes] = []
+
+        async def buffer(message: Message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, buffer)
+        body = b"".join(chunks)
+        headers = MutableHeaders(raw=list(start["headers"]))
+        if start["status"] == 200 and "content-encoding" not in headers:
+            if len(body) >= self.min_size:
+                body = compress(body, encoding)
+                headers["Content-Encoding"] = encoding
+            headers.add_vary_header("Accept-Encoding")
+            del headers["Content-Length"]
+            self.cache.put(key, version, headers.raw, body)
+        await self._send(send, start["status"], headers.raw, body)
+
+    @staticmethod
+    def _vary(send: Send) -> Send:
+        async def send_with_vary(message: Message):
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).add_vary_header("Accept-Encoding")
+            await send(message)
+
+        return send_with_vary
+
+    @staticmethod
+    async def _send(send: Send, status: int, raw_headers: List[Tuple[bytes, bytes]], body: bytes):
+        headers = MutableHeaders(raw=list(raw_headers))
+        headers["Content-Length"] = str(len(body))
+        await send({"type": "http.response.start", "status": status, "headers": headers.raw})
+        await send({"type": "http.response.body", "body": body})
+
+
+compressed_response_cache = CompressedResponseCache(
+    max_bytes=settings.RESPONSE_COMPRESSION_CACHE_MAX_BYTES,
+)
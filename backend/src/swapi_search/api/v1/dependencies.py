@@ -1,24 +1,106 @@
 # src/swapi_search/api/v1/dependencies.py
 
-from typing import Annotated
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Annotated
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from swapi_search.repositories.resource import ResourceRepository
-from swapi_search.db.session import get_db
+from swapi_search.core.config import settings
+from swapi_search.repositories.memory import in_memory_resource_repository
+from swapi_search.repositories.resource import ResourceRepository, type_count_cache
+from swapi_search.db.dataset import dataset_watcher
+from swapi_search.db.routing import get_read_db, replica_router
 from swapi_search.search.base import BaseSearchEngine
+from swapi_search.search.bm25 import bm25_search_engine
+from swapi_search.search.cache import CachedSearchEngine, search_result_cache
+from swapi_search.search.memory import in_memory_search_engine
 from swapi_search.search.postgres import PostgresSearchEngine
+from swapi_search.search.shadow import ShadowSearchEngine, shadow_stats
+
+# Engines serving searches from in-process indexes, by SEARCH_ENGINE name.
+IN_PROCESS_ENGINES = {"memory": in_memory_search_engine, "bm25": bm25_search_engine}
+
+@asynccontextmanager
+async def _standalone_search_engine(name: str) -> AsyncIterator[BaseSearchEngine]:
+    """
+    Yields the named engine for use outside a request, with its own
+    read-only database session when it needs one.
+    """
+    if name in IN_PROCESS_ENGINES:
+        yield IN_PROCESS_ENGINES[name]
+    else:
+        async with replica_router.session() as session:
+            yield PostgresSearchEngine(db_session=session)
+
+def shadow_replay_limit() -> int:
+    """
+    How many shadow replays may run at once: SEARCH_SHADOW_MAX_PENDING, but
+    for a database-backed shadow engine at most half of DB_POOL_SIZE. Each
+    such replay holds a connection from the pool that also serves requests,
+    so replays never take its overflow or leave live requests waiting for
+    a connection; replays past the limit are dropped.
+    """
+    if settings.SEARCH_SHADOW_ENGINE in IN_PROCESS_ENGINES:
+        return settings.SEARCH_SHADOW_MAX_PENDING
+    return min(settings.SEARCH_SHADOW_MAX_PENDING, max(settings.DB_POOL_SIZE // 2, 1))
 
 def get_search_engine(
-    db_session: Annotated[AsyncSession, Depends(get_db)]
+    db_session: Annotated[AsyncSession, Depends(get_read_db)]
 ) -> BaseSearchEngine:
-    """Dependency provider for the search engine."""
-    return PostgresSearchEngine(db_session=db_session)
+    """
+    Dependency provider for the search engine.
+    The backend is selected by the SEARCH_ENGINE setting, shadowed by
+    SEARCH_SHADOW_ENGINE when set and, unless SEARCH_CACHE_ENABLED is off,
+    wrapped with the shared result cache. The cache is outermost so only
+    cache misses are shadowed and timed.
+    """
+    if settings.SEARCH_ENGINE in IN_PROCESS_ENGINES:
+        engine: BaseSearchEngine = IN_PROCESS_ENGINES[settings.SEARCH_ENGINE]
+    else:
+        engine = PostgresSearchEngine(db_session=db_session)
+
+    if settings.SEARCH_SHADOW_ENGINE:
+        engine = ShadowSearchEngine(
+            engine,
+            secondary=lambda: _standalone_search_engine(settings.SEARCH_SHADOW_ENGINE),
+            stats=shadow_stats,
+            sample_rate=settings.SEARCH_SHADOW_SAMPLE_RATE,
+            max_pending=shadow_replay_limit(),
+        )
+
+    if settings.SEARCH_CACHE_ENABLED:
+        engine = CachedSearchEngine(
+            engine,
+            cache=search_result_cache,
+            version_provider=lambda: dataset_watcher.version,
+        )
+    return engine
 
 def get_resource_repository(
-    db_session: Annotated[AsyncSession, Depends(get_db)]
+    db_session: Annotated[AsyncSession, Depends(get_read_db)]
 ) -> ResourceRepository:
     """
     Dependency provider for the ResourceRepository.
-    Creates a repository instance with the current database session.
+    Returns the in-memory read model when RESOURCE_REPOSITORY is "memory";
+    otherwise creates a repository instance with the current database
+    session, sharing the per-type count cache for the current dataset version.
+    """
+    if settings.RESOURCE_REPOSITORY == "memory":
+        return in_memory_resource_repository
+    return ResourceRepository(
+        db_session=db_session,
+        count_cache=type_count_cache,
+        version_provider=lambda: dataset_watcher.version,
+    )
+
+@asynccontextmanager
+async def standalone_resource_repository() -> AsyncIterator[ResourceRepository]:
+    """
+    Yields the configured ResourceRepository with its own read-only session,
+    for work that outlives the request's dependencies, such as a streaming
+    response body, which is sent after they are closed.
     """
-    return ResourceRepository(db_session=db_session)
+    if settings.RESOURCE_REPOSITORY == "memory":
+        yield in_memory_resource_repository
+    else:
+        async with replica_router.session() as session:
+            yield ResourceRepository(db_session=session)
@@ -0,0 +1,67 @@
+import json
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+from fastapi import Response
+from pydantic import BaseModel
+
+
+def encode_item(model: type[BaseModel], item: Union[Dict[str, Any], str]) -> str:
+    """
+    The JSON of a resource read with `encoded=True`: the ETL's pre-encoded
+    string as is, or a resource without one validated and encoded with its
+    response model, as the route's response_model would.
+    """
+    if isinstance(item, str):
+        return item
+    return model.model_validate(item).model_dump_json()
+
+
+def decode_item(model: type[BaseModel], item: Union[Dict[str, Any], str]) -> Dict[str, Any]:
+    """
+    A resource read with `encoded=True` as the dictionary its detail
+    response holds, for embedding in other responses.
+    """
+    if isinstance(item, str):
+        return json.loads(item)
+    return model.model_validate(item).model_dump(mode="json")
+
+
+def encoded_response(model: type[BaseModel], item: Union[Dict[str, Any], str]) -> Response:
+    """A detail response sending a resource's pre-encoded JSON unchanged."""
+    return Response(encode_item(model, item), media_type="application/json")
+
+
+def encoded_page_response(
+    model: type[BaseModel],
+    count: int,
+    limit: int,
+    offset: int,
+    next_cursor: Optional[str],
+    items: Sequence[Union[Dict[str, Any], str]],
+) -> Response:
+    """
+    A browse response spliced together from pre-encoded resources, with the
+    same bytes as `PaginatedResponse[model]` would serialize to but without
+    decoding, validating and re-encoding every item.
+    """
+    results = ",".join(encode_item(model, item) for item in items)
+    body = (
+        f'{{"count":{count},"limit":{limit},"offset":{offset},'
+        f'"next_cursor":{json.dumps(next_cursor)},"results":[{results}]}}'
+    )
+    return Response(body, media_type="application/json")
+
+
+def encoded_lookup_response(
+    results: Sequence[Tuple[str, int, Optional[str]]],
+) -> Response:
+    """
+    A `ResourceLookupResponse` spliced together from (type, id, encoded
+    resource) entries, the resource being None for those not found.
+    """
+    entries = ",".join(
+        f'{{"type":{json.dumps(resource_type)},"id":{resource_id},'
+        f'"found":{json.dumps(item is not None)},"data":{item if item is not None else "null"}}}'
+        for resource_type, resource_id, item in results
+    )
+    return Response(f'{{"results":[{entries}]}}', media_type="application/json")
@@ -0,0 +1,36 @@
+from typing import Optional
+
+from fastapi import APIRouter, Query
+
+from swapi_search.api.v1.registry import ResourceType
+from swapi_search.api.v1.schemas import AutocompleteResponse
+from swapi_search.search.autocomplete import autocompleter
+
+router = APIRouter(tags=["Search"])
+
+
+@router.get(
+    "/autocomplete",
+    response_model=AutocompleteResponse,
+    summary="Type-ahead Suggestions for Resource Names",
+    description="Returns resources whose name, or a word within it, starts with the given prefix. "
+                "Served from an in-memory index, so it is cheap enough to call on every keystroke.",
+)
+async def autocomplete(
+    prefix: str = Query(
+        ...,
+        min_length=1,
+        description="The beginning of a name or of a word in it (e.g., 'sky', 'obi').",
+    ),
+    type: Optional[ResourceType] = Query(
+        None, description="Restrict suggestions to a resource type."
+    ),
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of suggestions."),
+):
+    """
+    Autocomplete endpoint backed by the in-memory prefix index.
+    """
+    results = autocompleter.suggest(
+        prefix, resource_type=type.value if type else None, limit=limit
+    )
+    return {"results": results}
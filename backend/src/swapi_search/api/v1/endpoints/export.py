@@ -0,0 +1,63 @@
+import zlib
+from typing import AsyncIterator, Optional
+
+from fastapi import APIRouter, Header, Query
+from fastapi.responses import StreamingResponse
+
+from swapi_search.api.v1.compression import negotiate_encoding
+from swapi_search.api.v1.dependencies import standalone_resource_repository
+from swapi_search.api.v1.registry import ResourceType
+from swapi_search.core.config import settings
+
+router = APIRouter(tags=["Export"])
+
+
+async def _ndjson(resource_type: Optional[str]) -> AsyncIterator[bytes]:
+    """
+    Renders resources as NDJSON, one chunk per batch read. The repository
+    and its session are opened here, as the body is only produced once the
+    endpoint has returned.
+    """
+    async with standalone_resource_repository() as repo:
+        async for batch in repo.stream_resources(resource_type, batch_size=settings.EXPORT_BATCH_SIZE):
+            yield "".join(f"{document}\n" for document in batch).encode()
+
+
+async def _gzip(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Compresses a stream chunk by chunk into a single gzip member."""
+    compressor = zlib.compressobj(level=6, wbits=31)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+@router.get(
+    "/export",
+    summary="Export Resources as NDJSON",
+    description="Streams the data of every resource, or of every resource of one type, as "
+                "newline-delimited JSON ordered by type and ID. The body is gzip-compressed "
+                "when the client sends 'Accept-Encoding: gzip'.",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+async def export_resources(
+    type: Optional[ResourceType] = Query(None, description="Only export resources of this type."),
+    accept_encoding: Optional[str] = Header(None),
+):
+    """
+    Bulk export for downstream jobs, read through a server-side cursor and
+    sent as it is read, so neither the service nor the client holds the
+    whole dataset. A client reading slowly slows the read down.
+    """
+    resource_type = type.value if type else None
+    headers = {
+        "Content-Disposition": f'attachment; filename="swapi-{resource_type or "all"}.ndjson"',
+        "Vary": "Accept-Encoding",
+    }
+    body = _ndjson(resource_type)
+    if negotiate_encoding(accept_encoding, ("gzip",)) == "gzip":
+        body = _gzip(body)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(body, media_type="application/x-ndjson", headers=headers)
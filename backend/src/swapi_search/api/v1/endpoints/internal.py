@@ -0,0 +1,56 @@
+from fastapi import APIRouter
+
+from swapi_search.api.v1.compression import compressed_response_cache
+from swapi_search.api.v1.dependencies import shadow_replay_limit
+from swapi_search.core.config import settings
+from swapi_search.db.dataset import dataset_watcher
+from swapi_search.db.routing import replica_router
+from swapi_search.db.session import pool_metrics
+from swapi_search.search.cache import search_result_cache
+from swapi_search.search.shadow import shadow_stats
+
+# Operational endpoints for the team; kept out of the public OpenAPI schema.
+router = APIRouter(prefix="/internal", tags=["Internal"], include_in_schema=False)
+
+
+@router.get("/search-cache", summary="Search result cache statistics")
+async def search_cache_stats():
+    """Returns the size and hit/miss/eviction counters of the search cache."""
+    return {
+        "dataset_version": dataset_watcher.version,
+        **search_result_cache.stats(),
+    }
+
+
+@router.get("/search-shadow", summary="Shadow search engine comparison")
+async def search_shadow_stats():
+    """
+    Returns latency histograms of the serving and shadow engines and how
+    often their top results agree.
+    """
+    return {
+        "primary_engine": settings.SEARCH_ENGINE,
+        "secondary_engine": settings.SEARCH_SHADOW_ENGINE,
+        "sample_rate": settings.SEARCH_SHADOW_SAMPLE_RATE,
+        "max_pending": shadow_replay_limit(),
+        **shadow_stats.snapshot(),
+    }
+
+
+@router.get("/response-cache", summary="Compressed response cache statistics")
+async def response_cache_stats():
+    """Returns the size and hit/miss/eviction counters of the compressed response cache."""
+    return {
+        "dataset_version": dataset_watcher.version,
+        **compressed_response_cache.stats(),
+    }
+
+
+@router.get("/db-pool", summary="Database connection pool metrics")
+async def db_pool_stats():
+    """
+    Returns checkout wait times and in-use, idle and overflow connection
+    counts of this process's database pools, for sizing DB_POOL_SIZE and
+    DB_MAX_OVERFLOW, and the health and share of reads of each replica.
+    """
+    return {**pool_metrics(), "read_routing": replica_router.stats()}
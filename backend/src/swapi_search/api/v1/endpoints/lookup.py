@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Depends
+
+from swapi_search.api.v1.dependencies import get_resource_repository
+from swapi_search.api.v1.encoded import encode_item, encoded_lookup_response
+from swapi_search.api.v1.registry import RESOURCE_CONFIG
+from swapi_search.api.v1.schemas import ResourceLookupRequest, ResourceLookupResponse
+from swapi_search.repositories.resource import ResourceRepository
+
+router = APIRouter(tags=["Resources"])
+
+
+@router.post(
+    "/resources/lookup",
+    response_model=ResourceLookupResponse,
+    summary="Fetch Many Resources by Type and ID",
+    description="Fetches up to 500 resources of any types in one request, e.g. a list of "
+                "favorites or a relation array. Results follow the request order, and "
+                "resources that do not exist are reported with 'found: false'.",
+)
+async def lookup_resources(
+    lookup: ResourceLookupRequest,
+    repo: ResourceRepository = Depends(get_resource_repository),
+):
+    """
+    Bulk lookup endpoint. All items are resolved with a single query on the
+    (type, swapi_id) unique index, and each is sent in the same shape as
+    from its detail endpoint, pre-encoded by the ETL where possible.
+    """
+    keys = {(item.type, item.id) for item in lookup.items}
+    found = await repo.get_resources_by_keys(keys, encoded=True)
+    results = []
+    for item in lookup.items:
+        document = found.get((item.type, item.id))
+        if document is not None:
+            document = encode_item(RESOURCE_CONFIG[item.type]["response_model"], document)
+        results.append((item.type, item.id, document))
+    return encoded_lookup_response(results)
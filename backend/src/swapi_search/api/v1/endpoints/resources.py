@@ -1,7 +1,21 @@
-from typing import Optional
+from typing import Literal, Optional, Sequence
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 from swapi_search.api.v1.dependencies import get_resource_repository
+from swapi_search.api.v1.encoded import encoded_page_response, encoded_response
+from swapi_search.api.v1.expansion import expand_relations, parse_expand, relation_fields
+from swapi_search.api.v1.fieldsets import (
+    FIELDS_DESCRIPTION,
+    parse_fields,
+    projected_model,
+    sparse_response,
+)
+from swapi_search.api.v1.pagination import (
+    BROWSE_CURSOR_TYPES,
+    SORTED_BROWSE_CURSOR_TYPES,
+    decode_cursor,
+    encode_cursor,
+)
 from swapi_search.api.v1.schemas import PaginatedResponse
 from swapi_search.repositories.resource import ResourceRepository
 
@@ -11,6 +25,7 @@ def resource_router_factory(
     response_model: type,
     filters_model: Optional[type[BaseModel]],
     tag: str,
+    sort_fields: Sequence[str] = (),
 ) -> APIRouter:
     """
     A factory that generates a set of RESTful endpoints for a resource type.
@@ -23,12 +38,19 @@ def resource_router_factory(
         resource_type: The string name of the resource (e.g., 'films').
         response_model: The Pydantic model for the response.
         tag: The tag to group endpoints under in the OpenAPI documentation.
+        sort_fields: Numeric fields the list endpoint may be sorted by.
 
     Returns:
         An APIRouter instance with 'get all' and 'get one' endpoints.
     """
     router = APIRouter(prefix=f"/{resource_type}", tags=[tag])
     DetailResponseModel = response_model
+    # Only the fields declared for this type are accepted by `sort`.
+    SortField = Literal[tuple(sort_fields)] if sort_fields else None
+    expand_description = (
+        "Comma-separated relation fields to embed as full resources instead of "
+        f"{{url, name}} references: {', '.join(relation_fields(DetailResponseModel))}."
+    )
 
     @router.get(
         "",
@@ -42,25 +64,75 @@ def resource_router_factory(
             10, ge=1, le=100, description="Number of results to return."
         ),
         offset: int = Query(0, ge=0, description="Offset for pagination."),
+        cursor: Optional[str] = Query(
+            None,
+            description="Opaque cursor from a previous page's 'next_cursor'. "
+                        "When provided, 'offset' is ignored.",
+        ),
+        sort: Optional[SortField] = Query(
+            None,
+            description="Numeric field to sort by instead of ID; resources where it "
+                        "is unknown come last.",
+            include_in_schema=bool(sort_fields),
+        ),
+        order: Literal["asc", "desc"] = Query(
+            "asc", description="Sort direction for 'sort'.", include_in_schema=bool(sort_fields)
+        ),
+        fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+        expand: Optional[str] = Query(None, description=expand_description),
     ):
         """
         Retrieves a paginated list of all resources of this type from the
-        database, ordered by their original SWAPI ID.
+        database, ordered by their original SWAPI ID or by the 'sort' field.
+        Full resources are sent as pre-encoded by the ETL, spliced into the
+        page envelope.
         """
-        filter_dict = filters.model_dump(exclude_unset=True) if filters else {}        
+        filter_dict = filters.model_dump(exclude_unset=True) if filters else {}
+        projection = parse_fields(fields, DetailResponseModel.model_fields)
+        expansion = parse_expand(expand, DetailResponseModel, projection)
+        if sort:
+            after = decode_cursor(cursor, *SORTED_BROWSE_CURSOR_TYPES)
+            if after is not None:
+                # Cursors only continue the ordering that issued them.
+                if after[:2] != [sort, order]:
+                    raise HTTPException(status_code=400, detail="Invalid pagination cursor.")
+                after = after[2:]
+        else:
+            after = decode_cursor(cursor, *BROWSE_CURSOR_TYPES)
 
-        
-        total_count = await repo.count_resources(resource_type=resource_type, filters=filter_dict)
-        items = await repo.get_all_resources(
-            resource_type=resource_type, limit=limit, offset=offset, filters=filter_dict,
+        page = await repo.get_all_resources(
+            resource_type=resource_type,
+            limit=limit,
+            offset=offset,
+            filters=filter_dict,
+            after=after,
+            sort=sort,
+            descending=order == "desc",
+            fields=projection,
+            encoded=not expansion,
         )
 
-        return {
-            "count": total_count,
+        next_key = page.next_key
+        if sort and next_key is not None:
+            next_key = [sort, order, *next_key]
+        if not projection and not expansion:
+            return encoded_page_response(
+                DetailResponseModel, page.count, limit, offset, encode_cursor(next_key), page.results
+            )
+        results = page.results
+        if expansion:
+            results = await expand_relations(results, expansion, repo)
+        content = {
+            "count": page.count,
             "limit": limit,
             "offset": offset,
-            "results": items,
+            "next_cursor": encode_cursor(next_key),
+            "results": results,
         }
+        if projection:
+            ItemModel = projected_model(DetailResponseModel, projection)
+            return sparse_response(PaginatedResponse[ItemModel], content)
+        return content
 
     @router.get(
         "/{resource_id}",
@@ -70,12 +142,20 @@ def resource_router_factory(
     async def get_single_resource(
         resource_id: int,
         repo: ResourceRepository = Depends(get_resource_repository),
+        fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+        expand: Optional[str] = Query(None, description=expand_description),
     ):
         """
-        Retrieves a single resource by its unique SWAPI ID for this type.
+        Retrieves a single resource by its unique SWAPI ID for this type,
+        sent as pre-encoded by the ETL unless it is projected or expanded.
         """
+        projection = parse_fields(fields, DetailResponseModel.model_fields)
+        expansion = parse_expand(expand, DetailResponseModel, projection)
         item = await repo.get_resource_by_id(
-            resource_type=resource_type, resource_id=resource_id
+            resource_type=resource_type,
+            resource_id=resource_id,
+            fields=projection,
+            encoded=not expansion,
         )
 
         if item is None:
@@ -83,6 +163,12 @@ def resource_router_factory(
                 status_code=404,
                 detail=f"{resource_type.capitalize()} with ID {resource_id} not found",
             )
+        if not projection and not expansion:
+            return encoded_response(DetailResponseModel, item)
+        if expansion:
+            item = (await expand_relations([item], expansion, repo))[0]
+        if projection:
+            return sparse_response(projected_model(DetailResponseModel, projection), item)
         return item
 
     return router
\ No newline at end of file
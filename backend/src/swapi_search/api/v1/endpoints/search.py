@@ -1,13 +1,52 @@
+import logging
 from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from swapi_search.api.v1.dependencies import get_search_engine
-from swapi_search.api.v1.schemas import PaginatedSearchResponse
-from swapi_search.search.base import BaseSearchEngine
+from swapi_search.api.v1.fieldsets import parse_fields
+from swapi_search.api.v1.pagination import SEARCH_CURSOR_TYPES, decode_cursor, encode_cursor
+from swapi_search.api.v1.registry import RESOURCE_CONFIG, ResourceType
+from swapi_search.api.v1.schemas import (
+    BatchSearchItem,
+    BatchSearchRequest,
+    BatchSearchResponse,
+    PaginatedSearchResponse,
+)
+from swapi_search.search.base import (
+    BaseSearchEngine,
+    SearchMode,
+    SearchPage,
+    UnsupportedSearchModeError,
+)
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Search"])
 
+# Fields a search may be projected to: those of any resource type's response.
+SEARCH_RESULT_FIELDS = frozenset(
+    ["type"]
+    + [field for config in RESOURCE_CONFIG.values() for field in config["response_model"].model_fields]
+)
+
+
+def _to_response(page: SearchPage, limit: int, offset: int) -> PaginatedSearchResponse:
+    """Builds the public response for a page returned by a search engine."""
+    return PaginatedSearchResponse(
+        count=page.count,
+        count_is_exact=page.count_is_exact,
+        limit=limit,
+        offset=offset,
+        next_cursor=encode_cursor(page.next_key),
+        mode=page.mode.value if page.mode else None,
+        facets=(
+            {t.value: page.facets.get(t.value, 0) for t in ResourceType}
+            if page.facets is not None else None
+        ),
+        results=page.results
+    )
+
 
 @router.get(
     "/search",
@@ -30,17 +69,80 @@ async def search_resources(
     ),
     limit: int = Query(10, ge=1, le=100, description="Number of results to return per page."),
     offset: int = Query(0, ge=0, description="Offset for pagination."),
+    mode: Optional[SearchMode] = Query(
+        None,
+        description="Matching strategy: 'substring' (partial match), 'fulltext' "
+                    "(ranked word match with prefix type-ahead) or 'fuzzy' (typo-tolerant). "
+                    "Defaults to the engine's mode.",
+    ),
+    cursor: Optional[str] = Query(
+        None,
+        description="Opaque cursor from a previous page's 'next_cursor'. "
+                    "When provided, 'offset' is ignored.",
+    ),
+    facets: bool = Query(
+        False,
+        description="Also return the number of matches per resource type (ignoring 'type'), "
+                    "computed in the same round trip.",
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated top-level fields to return for each result "
+                    "(e.g. 'name,type,url'). Defaults to the whole resource.",
+    ),
 ):
     """
     Search endpoint that leverages the search engine abstraction.
     """
-    results = await search_engine.search(
-        query=q, resource_type=type, limit=limit, offset=offset
-    )
-    
-    return PaginatedSearchResponse(
-        count=len(results), 
-        limit=limit,
-        offset=offset,
-        results=results
-    )
\ No newline at end of file
+    after = decode_cursor(cursor, *SEARCH_CURSOR_TYPES)
+    projection = parse_fields(fields, SEARCH_RESULT_FIELDS)
+    try:
+        page = await search_engine.search(
+            query=q, resource_type=type, limit=limit, offset=offset, mode=mode, after=after,
+            facets=facets, fields=projection,
+        )
+    except UnsupportedSearchModeError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return _to_response(page, limit, offset)
+
+
+@router.post(
+    "/search/batch",
+    response_model=BatchSearchResponse,
+    summary="Run Many Searches in One Request",
+    description="Runs up to 50 searches in a single request and returns their pages in order. "
+                "A failing search is reported in its own entry and does not fail the batch.",
+)
+async def search_batch(
+    search_engine: Annotated[BaseSearchEngine, Depends(get_search_engine)],
+    batch: BatchSearchRequest,
+):
+    """
+    Batch search endpoint. All searches share the request's search engine
+    (and so its database session), with bounded concurrency.
+    """
+    requests = [
+        {
+            "query": item.q,
+            "resource_type": item.type,
+            "limit": item.limit,
+            "offset": item.offset,
+            "mode": SearchMode(item.mode) if item.mode else None,
+        }
+        for item in batch.queries
+    ]
+    outcomes = await search_engine.search_many(requests)
+
+    results = []
+    for item, outcome in zip(batch.queries, outcomes):
+        if isinstance(outcome, SearchPage):
+            results.append(BatchSearchItem(
+                status=200, result=_to_response(outcome, item.limit, item.offset)
+            ))
+        elif isinstance(outcome, UnsupportedSearchModeError):
+            results.append(BatchSearchItem(status=400, error=str(outcome)))
+        else:
+            logger.error(f"Batch search for '{item.q}' failed: {outcome}")
+            results.append(BatchSearchItem(status=500, error="Search failed."))
+    return BatchSearchResponse(results=results)
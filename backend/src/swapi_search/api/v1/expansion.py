@@ -0,0 +1,119 @@
+import re
+import typing
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+from swapi_search.api.v1.encoded import decode_item
+from swapi_search.api.v1.registry import RESOURCE_CONFIG, ResourceType
+from swapi_search.repositories.resource import ResourceRepository
+
+# The (type, swapi_id) a relation URL points to, for both SWAPI's URLs and ours.
+_RELATION_URL = re.compile(
+    rf"/({'|'.join(t.value for t in ResourceType)})/(\d+)/?$"
+)
+
+
+@lru_cache(maxsize=None)
+def relation_fields(model: type[BaseModel]) -> List[str]:
+    """
+    The fields of a response model holding related resources, i.e. a
+    relation model or a list of them, which `expand` accepts.
+    """
+    names = []
+    for name, info in model.model_fields.items():
+        annotation = info.annotation
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        inner = args[0] if args else annotation
+        inner_args = typing.get_args(inner)
+        if inner_args:
+            inner = inner_args[0]
+        if isinstance(inner, type) and issubclass(inner, BaseModel) and "url" in inner.model_fields:
+            names.append(name)
+    return names
+
+
+def parse_expand(
+    expand: Optional[str], model: type[BaseModel], fields: Optional[Sequence[str]] = None
+) -> Optional[List[str]]:
+    """
+    Parses a comma-separated `expand` parameter into the relation fields to
+    expand. Returns None when nothing is to be expanded.
+
+    Raises:
+        HTTPException: 400 if a field is not a relation of the model, or is
+            left out by the `fields` projection.
+    """
+    if expand is None:
+        return None
+    requested = list(dict.fromkeys(f.strip() for f in expand.split(",") if f.strip()))
+    allowed = relation_fields(model)
+    unknown = [f for f in requested if f not in allowed]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Cannot expand {', '.join(unknown)}; expandable fields: {', '.join(allowed)}.",
+        )
+    if fields is not None:
+        missing = [f for f in requested if f not in fields]
+        if missing:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Expanded fields must be included in 'fields': {', '.join(missing)}.",
+            )
+    return requested or None
+
+
+def _relation_key(relation: Any) -> Optional[Tuple[str, int]]:
+    if not isinstance(relation, dict) or not isinstance(relation.get("url"), str):
+        return None
+    match = _RELATION_URL.search(relation["url"])
+    return (match.group(1), int(match.group(2))) if match else None
+
+
+def _relations(value: Any) -> List[Any]:
+    return value if isinstance(value, list) else [value]
+
+
+async def expand_relations(
+    items: List[Dict[str, Any]], expand: Sequence[str], repo: ResourceRepository
+) -> List[Dict[str, Any]]:
+    """
+    Replaces the `{url, name}` relations in the `expand` fields of every item
+    with the related resources, fetched with a single batched query for the
+    whole page and shaped as their detail endpoints send them. Relations
+    that cannot be resolved are left as they are.
+
+    Items are copied rather than modified, as they may be shared.
+    """
+    keys = {
+        key
+        for item in items
+        for field in expand
+        for relation in _relations(item.get(field))
+        if (key := _relation_key(relation)) is not None
+    }
+    if not keys:
+        return items
+    related = {
+        key: decode_item(RESOURCE_CONFIG[key[0]]["response_model"], resource)
+        for key, resource in (await repo.get_resources_by_keys(keys, encoded=True)).items()
+    }
+
+    def resolve(relation: Any) -> Any:
+        resource = related.get(_relation_key(relation))
+        return {**relation, **resource} if resource is not None else relation
+
+    expanded = []
+    for item in items:
+        item = dict(item)
+        for field in expand:
+            value = item.get(field)
+            if isinstance(value, list):
+                item[field] = [resolve(relation) for relation in value]
+            elif value is not None:
+                item[field] = resolve(value)
+        expanded.append(item)
+    return expanded
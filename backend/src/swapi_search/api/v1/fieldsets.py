@@ -0,0 +1,57 @@
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional, Tuple
+
+from fastapi import HTTPException, Response
+from pydantic import BaseModel, create_model
+
+FIELDS_DESCRIPTION = (
+    "Comma-separated top-level fields to return (e.g. 'title,url' for films). "
+    "Defaults to every field."
+)
+
+
+def parse_fields(fields: Optional[str], allowed: Iterable[str]) -> Optional[List[str]]:
+    """
+    Parses a comma-separated `fields` parameter into the list of top-level
+    fields to return, in request order and without duplicates. Returns None
+    when no projection was requested.
+
+    Raises:
+        HTTPException: 400 if a field is not one of `allowed`.
+    """
+    if fields is None:
+        return None
+    requested = list(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    if not requested:
+        raise HTTPException(status_code=400, detail="'fields' must name at least one field.")
+    unknown = [f for f in requested if f not in set(allowed)]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown field(s): {', '.join(unknown)}.")
+    return requested
+
+
+@lru_cache(maxsize=256)
+def _projected_model(model: type[BaseModel], fields: Tuple[str, ...]) -> type[BaseModel]:
+    definitions = {
+        name: (info.annotation, info)
+        for name, info in model.model_fields.items()
+        if name in fields
+    }
+    return create_model(f"{model.__name__}Fields", **definitions)
+
+
+def projected_model(model: type[BaseModel], fields: Iterable[str]) -> type[BaseModel]:
+    """
+    A copy of a response model with only the given fields, so a sparse
+    response is validated and serialized field by field like a full one,
+    at a cost proportional to what was requested.
+    """
+    return _projected_model(model, tuple(sorted(fields)))
+
+
+def sparse_response(model: type[BaseModel], content: Any) -> Response:
+    """
+    Validates and serializes a projected response with a model reduced to the
+    projected fields, bypassing the route's full response_model.
+    """
+    return Response(model.model_validate(content).model_dump_json(), media_type="application/json")
@@ -0,0 +1,125 @@
+import re
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Callable, Dict, Optional, Pattern
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+def _matching_etag(if_none_match: str, etag: str) -> Optional[str]:
+    """
+    The entity tag of an If-None-Match header that matches `etag` or one of
+    its content-coding variants (`"<tag>-gzip"`), compared weakly as RFC
+    9110 requires, or None.
+    """
+    if if_none_match.strip() == "*":
+        return etag
+    variant_prefix = etag[:-1] + "-"
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip().removeprefix("W/")
+        if candidate == etag or (candidate.startswith(variant_prefix) and candidate.endswith('"')):
+            return candidate
+    return None
+
+
+def _not_modified_since(if_modified_since: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    # HTTP dates have a resolution of one second.
+    return last_modified.replace(microsecond=0) <= since
+
+
+class DatasetCacheMiddleware:
+    """
+    Adds HTTP validators and caching headers to read-only API responses,
+    derived from the dataset version, and answers conditional requests for
+    an unchanged version with `304 Not Modified` before the route runs.
+
+    Responses of the matching GET routes only change when the ETL loads a
+    new dataset, so one strong ETag per version (and `revision`, which
+    should change with anything else that alters responses, such as a
+    deploy) identifies them all; compressed variants get the tag suffixed
+    with their content coding, as their bytes differ. Last-Modified is the
+    version's load time. Requests are passed through untouched until the
+    version is known, and only successful responses get the headers.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        path_pattern: Pattern[str],
+        version_provider: Callable[[], Optional[int]],
+        loaded_at_provider: Callable[[], Optional[datetime]] = lambda: None,
+        max_age: int = 60,
+        revision: str = "",
+    ):
+        self.app = app
+        self.path_pattern = path_pattern
+        self.version_provider = version_provider
+        self.loaded_at_provider = loaded_at_provider
+        self.max_age = max_age
+        self.revision = re.sub(r"[^\w.-]", "", revision)
+
+    def _validators(self, version: int, loaded_at: Optional[datetime]) -> Dict[str, str]:
+        headers = {
+            "ETag": f'"{self.revision}-{version}"' if self.revision else f'"{version}"',
+            "Cache-Control": f"public, max-age={self.max_age}",
+        }
+        if loaded_at is not None:
+            headers["Last-Modified"] = format_datetime(loaded_at, usegmt=True)
+        return headers
+
+    @staticmethod
+    def _fresh_etag(request_headers: Headers, etag: str, loaded_at: Optional[datetime]) -> Optional[str]:
+        """
+        Evaluates the request's preconditions, returning the entity tag the
+        client holds when its copy is still fresh. If-Modified-Since only
+        counts without If-None-Match.
+        """
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match is not None:
+            return _matching_etag(if_none_match, etag)
+        if_modified_since = request_headers.get("if-modified-since")
+        if if_modified_since is not None and loaded_at is not None:
+            return etag if _not_modified_since(if_modified_since, loaded_at) else None
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in ("GET", "HEAD")
+            or not self.path_pattern.fullmatch(scope["path"])
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        version = self.version_provider()
+        if version is None:
+            await self.app(scope, receive, send)
+            return
+        loaded_at = self.loaded_at_provider()
+        validators = self._validators(version, loaded_at)
+
+        fresh_etag = self._fresh_etag(Headers(scope=scope), validators["ETag"], loaded_at)
+        if fresh_etag is not None:
+            headers = {**validators, "ETag": fresh_etag}
+            await Response(status_code=304, headers=headers)(scope, receive, send)
+            return
+
+        async def send_with_validators(message: Message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                headers = MutableHeaders(scope=message)
+                for name, value in validators.items():
+                    headers[name] = value
+                encoding = headers.get("content-encoding")
+                if encoding:
+                    headers["ETag"] = f'{validators["ETag"][:-1]}-{encoding}"'
+            await send(message)
+
+        await self.app(scope, receive, send_with_validators)
@@ -0,0 +1,54 @@
+import base64
+import binascii
+import json
+from numbers import Real
+from typing import Any, List, Optional, Sequence
+
+from fastapi import HTTPException
+
+
+def encode_cursor(key: Optional[Sequence[Any]]) -> Optional[str]:
+    """
+    Encodes the sort key of the last row of a page into an opaque,
+    URL-safe cursor string. Returns None when there is no next page.
+    """
+    if key is None:
+        return None
+    payload = json.dumps(list(key), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], *types: type) -> Optional[List[Any]]:
+    """
+    Decodes a cursor produced by `encode_cursor` and checks that it holds one
+    value per expected type, e.g. `decode_cursor(c, Real, int)` for a
+    (relevance, id) key.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed.
+    """
+    if cursor is None:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor.")
+
+    if (
+        not isinstance(key, list)
+        or len(key) != len(types)
+        or not all(
+            isinstance(value, expected) and not isinstance(value, bool)
+            for value, expected in zip(key, types)
+        )
+    ):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor.")
+    return key
+
+
+# Sort key shapes for the cursors issued by each endpoint.
+BROWSE_CURSOR_TYPES = (int,)  # (swapi_id,)
+# (sort field, order, value, swapi_id); the value is null for unknown values.
+SORTED_BROWSE_CURSOR_TYPES = (str, str, (Real, type(None)), int)
+SEARCH_CURSOR_TYPES = (Real, int)  # (relevance, id)
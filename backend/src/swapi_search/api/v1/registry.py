@@ -14,7 +14,9 @@ class ResourceType(str, Enum):
     vehicles = "vehicles"
 
 # A centralized configuration dictionary that maps each resource type
-# to its corresponding Pydantic models for responses and filtering.
+# to its corresponding Pydantic models for responses and filtering, and the
+# numeric fields its browse endpoint can sort by (see NUMERIC_FIELDS in
+# db/models.py), which its filters model also exposes as min_*/max_* ranges.
 #
 # This registry is the single source of truth for configuring the
 # browsable RESTful endpoints in the application. To add a new
@@ -27,10 +29,12 @@ RESOURCE_CONFIG = {
     ResourceType.people: {
         "response_model": schemas.PersonResponse,
         "filters_model": schemas.PersonFilters,
+        "sort_fields": ("height", "mass"),
     },
     ResourceType.planets: {
         "response_model": schemas.PlanetResponse,
         "filters_model": schemas.PlanetFilters,
+        "sort_fields": ("population", "diameter"),
     },
     ResourceType.species: {
         "response_model": schemas.SpeciesResponse,
@@ -39,9 +43,11 @@ RESOURCE_CONFIG = {
     ResourceType.starships: {
         "response_model": schemas.StarshipResponse,
         "filters_model": schemas.StarshipFilters,
+        "sort_fields": ("cost_in_credits", "length"),
     },
     ResourceType.vehicles: {
         "response_model": schemas.VehicleResponse,
         "filters_model": schemas.VehicleFilters,
+        "sort_fields": ("cost_in_credits", "length"),
     },
 }
\ No newline at end of file
@@ -1,5 +1,5 @@
-from typing import Dict, List, Any, Optional, TypeVar, Generic
-from pydantic import BaseModel, Field
+from typing import Dict, List, Any, Literal, Optional, TypeVar, Generic
+from pydantic import BaseModel, ConfigDict, Field
 from pydantic.generics import GenericModel
 
 
@@ -31,10 +31,82 @@ class SearchResponse(BaseModel):
 
 class PaginatedSearchResponse(BaseModel):
     count: int = Field(description="Total number of items matching the query.")
+    count_is_exact: bool = Field(
+        True,
+        description="False when 'count' is a capped lower bound rather than an exact total.",
+    )
     limit: int = Field(description="The number of items per page.")
     offset: int = Field(description="The offset of the current page.")
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor for the next page, or null on the last page."
+    )
+    mode: Optional[str] = Field(
+        None,
+        description="The search mode that produced the results; 'fuzzy' when a substring "
+                    "search with too few hits fell back to typo-tolerant matching.",
+    )
+    facets: Optional[Dict[str, int]] = Field(
+        None,
+        description="Number of matches per resource type, ignoring the 'type' filter. "
+                    "Only present when requested with 'facets=true'.",
+    )
     results: List[Dict[str, Any]] = Field(description="The list of search results for the current page.")
 
+class BatchSearchQuery(BaseModel):
+    """A single search of a batch; mirrors the /search query parameters."""
+    q: str = Field(..., min_length=1, description="The search query term.")
+    type: Optional[Literal["films", "people", "planets", "species", "starships", "vehicles"]] = Field(
+        None, description="Filter results by resource type."
+    )
+    limit: int = Field(10, ge=1, le=100, description="Number of results to return.")
+    offset: int = Field(0, ge=0, description="Offset for pagination.")
+    mode: Optional[Literal["substring", "fulltext", "fuzzy"]] = Field(
+        None, description="Matching strategy; defaults to the engine's mode."
+    )
+
+class BatchSearchRequest(BaseModel):
+    queries: List[BatchSearchQuery] = Field(
+        ..., min_length=1, max_length=50, description="The searches to run, at most 50."
+    )
+
+class BatchSearchItem(BaseModel):
+    """The outcome of one search of a batch: either a result page or an error."""
+    status: int = Field(description="HTTP-style status of this search (200, 400 or 500).")
+    result: Optional[PaginatedSearchResponse] = Field(None, description="The page, on success.")
+    error: Optional[str] = Field(None, description="Why the search failed, on error.")
+
+class BatchSearchResponse(BaseModel):
+    results: List[BatchSearchItem] = Field(description="One entry per query, in request order.")
+
+class AutocompleteSuggestion(BaseModel):
+    name: str = Field(description="The name or title of the resource.")
+    type: str = Field(description="The type of the resource (e.g., 'people', 'films').")
+    url: str = Field(description="The API URL of the resource.")
+
+class AutocompleteResponse(BaseModel):
+    results: List[AutocompleteSuggestion] = Field(description="Matching suggestions, best first.")
+
+class ResourceKey(BaseModel):
+    type: Literal["films", "people", "planets", "species", "starships", "vehicles"] = Field(
+        ..., description="The type of the resource."
+    )
+    id: int = Field(..., ge=1, description="The resource's SWAPI ID.")
+
+class ResourceLookupRequest(BaseModel):
+    items: List[ResourceKey] = Field(
+        ..., min_length=1, max_length=500, description="The resources to fetch, at most 500."
+    )
+
+class ResourceLookupItem(BaseModel):
+    """One requested resource: its data, or `found: false` if it does not exist."""
+    type: str = Field(description="The requested resource type.")
+    id: int = Field(description="The requested SWAPI ID.")
+    found: bool = Field(description="Whether the resource exists.")
+    data: Optional[Dict[str, Any]] = Field(None, description="The resource, when found.")
+
+class ResourceLookupResponse(BaseModel):
+    results: List[ResourceLookupItem] = Field(description="One entry per requested item, in request order.")
+
 DataType = TypeVar('DataType')
 
 class PaginatedResponse(GenericModel, Generic[DataType]):
@@ -44,6 +116,9 @@ class PaginatedResponse(GenericModel, Generic[DataType]):
     count: int = Field(description="Total number of items available for the query.")
     limit: int = Field(description="The number of items requested per page.")
     offset: int = Field(description="The starting offset for the returned items.")
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor for the next page, or null on the last page."
+    )
     results: List[DataType] = Field(description="The list of items for the current page.")
 
 
@@ -52,27 +127,31 @@ class PaginatedResponse(GenericModel, Generic[DataType]):
 # These models define the public contract for our browse endpoints. They are
 # intentionally kept separate from the ETL data models.
 
-class FilmRelation(BaseModel):
+class _Relation(BaseModel):
+    # An expanded relation (`?expand=`) carries the full related resource.
+    model_config = ConfigDict(extra="allow")
+
+class FilmRelation(_Relation):
     url: str
     title: Optional[str] = None 
 
-class PersonRelation(BaseModel):
+class PersonRelation(_Relation):
     url: str
     name: Optional[str] = None 
 
-class PlanetRelation(BaseModel):
+class PlanetRelation(_Relation):
     url: str
     name: Optional[str] = None 
 
-class SpeciesRelation(BaseModel):
+class SpeciesRelation(_Relation):
     url: str
     name: Optional[str] = None 
 
-class StarshipRelation(BaseModel):
+class StarshipRelation(_Relation):
     url: str
     name: Optional[str] = None 
 
-class VehicleRelation(BaseModel):
+class VehicleRelation(_Relation):
     url: str
     name: Optional[str] = None 
 
@@ -199,12 +278,20 @@ class PersonFilters(BaseModel):
     name: Optional[str] = Field(None, description="Filter by person's name (case-insensitive, partial match).")
     gender: Optional[str] = Field(None, description="Filter by gender (e.g., 'male', 'female').")
     homeworld: Optional[str] = Field(None, description="Filter by the name of the person's homeworld.")
+    min_height: Optional[float] = Field(None, description="Only include results with a height (cm) at least this value.")
+    max_height: Optional[float] = Field(None, description="Only include results with a height (cm) at most this value.")
+    min_mass: Optional[float] = Field(None, description="Only include results with a mass (kg) at least this value.")
+    max_mass: Optional[float] = Field(None, description="Only include results with a mass (kg) at most this value.")
 
 class PlanetFilters(BaseModel):
     """Filter parameters for the /planets endpoint."""
     name: Optional[str] = Field(None, description="Filter by planet's name (case-insensitive, partial match).")
     climate: Optional[str] = Field(None, description="Filter by climate type (e.g., 'arid', 'temperate').")
     terrain: Optional[str] = Field(None, description="Filter by terrain type (e.g., 'desert', 'forest').")
+    min_population: Optional[float] = Field(None, description="Only include results with a population at least this value.")
+    max_population: Optional[float] = Field(None, description="Only include results with a population at most this value.")
+    min_diameter: Optional[float] = Field(None, description="Only include results with a diameter (km) at least this value.")
+    max_diameter: Optional[float] = Field(None, description="Only include results with a diameter (km) at most this value.")
 
 class SpeciesFilters(BaseModel):
     """Filter parameters for the /species endpoint."""
@@ -217,9 +304,17 @@ class StarshipFilters(BaseModel):
     name: Optional[str] = Field(None, description="Filter by starship's name (case-insensitive, partial match).")
     manufacturer: Optional[str] = Field(None, description="Filter by manufacturer.")
     starship_class: Optional[str] = Field(None, description="Filter by starship class (e.g., 'Starfighter').")
+    min_cost_in_credits: Optional[float] = Field(None, description="Only include results with a cost in credits at least this value.")
+    max_cost_in_credits: Optional[float] = Field(None, description="Only include results with a cost in credits at most this value.")
+    min_length: Optional[float] = Field(None, description="Only include results with a length (m) at least this value.")
+    max_length: Optional[float] = Field(None, description="Only include results with a length (m) at most this value.")
 
 class VehicleFilters(BaseModel):
     """Filter parameters for the /vehicles endpoint."""
     name: Optional[str] = Field(None, description="Filter by vehicle's name (case-insensitive, partial match).")
     manufacturer: Optional[str] = Field(None, description="Filter by manufacturer.")
     vehicle_class: Optional[str] = Field(None, description="Filter by vehicle class (e.g., 'wheeled').")
+    min_cost_in_credits: Optional[float] = Field(None, description="Only include results with a cost in credits at least this value.")
+    max_cost_in_credits: Optional[float] = Field(None, description="Only include results with a cost in credits at most this value.")
+    min_length: Optional[float] = Field(None, description="Only include results with a length (m) at least this value.")
+    max_length: Optional[float] = Field(None, description="Only include results with a length (m) at most this value.")
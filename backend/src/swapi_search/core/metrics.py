@@ -0,0 +1,52 @@
+import bisect
+from typing import Any, Dict, Optional, Sequence
+
+# Upper bounds, in milliseconds, of the latency histogram buckets.
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class LatencyHistogram:
+    """
+    A fixed-bucket latency histogram. Percentiles are reported as the upper
+    bound of the bucket they fall in, which is precise enough to compare
+    latencies without keeping every sample.
+    """
+
+    def __init__(self, buckets_ms: Sequence[float] = LATENCY_BUCKETS_MS):
+        self.buckets_ms = tuple(buckets_ms)
+        # The last slot counts samples above the largest bucket.
+        self.counts = [0] * (len(self.buckets_ms) + 1)
+        self.total = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, elapsed_ms: float):
+        self.counts[bisect.bisect_left(self.buckets_ms, elapsed_ms)] += 1
+        self.total += 1
+        self.sum_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Returns the bucket bound below which `fraction` of samples fall."""
+        if not self.total:
+            return None
+        rank, seen = fraction * self.total, 0
+        for bound, count in zip(self.buckets_ms, self.counts):
+            seen += count
+            if seen >= rank:
+                return float(bound)
+        return self.max_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.total,
+            "mean_ms": self.sum_ms / self.total if self.total else None,
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": self.max_ms,
+            "buckets": {
+                **{f"le_{bound}": count for bound, count in zip(self.buckets_ms, self.counts)},
+                "le_inf": self.counts[-1],
+            },
+        }
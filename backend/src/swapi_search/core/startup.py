@@ -0,0 +1,98 @@
+import hashlib
+import json
+import logging
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from fastapi import FastAPI
+
+from swapi_search.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PACKAGE_DIR = Path(__file__).resolve().parents[1]
+
+
+@lru_cache(maxsize=None)
+def source_digest() -> str:
+    """
+    A short hash of the swapi_search package's source files, which changes
+    with any code change. Computed once per process (a few milliseconds).
+    """
+    digest = hashlib.sha256()
+    for path in sorted(PACKAGE_DIR.rglob("*.py")):
+        digest.update(path.relative_to(PACKAGE_DIR).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def build_revision() -> str:
+    """
+    Identifies the deployed code: BUILD_ID when the build or deploy sets it,
+    otherwise the source digest, so it changes whenever responses may.
+    """
+    return settings.BUILD_ID or source_digest()
+
+
+def schema_revision_path(path: str) -> Path:
+    """The file next to a prebuilt schema recording the source digest it was built from."""
+    return Path(f"{path}.revision")
+
+
+def prebuilt_openapi(app: FastAPI, path: str) -> Callable[[], Dict[str, Any]]:
+    """
+    Returns an `app.openapi` replacement serving the schema written to `path`
+    by scripts/build_openapi.py, which spares a cold process from generating
+    it from every route's models on the first schema request.
+
+    The file is read on first use, and only served if the source digest
+    recorded next to it matches the running code's. A missing or unreadable
+    file, or one built from other code (such as source mounted over the
+    image's in development), is logged and the schema is generated instead.
+    """
+    generate = app.openapi
+
+    def openapi() -> Dict[str, Any]:
+        if app.openapi_schema is None:
+            try:
+                revision = schema_revision_path(path).read_text(encoding="utf-8").strip()
+                schema = json.loads(Path(path).read_text(encoding="utf-8"))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Prebuilt OpenAPI schema {path} not usable, generating it: {e}")
+                return generate()
+            if revision != source_digest():
+                logger.warning(
+                    f"Prebuilt OpenAPI schema {path} was built from other code, generating it."
+                )
+                return generate()
+            app.openapi_schema = schema
+        return app.openapi_schema
+
+    return openapi
+
+
+async def warm_up(app: FastAPI, paths: List[str]):
+    """
+    Requests each path from the app in-process, through the full middleware
+    stack, so the lazy work of a first request (opening database
+    connections, compiling queries, filling the response caches) happens
+    during startup rather than on a user's request. On AWS Lambda that is
+    the init phase, which runs before the first invocation is routed to the
+    process. Failures are logged and never stop the startup.
+    """
+    # httpx is only imported by processes that warm up.
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://warmup") as client:
+        for path in paths:
+            started = time.perf_counter()
+            try:
+                response = await client.get(path)
+            except Exception as e:
+                logger.warning(f"Warm-up request GET {path} failed: {e}")
+                continue
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            logger.info(f"Warm-up request GET {path}: {response.status_code} in {elapsed_ms:.0f}ms")
@@ -0,0 +1,171 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import select
+
+from swapi_search.core.config import settings
+from swapi_search.db.models import NUMERIC_FIELDS, DatasetVersion, SwapiResource
+from swapi_search.db.session import AsyncSessionLocal, connect_unpooled
+
+logger = logging.getLogger(__name__)
+
+# The channel the ETL sends a NOTIFY on when it commits a new dataset version.
+DATASET_CHANNEL = "dataset_version"
+
+# A listener receives every swapi_resource row (ordered by id) as a list of
+# plain dictionaries and rebuilds whatever in-process structure it owns.
+DatasetListener = Callable[[List[Dict[str, Any]]], None]
+
+
+class DatasetWatcher:
+    """
+    Keeps in-process read models in sync with the loaded dataset.
+
+    It tracks the single-row `dataset_version` table, which the ETL bumps in
+    the same transaction as its bulk insert, by polling it and, optionally, by
+    listening for the NOTIFY the ETL sends on commit. When the version
+    changes, every row is loaded once and handed to all subscribed listeners,
+    which build their new structures off the event loop and swap them in
+    atomically. With no listeners only the version number is tracked, which
+    is enough for caches keyed by it.
+    """
+
+    def __init__(self, poll_interval: float, listen: bool = False):
+        self.poll_interval = poll_interval
+        self.listen = listen
+        self.version: Optional[int] = None
+        # When the ETL loaded `version`; None if it was loaded before the
+        # load time was recorded.
+        self.loaded_at: Optional[datetime] = None
+        self._listeners: List[DatasetListener] = []
+        self._tasks: List[asyncio.Task] = []
+        self._notified: Set[asyncio.Task] = set()
+        self._lock = asyncio.Lock()
+
+    @property
+    def has_listeners(self) -> bool:
+        return bool(self._listeners)
+
+    def subscribe(self, listener: DatasetListener):
+        """Registers a listener to be called with the rows of each new dataset."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    async def _load_snapshot(
+        self,
+    ) -> Tuple[int, Optional[datetime], Optional[List[Dict[str, Any]]]]:
+        """
+        Reads the dataset version, its load time and, if the version changed,
+        all rows inside a single REPEATABLE READ transaction so they all come
+        from the same snapshot.
+        """
+        async with AsyncSessionLocal() as session:
+            await session.connection(
+                execution_options={"isolation_level": "REPEATABLE READ"}
+            )
+            version_stmt = select(DatasetVersion.version, DatasetVersion.loaded_at).where(
+                DatasetVersion.id == 1
+            )
+            row = (await session.execute(version_stmt)).one_or_none()
+            version, loaded_at = row if row is not None else (0, None)
+            if version == self.version or not self._listeners:
+                return version, loaded_at, None
+
+            rows_stmt = select(
+                SwapiResource.id,
+                SwapiResource.swapi_id,
+                SwapiResource.type,
+                SwapiResource.name,
+                SwapiResource.data,
+                SwapiResource.data_json,
+                SwapiResource.searchable_text,
+                *(getattr(SwapiResource, field) for field in NUMERIC_FIELDS),
+            ).order_by(SwapiResource.id)
+            rows = (await session.execute(rows_stmt)).mappings().all()
+            return version, loaded_at, [dict(row) for row in rows]
+
+    async def refresh(self) -> bool:
+        """
+        Reloads all listeners if the dataset version has changed.
+
+        Returns:
+            True if a new dataset was loaded, False otherwise.
+        """
+        async with self._lock:
+            version, loaded_at, rows = await self._load_snapshot()
+            if version == self.version:
+                return False
+
+            if rows is not None:
+                logger.info(f"Loading dataset version {version} ({len(rows)} rows) into memory...")
+                for listener in self._listeners:
+                    await asyncio.to_thread(listener, rows)
+            self.version, self.loaded_at = version, loaded_at
+            logger.info(f"Dataset version {version} is now being served.")
+            return True
+
+    async def _safe_refresh(self):
+        try:
+            await self.refresh()
+        except Exception as e:
+            logger.error(f"Dataset refresh failed: {e}", exc_info=True)
+
+    async def _poll(self):
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            await self._safe_refresh()
+
+    def _on_notify(self, connection, pid, channel, payload):
+        task = asyncio.create_task(self._safe_refresh())
+        self._notified.add(task)
+        task.add_done_callback(self._notified.discard)
+
+    async def _listen(self):
+        """
+        Holds a dedicated connection, outside the request pool, that LISTENs
+        for the ETL's NOTIFY, reconnecting when it fails or is lost. Polling
+        keeps working meanwhile.
+        """
+        while True:
+            try:
+                connection = await connect_unpooled()
+                try:
+                    lost = asyncio.Event()
+                    connection.add_termination_listener(lambda _: lost.set())
+                    await connection.add_listener(DATASET_CHANNEL, self._on_notify)
+                    logger.info(f"Listening for dataset changes on '{DATASET_CHANNEL}'.")
+                    await lost.wait()
+                    logger.warning("Dataset change listener lost its connection, reconnecting.")
+                finally:
+                    await connection.close()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Dataset change listener failed: {e}")
+                await asyncio.sleep(self.poll_interval)
+
+    def start(self):
+        """Starts watching for new dataset versions in the background."""
+        if not self._tasks:
+            self._tasks.append(asyncio.create_task(self._poll()))
+            if self.listen:
+                self._tasks.append(asyncio.create_task(self._listen()))
+
+    async def stop(self):
+        """Stops all background tasks."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+
+dataset_watcher = DatasetWatcher(
+    poll_interval=settings.DATASET_POLL_INTERVAL_SECONDS,
+    listen=settings.DATASET_LISTEN_ENABLED,
+)
@@ -1,8 +1,82 @@
-from sqlalchemy import Column, Integer, String, Text, JSON, Index, UniqueConstraint
+from itertools import chain
+from typing import Sequence
+
+from sqlalchemy import (
+    BigInteger, Column, Computed, DateTime, Float, Integer, String, Text, Index, UniqueConstraint, cast, func, literal,
+)
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
 
+# The text search configuration used to build and query `search_vector`.
+# 'simple' skips stemming and stop words, which suits proper nouns and keeps
+# prefix matches for type-ahead predictable.
+SEARCH_TS_CONFIG = "simple"
+
+# The JSON paths behind the browse filters declared by the *Filters models in
+# api/v1/schemas.py. Each one's `->>` text has a trigram index, so partial,
+# case-insensitive matches on it do not scan every row of the type. Related
+# resources such as `homeworld` are stored as {"url", "name"} objects and are
+# filtered by name. `name` filters use the column of the same name.
+FILTER_PATHS = {
+    "director": ("director",),
+    "producer": ("producer",),
+    "gender": ("gender",),
+    "homeworld": ("homeworld", "name"),
+    "climate": ("climate",),
+    "terrain": ("terrain",),
+    "classification": ("classification",),
+    "language": ("language",),
+    "manufacturer": ("manufacturer",),
+    "starship_class": ("starship_class",),
+    "vehicle_class": ("vehicle_class",),
+}
+
+# Numeric attributes SWAPI serves as strings ("unknown", "1,000"). The ETL
+# parses them into typed columns so browse endpoints can sort and range
+# filter in the database; each has a (type, column, swapi_id) B-tree index.
+NUMERIC_FIELDS = ("population", "diameter", "cost_in_credits", "length", "height", "mass")
+
+
+def json_text(data, path):
+    """
+    The text at a JSON path of `data`, i.e. `data -> 'a' ->> 'b'`. Keys are
+    rendered into the SQL as literals rather than sent as parameters: an
+    expression index only serves queries with the same expression, and a
+    generic plan for `data ->> $1` cannot know that $1 is the indexed key.
+    """
+    keys = [literal(key, literal_execute=True) for key in path]
+    for key in keys[:-1]:
+        data = data[key]
+    return data[keys[-1]].astext
+
+
+def json_projection(data, fields: Sequence[str]):
+    """
+    `data` reduced to the given top-level keys, built in the database with
+    `jsonb_build_object('name', data -> 'name', ...)` so the other keys are
+    never sent to the client.
+    """
+    # Keys are cast explicitly: jsonb_build_object's arguments are untyped,
+    # so a bare bind parameter's type could not be inferred.
+    pairs = chain.from_iterable((cast(literal(field), Text), data[field]) for field in fields)
+    return func.jsonb_build_object(*pairs, type_=JSONB)
+
+
+def _trigram_index(name: str, expression) -> Index:
+    label = f"{name}_text"
+    return Index(
+        f"ix_swapi_resource_{name}_trgm",
+        expression.label(label),
+        postgresql_using="gin",
+        postgresql_ops={label: "gin_trgm_ops"},
+    )
+
+
+def _filter_indexes(data) -> list:
+    return [_trigram_index(field, json_text(data, path)) for field, path in FILTER_PATHS.items()]
+
 class SwapiResource(Base):
     """
     Represents a normalized resource from SWAPI, stored in a unified table.
@@ -14,8 +88,30 @@ class SwapiResource(Base):
     swapi_id = Column(Integer, nullable=False)
     type = Column(String(50), nullable=False, index=True)
     name = Column(String(255), nullable=False)
-    data = Column(JSON, nullable=False)
+    data = Column(JSONB, nullable=False)
+    # The resource as its browse response model serializes it, validated and
+    # encoded once by the ETL so endpoints can send it without re-encoding.
+    # NULL for rows loaded before the column existed.
+    data_json = Column(Text)
     searchable_text = Column(Text, nullable=False)
+    # Parsed numeric attributes; NULL when unknown or not applicable to the type.
+    population = Column(BigInteger)
+    diameter = Column(Float)
+    cost_in_credits = Column(BigInteger)
+    length = Column(Float)
+    height = Column(Float)
+    mass = Column(Float)
+    # A weighted full-text vector maintained by PostgreSQL: the resource's own
+    # name at weight A, and the rest of the searchable text (model, director,
+    # related resource names, ...) at weight C.
+    search_vector = Column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_TS_CONFIG}', coalesce(name, '')), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_TS_CONFIG}', coalesce(searchable_text, '')), 'C')",
+            persisted=True,
+        ),
+    )
 
     __table_args__ = (
         Index(
@@ -24,7 +120,33 @@ class SwapiResource(Base):
             postgresql_using="gin",
             postgresql_ops={"searchable_text": "gin_trgm_ops"},
         ),
+        Index(
+            "ix_swapi_resource_search_vector_gin",
+            search_vector,
+            postgresql_using="gin",
+        ),
+        _trigram_index("name", name),
+        *_filter_indexes(data),
+        *(
+            Index(f"ix_swapi_resource_type_{field}", "type", field, "swapi_id")
+            for field in NUMERIC_FIELDS
+        ),
         # A unique index to quickly find a specific resource by its
         # original ID and type. Also prevents duplicate data entries.
         UniqueConstraint('type', 'swapi_id', name='uq_swapi_resource_type_swapi_id'),
-    )
\ No newline at end of file
+    )
+
+
+class DatasetVersion(Base):
+    """
+    A single-row table holding a monotonically increasing version number for
+    the loaded dataset and when it was loaded. The ETL bumps it in the same
+    transaction as the bulk insert, so API processes can detect a new load
+    with one cheap query.
+    """
+    __tablename__ = "dataset_version"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    # NULL until the first load after the column was added.
+    loaded_at = Column(DateTime(timezone=True))
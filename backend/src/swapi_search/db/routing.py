@@ -0,0 +1,250 @@
+import asyncio
+import itertools
+import logging
+import re
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from sqlalchemy import event, exc, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+from swapi_search.core.config import settings
+from swapi_search.db.dataset import dataset_watcher
+from swapi_search.db.models import DatasetVersion
+from swapi_search.db.session import (
+    PoolMetrics, _count_invalidations, async_database_url, engine_options, get_async_engine,
+)
+
+logger = logging.getLogger(__name__)
+
+# Errors meaning a replica could not be reached, as opposed to a bad query.
+CONNECTION_ERRORS = (OSError, asyncio.TimeoutError, exc.DBAPIError, exc.TimeoutError)
+
+
+class Replica:
+    """A read replica, its lazily created engine and what is known of its health."""
+
+    def __init__(self, url: str, on_connection_error: Callable[["Replica", BaseException], None]):
+        self.url = async_database_url(url)
+        self.metrics = PoolMetrics()
+        self._on_connection_error = on_connection_error
+        self._engine: Optional[AsyncEngine] = None
+        # The dataset version the replica had replayed at its last check;
+        # None until it has been checked.
+        self.version: Optional[int] = None
+        self.ejected_until = 0.0
+        self.ejections = 0
+        self.last_error: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        """The replica's URL without credentials, for logs and metrics."""
+        return re.sub(r"//[^@/]*@", "//", self.url)
+
+    @property
+    def engine(self) -> AsyncEngine:
+        if self._engine is None:
+            self._engine = create_async_engine(
+                self.url, **engine_options(async_=True, metrics=self.metrics)
+            )
+            _count_invalidations(self._engine.pool, self.metrics)
+
+            # Failures to connect, and lost connections, say nothing about
+            # the query and everything about the replica. The driver's
+            # connect errors are not wrapped, so they are caught at connect.
+            @event.listens_for(self._engine.sync_engine, "do_connect")
+            def connect_or_eject(dialect, connection_record, cargs, cparams):
+                try:
+                    return dialect.connect(*cargs, **cparams)
+                except Exception as e:
+                    self._on_connection_error(self, e)
+                    raise
+
+            @event.listens_for(self._engine.sync_engine, "handle_error")
+            def eject_when_disconnected(context):
+                if context.is_disconnect:
+                    self._on_connection_error(self, context.original_exception)
+
+        return self._engine
+
+    async def dispose(self):
+        if self._engine is not None:
+            await self._engine.dispose()
+
+
+class _RoutingSession(Session):
+    """
+    A session bound to the engine its router picks when it first needs a
+    connection, and to that engine for the rest of its life. Sessions that
+    never query never pick one, so they cost nothing.
+    """
+
+    def __init__(self, router: "ReplicaRouter", **options):
+        super().__init__(**options)
+        self._router = router
+        self._engine: Optional[Engine] = None
+
+    def get_bind(self, mapper=None, clause=None, **kw) -> Engine:
+        if self._engine is None:
+            self._engine = self._router.choose_engine().sync_engine
+        return self._engine
+
+
+class ReplicaRouter:
+    """
+    Routes read-only sessions to read replicas, falling back to the primary.
+
+    A replica only serves reads once a health check has seen it replay the
+    dataset version this process serves (`version_provider`), so a lagging
+    replica never answers with an older dataset than the version-keyed HTTP
+    and result caches assume; right after an ETL load, reads go to the
+    primary until replicas catch up. Among eligible replicas one is picked
+    round-robin or, with "least_loaded", the one with the fewest connections
+    in use by this process. A replica that cannot be connected to, drops a
+    connection or fails its check is ejected for `eject_seconds`, so later
+    sessions go to the others (queries already running on it fail). With no
+    replicas configured, every session is a primary session.
+    """
+
+    def __init__(
+        self,
+        urls: List[str],
+        strategy: str = "round_robin",
+        eject_seconds: float = 30.0,
+        health_interval: float = 10.0,
+        version_provider: Callable[[], Optional[int]] = lambda: None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.replicas = [Replica(url, on_connection_error=self.eject) for url in urls]
+        self.strategy = strategy
+        self.eject_seconds = eject_seconds
+        self.health_interval = health_interval
+        self.version_provider = version_provider
+        self._clock = clock
+        self._turn = itertools.count()
+        self._task: Optional[asyncio.Task] = None
+        self.replica_sessions = 0
+        self.primary_sessions = 0
+
+    def _eligible(self, replica: Replica) -> bool:
+        if replica.version is None or replica.ejected_until > self._clock():
+            return False
+        required = self.version_provider()
+        return required is None or replica.version >= required
+
+    def candidates(self) -> List[Replica]:
+        """Eligible replicas, in the order they should be tried."""
+        eligible = [replica for replica in self.replicas if self._eligible(replica)]
+        if not eligible:
+            return []
+        if self.strategy == "least_loaded":
+            return sorted(eligible, key=lambda replica: replica.metrics.in_use)
+        start = next(self._turn) % len(eligible)
+        return eligible[start:] + eligible[:start]
+
+    def eject(self, replica: Replica, error: BaseException):
+        replica.ejected_until = self._clock() + self.eject_seconds
+        replica.ejections += 1
+        replica.last_error = str(error)
+        logger.warning(
+            f"Read replica {replica.name} ejected for {self.eject_seconds:.0f}s: {error}"
+        )
+
+    def choose_engine(self) -> AsyncEngine:
+        """The engine of the next eligible replica, or the primary's if none is."""
+        candidates = self.candidates()
+        if not candidates:
+            self.primary_sessions += 1
+            return get_async_engine()
+        self.replica_sessions += 1
+        return candidates[0].engine
+
+    def session(self) -> AsyncSession:
+        """
+        A read-only session, bound to a replica or the primary when it first
+        queries.
+        """
+        return AsyncSession(
+            sync_session_class=_RoutingSession, router=self, expire_on_commit=False
+        )
+
+    async def check(self):
+        """Reads each replica's dataset version, ejecting those that fail."""
+        for replica in self.replicas:
+            try:
+                async with replica.engine.connect() as conn:
+                    stmt = select(DatasetVersion.version).where(DatasetVersion.id == 1)
+                    replica.version = (await conn.execute(stmt)).scalar_one_or_none() or 0
+            except CONNECTION_ERRORS as e:
+                replica.version = None
+                # Connection failures have already ejected it.
+                if replica.ejected_until <= self._clock():
+                    self.eject(replica, e)
+
+    async def _check_periodically(self):
+        while True:
+            await asyncio.sleep(self.health_interval)
+            try:
+                await self.check()
+            except Exception as e:
+                logger.error(f"Read replica health check failed: {e}", exc_info=True)
+
+    async def start(self):
+        """Checks the replicas once, then keeps checking them in the background."""
+        if self.replicas and self._task is None:
+            await self.check()
+            self._task = asyncio.create_task(self._check_periodically())
+
+    async def stop(self):
+        """Stops the health checks and closes the replicas' connections."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        for replica in self.replicas:
+            await replica.dispose()
+
+    def stats(self) -> Dict[str, Any]:
+        now = self._clock()
+        return {
+            "strategy": self.strategy,
+            "replica_sessions": self.replica_sessions,
+            "primary_sessions": self.primary_sessions,
+            "replicas": [
+                {
+                    "name": replica.name,
+                    "eligible": self._eligible(replica),
+                    "dataset_version": replica.version,
+                    "ejected_for_seconds": max(replica.ejected_until - now, 0.0),
+                    "ejections": replica.ejections,
+                    "last_error": replica.last_error,
+                    "pool": replica.metrics.snapshot(
+                        replica._engine.pool if replica._engine is not None else None
+                    ),
+                }
+                for replica in self.replicas
+            ],
+        }
+
+
+replica_router = ReplicaRouter(
+    urls=[url.strip() for url in settings.DB_REPLICA_URLS.split(",") if url.strip()],
+    strategy=settings.DB_REPLICA_STRATEGY,
+    eject_seconds=settings.DB_REPLICA_EJECT_SECONDS,
+    health_interval=settings.DB_REPLICA_HEALTH_INTERVAL_SECONDS,
+    version_provider=lambda: dataset_watcher.version,
+)
+
+
+async def get_read_db() -> AsyncIterator[AsyncSession]:
+    """
+    Dependency to get an async database session for read-only routes, on a
+    read replica when one is available.
+    """
+    async with replica_router.session() as session:
+        yield session
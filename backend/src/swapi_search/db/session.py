@@ -1,37 +1,229 @@
 import logging
-from sqlalchemy import create_engine
+import re
+import time
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, AsyncSession
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool, QueuePool
 from sqlalchemy import text
 
 from swapi_search.core.config import settings
+from swapi_search.core.metrics import LatencyHistogram
 
 logger = logging.getLogger(__name__)
 
-# The SWAPI ETL script is synchronous, so it needs a synchronous engine.
-sync_engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
-SyncSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
 
-async_engine = create_async_engine(settings.DATABASE_URL.replace("psycopg2", "asyncpg"))
-AsyncSessionLocal = sessionmaker(
-    bind=async_engine, class_=AsyncSession, expire_on_commit=False
-)
+class PoolMetrics:
+    """
+    Checkout measurements of one engine's connection pool: how long each
+    checkout waited for a connection (including opening one, which is every
+    checkout without pooling), how many connections are in use, and how
+    often checkouts timed out or stale connections were replaced.
+    """
+
+    def __init__(self):
+        self.checkout_wait = LatencyHistogram()
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.timeouts = 0
+        self.invalidations = 0
+
+    def snapshot(self, pool: Optional[Pool] = None) -> Dict[str, Any]:
+        metrics = {
+            "checkout_wait": self.checkout_wait.snapshot(),
+            "in_use": self.in_use,
+            "peak_in_use": self.peak_in_use,
+            "timeouts": self.timeouts,
+            "invalidations": self.invalidations,
+        }
+        if isinstance(pool, QueuePool):
+            metrics.update(
+                pool_size=pool.size(),
+                idle=pool.checkedin(),
+                # QueuePool counts overflow from -pool_size while the pool fills.
+                overflow=max(pool.overflow(), 0),
+                max_overflow=settings.DB_MAX_OVERFLOW,
+            )
+        return metrics
+
+
+def _instrumented(pool_class: type, metrics: PoolMetrics) -> type:
+    """
+    A subclass of a pool class that records checkouts in `metrics`. A class
+    rather than event listeners, because no pool event fires before a
+    checkout starts waiting; pools recreated by `dispose()` keep it, as
+    they keep their listeners.
+    """
+
+    class InstrumentedPool(pool_class):
+        def _do_get(self):
+            started = time.perf_counter()
+            try:
+                connection = super()._do_get()
+            except exc.TimeoutError:
+                metrics.timeouts += 1
+                raise
+            finally:
+                metrics.checkout_wait.record((time.perf_counter() - started) * 1000)
+            metrics.in_use += 1
+            metrics.peak_in_use = max(metrics.peak_in_use, metrics.in_use)
+            return connection
+
+        def _do_return_conn(self, record):
+            metrics.in_use -= 1
+            super()._do_return_conn(record)
+
+    InstrumentedPool.__name__ = f"Instrumented{pool_class.__name__}"
+    return InstrumentedPool
+
+
+def _count_invalidations(pool: Pool, metrics: PoolMetrics):
+    """Counts connections discarded as stale or broken, e.g. by a failed pre-ping."""
+
+    @event.listens_for(pool, "invalidate")
+    def count_invalidation(dbapi_connection, record, exception):
+        metrics.invalidations += 1
+
+
+def engine_options(async_: bool, metrics: PoolMetrics) -> Dict[str, Any]:
+    """
+    Engine arguments for the DB_POOL_MODE setting.
+
+    "queue" keeps up to DB_POOL_SIZE + DB_MAX_OVERFLOW connections open for
+    a long-lived server, pinging each on checkout and replacing those older
+    than DB_POOL_RECYCLE_SECONDS, so connections dropped by the database or
+    a firewall are never handed out. "null" opens a connection per checkout
+    and closes it on return, for processes that are frozen between requests
+    (AWS Lambda) and would otherwise hold stale connections, or that connect
+    through a pooling proxy such as RDS Proxy or PgBouncer.
+    """
+    base_pool = AsyncAdaptedQueuePool if async_ else QueuePool
+    if settings.DB_POOL_MODE == "null":
+        options: Dict[str, Any] = {"poolclass": _instrumented(NullPool, metrics)}
+    else:
+        options = {
+            "poolclass": _instrumented(base_pool, metrics),
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+            "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+            "pool_pre_ping": True,
+        }
+
+    if async_:
+        connect_args: Dict[str, Any] = {"timeout": settings.DB_CONNECT_TIMEOUT_SECONDS}
+        if not settings.DB_STATEMENT_CACHE_ENABLED:
+            # Transaction-pooling proxies cannot follow prepared statements
+            # across the server connections they multiplex.
+            connect_args["statement_cache_size"] = 0
+    else:
+        connect_args = {"connect_timeout": int(settings.DB_CONNECT_TIMEOUT_SECONDS)}
+    options["connect_args"] = connect_args
+    return options
 
-async def get_db() -> AsyncSession:
+
+# Engines are created on first use, so a process only builds the ones it
+# needs: the API never creates the ETL's synchronous engine.
+_async_engine: Optional[AsyncEngine] = None
+_sync_engine: Optional[Engine] = None
+async_pool_metrics = PoolMetrics()
+sync_pool_metrics = PoolMetrics()
+
+
+def async_database_url(url: str) -> str:
+    """A PostgreSQL URL for the asyncpg driver, with the statement cache setting applied."""
+    url = re.sub(r"^postgres(?:ql)?(?:\+\w+)?://", "postgresql+asyncpg://", url)
+    if not settings.DB_STATEMENT_CACHE_ENABLED:
+        url += ("&" if "?" in url else "?") + "prepared_statement_cache_size=0"
+    return url
+
+
+async def connect_unpooled():
     """
-    Dependency to get an async database session.
+    A raw asyncpg connection to the primary, outside the engine's pool and
+    its metrics, for a connection held for the life of the process (the
+    dataset LISTEN) that must not take a pool slot. The caller closes it.
     """
-    async with AsyncSessionLocal() as session:
-        yield session
+    # Imported here like the engine's dialect does, so importing the app
+    # does not load the driver.
+    import asyncpg
+
+    url = re.sub(r"^postgres(?:ql)?(?:\+\w+)?://", "postgresql://", settings.DATABASE_URL)
+    return await asyncpg.connect(url, timeout=settings.DB_CONNECT_TIMEOUT_SECONDS)
+
+
+def get_async_engine() -> AsyncEngine:
+    """The API's async engine, created on first use."""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            async_database_url(settings.DATABASE_URL),
+            **engine_options(async_=True, metrics=async_pool_metrics),
+        )
+        _count_invalidations(_async_engine.pool, async_pool_metrics)
+    return _async_engine
+
+
+def get_sync_engine() -> Engine:
+    """The synchronous engine the SWAPI ETL script needs, created on first use."""
+    global _sync_engine
+    if _sync_engine is None:
+        _sync_engine = create_engine(
+            settings.DATABASE_URL, **engine_options(async_=False, metrics=sync_pool_metrics)
+        )
+        _count_invalidations(_sync_engine.pool, sync_pool_metrics)
+    return _sync_engine
+
+
+class _LazySessionFactory:
+    """A session factory binding to its engine when the first session is made."""
+
+    def __init__(self, engine_factory: Callable[[], Any], **options):
+        self._engine_factory = engine_factory
+        self._options = options
+        self._maker: Optional[sessionmaker] = None
+
+    def __call__(self, **options):
+        if self._maker is None:
+            self._maker = sessionmaker(bind=self._engine_factory(), **self._options)
+        return self._maker(**options)
+
+
+SyncSessionLocal = _LazySessionFactory(get_sync_engine, autocommit=False, autoflush=False)
+AsyncSessionLocal = _LazySessionFactory(
+    get_async_engine, class_=AsyncSession, expire_on_commit=False
+)
+
+
+def pool_metrics() -> Dict[str, Any]:
+    """Pool metrics of every engine created by this process."""
+    metrics: Dict[str, Any] = {"mode": settings.DB_POOL_MODE}
+    if _async_engine is not None:
+        metrics["async"] = async_pool_metrics.snapshot(_async_engine.pool)
+    if _sync_engine is not None:
+        metrics["sync"] = sync_pool_metrics.snapshot(_sync_engine.pool)
+    return metrics
+
+
+async def dispose_engines():
+    """Closes the connections of every engine created by this process."""
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    if _sync_engine is not None:
+        _sync_engine.dispose()
+
 
 async def check_db_connection():
     """
     Verifies that the database connection is available.
     """
     try:
-        async with async_engine.connect() as conn:
+        async with get_async_engine().connect() as conn:
             await conn.execute(text("SELECT 1"))
         logger.info("Database connection successful.")
     except Exception as e:
         logger.error(f"Database connection failed: {e}")
-        raise
\ No newline at end of file
+        raise
@@ -1,18 +1,36 @@
 # src/swapi_search/main.py
 
 import logging
+import re
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from swapi_search.api.v1.dependencies import IN_PROCESS_ENGINES
+from swapi_search.api.v1.compression import (
+    PrecompressedResponseMiddleware,
+    admission_policy,
+    compressed_response_cache,
+)
+from swapi_search.api.v1.endpoints.autocomplete import router as autocomplete_router
+from swapi_search.api.v1.endpoints.export import router as export_router
+from swapi_search.api.v1.endpoints.internal import router as internal_router
+from swapi_search.api.v1.endpoints.lookup import router as lookup_router
 from swapi_search.api.v1.endpoints.resources import resource_router_factory
 from swapi_search.api.v1.endpoints.search import router as search_router
+from swapi_search.api.v1.http_cache import DatasetCacheMiddleware
 from swapi_search.api.v1.registry import RESOURCE_CONFIG # Import the registry
 
 from swapi_search.core.config import settings
 from swapi_search.core.logging import setup_logging
-from swapi_search.db.session import async_engine, check_db_connection
+from swapi_search.core.startup import build_revision, prebuilt_openapi, warm_up
+from swapi_search.db.dataset import dataset_watcher
+from swapi_search.db.routing import replica_router
+from swapi_search.db.session import check_db_connection, dispose_engines
+from swapi_search.repositories.memory import in_memory_resource_repository
+from swapi_search.search.autocomplete import autocompleter
+from swapi_search.search.shadow import drain_pending as drain_shadow_searches
 
 # Setup structured logging for the application
 setup_logging()
@@ -28,9 +46,29 @@ async def lifespan(app: FastAPI):
     logger.info("Application startup...")
     logger.info("Checking database connection...")
     await check_db_connection()
+
+    dataset_watcher.subscribe(autocompleter.load)
+    # In-process engines, whether serving or shadowing, load every dataset version.
+    for name in {settings.SEARCH_ENGINE, settings.SEARCH_SHADOW_ENGINE}:
+        if name in IN_PROCESS_ENGINES:
+            dataset_watcher.subscribe(IN_PROCESS_ENGINES[name].load)
+    if settings.RESOURCE_REPOSITORY == "memory":
+        dataset_watcher.subscribe(in_memory_resource_repository.load)
+    logger.info("Loading current dataset version...")
+    await dataset_watcher.refresh()
+    dataset_watcher.start()
+    # Replicas serve reads once they have caught up with the loaded version.
+    await replica_router.start()
+    warmup_paths = [path.strip() for path in settings.WARMUP_PATHS.split(",") if path.strip()]
+    if warmup_paths:
+        await warm_up(app, warmup_paths)
+
     yield
+    await dataset_watcher.stop()
+    await replica_router.stop()
+    await drain_shadow_searches()
     logger.info("Closing database connection pool...")
-    await async_engine.dispose() # Use 'await' for async engines
+    await dispose_engines()
     logger.info("Application shutdown.")
 
 
@@ -44,11 +82,42 @@ def create_app() -> FastAPI:
         version="1.0.0",
         lifespan=lifespan,
         openapi_url="/api/v1/openapi.json",
-        docs_url="/docs",
-        redoc_url="/redoc",
+        docs_url="/docs" if settings.DOCS_ENABLED else None,
+        redoc_url="/redoc" if settings.DOCS_ENABLED else None,
     )
+    if settings.OPENAPI_SCHEMA_PATH:
+        app.openapi = prebuilt_openapi(app, settings.OPENAPI_SCHEMA_PATH)
 
     # --- Middleware ---
+    # Middleware added later runs first. Compressed variants are served
+    # inside the conditional request handling, so revalidations get a 304
+    # rather than a cached body, and both run inside CORS, whose headers
+    # they need too.
+    resource_types = [resource_type.value for resource_type in RESOURCE_CONFIG]
+    # Search, and browse and detail of every resource type.
+    cacheable_paths = re.compile(rf"/api/v1/(search|(?:{'|'.join(resource_types)})(?:/[^/]+)?)")
+    if settings.RESPONSE_COMPRESSION_ENABLED:
+        app.add_middleware(
+            PrecompressedResponseMiddleware,
+            path_pattern=cacheable_paths,
+            version_provider=lambda: dataset_watcher.version,
+            cache=compressed_response_cache,
+            admission=admission_policy(
+                resource_types, settings.RESPONSE_COMPRESSION_HOT_SEARCH_REQUESTS
+            ),
+            min_size=settings.RESPONSE_COMPRESSION_MIN_SIZE,
+        )
+
+    if settings.HTTP_CACHE_ENABLED:
+        app.add_middleware(
+            DatasetCacheMiddleware,
+            path_pattern=cacheable_paths,
+            version_provider=lambda: dataset_watcher.version,
+            loaded_at_provider=lambda: dataset_watcher.loaded_at,
+            max_age=settings.HTTP_CACHE_MAX_AGE_SECONDS,
+            revision=build_revision(),
+        )
+
     app.add_middleware(
         CORSMiddleware,
         allow_origins=[origin.strip() for origin in settings.CORS_ORIGINS.split(",")],
@@ -60,19 +129,28 @@ def create_app() -> FastAPI:
     # --- API Routers ---
     API_V1_PREFIX = "/api/v1"
 
-    # 1. Include the Unified Search Router
+    # 1. Include the Unified Search and Autocomplete Routers
     app.include_router(search_router, prefix=API_V1_PREFIX)
+    app.include_router(autocomplete_router, prefix=API_V1_PREFIX)
 
-    # 2. Dynamically create and include routers from the central registry
+    # 2. Bulk lookup and streaming export of resources of any type
+    app.include_router(lookup_router, prefix=API_V1_PREFIX)
+    app.include_router(export_router, prefix=API_V1_PREFIX)
+
+    # 3. Dynamically create and include routers from the central registry
     for resource_type, config in RESOURCE_CONFIG.items():
         router = resource_router_factory(
             resource_type=resource_type.value,
             response_model=config["response_model"],
             filters_model=config.get("filters_model"),
-            tag=resource_type.name.capitalize()
+            tag=resource_type.name.capitalize(),
+            sort_fields=config.get("sort_fields", ()),
         )
         app.include_router(router, prefix=API_V1_PREFIX)
 
+    # 4. Internal operational endpoints (metrics, cache statistics)
+    app.include_router(internal_router, prefix=API_V1_PREFIX)
+
     @app.get("/health", tags=["Monitoring"])
     async def health_check():
         """Health check endpoint to verify service is running."""
@@ -0,0 +1,222 @@
+import json
+import logging
+from bisect import bisect_right
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from swapi_search.db.models import FILTER_PATHS, NUMERIC_FIELDS
+from swapi_search.repositories.resource import ResourcePage, ResourceRepository
+
+logger = logging.getLogger(__name__)
+
+
+def _text(data: Dict[str, Any], path: Sequence[str]) -> Optional[str]:
+    """The text at a JSON path, as PostgreSQL's `->>` would return it."""
+    value: Any = data
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value)
+
+
+class _TypeTable:
+    """
+    The resources of one type in swapi_id order, with an id index, the
+    lowercased text of every filter field and the parsed numeric fields as
+    columns.
+    """
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        rows = sorted(rows, key=lambda row: row["swapi_id"])
+        self.swapi_ids: List[int] = [row["swapi_id"] for row in rows]
+        self.data: List[Dict[str, Any]] = [row["data"] for row in rows]
+        self.data_json: List[Optional[str]] = [row.get("data_json") for row in rows]
+        self.positions: Dict[int, int] = {swapi_id: p for p, swapi_id in enumerate(self.swapi_ids)}
+
+        self.text_columns: Dict[str, List[Optional[str]]] = {
+            "name": [row["name"].lower() for row in rows]
+        }
+        for field, path in FILTER_PATHS.items():
+            texts = [_text(row["data"], path) for row in rows]
+            self.text_columns[field] = [t.lower() if t is not None else None for t in texts]
+        self.numeric_columns: Dict[str, List[Optional[float]]] = {
+            field: [row.get(field) for row in rows] for field in NUMERIC_FIELDS
+        }
+
+    def text_column(self, field: str) -> List[Optional[str]]:
+        """The lowercased text of any top-level field, built on first use."""
+        if field not in self.text_columns:
+            texts = [_text(data, (field,)) for data in self.data]
+            self.text_columns[field] = [t.lower() if t is not None else None for t in texts]
+        return self.text_columns[field]
+
+
+class InMemoryResourceRepository(ResourceRepository):
+    """
+    A read model implementing `ResourceRepository` from an in-process copy
+    of the dataset, so browse, filter, count and detail requests never touch
+    the database.
+
+    Matching and ordering follow the SQL repository: filters are
+    case-insensitive substring matches (and min/max bounds on numeric
+    fields), sorts put unknown values last with swapi_id breaking ties. The
+    tables are rebuilt by `load` on every new dataset version and swapped in
+    atomically, so a request sees either the old or the new dataset.
+    """
+
+    def __init__(self):
+        super().__init__(db_session=None)
+        self._tables: Optional[Dict[str, _TypeTable]] = None
+
+    def load(self, rows: List[Dict[str, Any]]):
+        """Builds new per-type tables from the given rows and swaps them in."""
+        by_type: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            by_type.setdefault(row["type"], []).append(row)
+        self._tables = {resource_type: _TypeTable(rs) for resource_type, rs in by_type.items()}
+        logger.info(f"In-memory read model loaded with {len(rows)} resources.")
+
+    def _table(self, resource_type: str) -> Optional[_TypeTable]:
+        if self._tables is None:
+            logger.warning("In-memory read model is not loaded yet.")
+            return None
+        return self._tables.get(resource_type)
+
+    @staticmethod
+    def _document(
+        table: _TypeTable, position: int, fields: Optional[Sequence[str]], encoded: bool
+    ) -> Union[Dict[str, Any], str]:
+        """A resource's data projected to `fields`, or its encoded JSON if wanted and stored."""
+        data = table.data[position]
+        if fields:
+            return {field: data.get(field) for field in fields}
+        if encoded and table.data_json[position] is not None:
+            return table.data_json[position]
+        return data
+
+    @staticmethod
+    def _matches(table: _TypeTable, filters: Optional[Dict[str, Any]]) -> List[int]:
+        """The positions of the rows of a table matching every filter."""
+        positions = range(len(table.swapi_ids))
+        for key, value in (filters or {}).items():
+            if value is None:
+                continue
+            bound, _, field = key.partition("_")
+            if bound in ("min", "max") and field in NUMERIC_FIELDS:
+                column = table.numeric_columns[field]
+                if bound == "min":
+                    positions = [p for p in positions if column[p] is not None and column[p] >= value]
+                else:
+                    positions = [p for p in positions if column[p] is not None and column[p] <= value]
+            else:
+                column = table.text_column(key)
+                term = str(value).lower()
+                positions = [p for p in positions if column[p] is not None and term in column[p]]
+        return list(positions)
+
+    async def get_resource_by_id(
+        self,
+        resource_type: str,
+        resource_id: int,
+        fields: Optional[Sequence[str]] = None,
+        encoded: bool = False,
+    ) -> Optional[Union[Dict[str, Any], str]]:
+        """Retrieves a single resource by its type and swapi_id."""
+        table = self._table(resource_type)
+        position = table.positions.get(resource_id) if table else None
+        if position is None:
+            return None
+        return self._document(table, position, fields, encoded)
+
+    async def get_resources_by_keys(
+        self, keys: Iterable[Tuple[str, int]], encoded: bool = False
+    ) -> Dict[Tuple[str, int], Union[Dict[str, Any], str]]:
+        """Retrieves many resources of any types by (type, swapi_id)."""
+        found = {}
+        for resource_type, swapi_id in keys:
+            table = self._table(resource_type)
+            position = table.positions.get(swapi_id) if table else None
+            if position is not None:
+                found[(resource_type, swapi_id)] = self._document(table, position, None, encoded)
+        return found
+
+    async def get_all_resources(
+        self,
+        resource_type: str,
+        limit: int,
+        offset: int,
+        filters: Optional[Dict[str, Any]] = None,
+        after: Optional[Sequence[Any]] = None,
+        sort: Optional[str] = None,
+        descending: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        encoded: bool = False,
+    ) -> ResourcePage:
+        """
+        Retrieves a page of resources of a specific type with the total
+        number of matches, in the same order and with the same keyset
+        cursors as the SQL repository.
+        """
+        table = self._table(resource_type)
+        if table is None:
+            return ResourcePage(results=[], count=0)
+        positions = self._matches(table, filters)
+
+        if sort:
+            column = table.numeric_columns[sort]
+            sign = -1 if descending else 1
+
+            def sort_key(value: Optional[float], swapi_id: int) -> Tuple:
+                # Unknown values sort last in both directions.
+                return (value is None, sign * value if value is not None else 0, swapi_id)
+
+            keys = [sort_key(column[p], table.swapi_ids[p]) for p in positions]
+            order = sorted(range(len(positions)), key=keys.__getitem__)
+            positions = [positions[i] for i in order]
+            keys = [keys[i] for i in order]
+            start = offset if after is None else bisect_right(keys, sort_key(*after))
+        else:
+            # Positions are already in swapi_id order.
+            keys = [table.swapi_ids[p] for p in positions]
+            start = offset if after is None else bisect_right(keys, after[0])
+
+        end = start + limit
+        page = positions[start:end]
+        next_key = None
+        if end < len(positions) and page:
+            last = page[-1]
+            next_key = (
+                [table.swapi_ids[last]] if not sort
+                else [table.numeric_columns[sort][last], table.swapi_ids[last]]
+            )
+        return ResourcePage(
+            results=[self._document(table, p, fields, encoded) for p in page],
+            count=len(positions),
+            next_key=next_key,
+        )
+
+    async def stream_resources(
+        self, resource_type: Optional[str] = None, batch_size: int = 500
+    ) -> AsyncIterator[List[str]]:
+        """Streams resource data as batches of JSON documents, in (type, swapi_id) order."""
+        if self._tables is None:
+            logger.warning("In-memory read model is not loaded yet.")
+            return
+        tables = self._tables
+        types = [resource_type] if resource_type is not None else sorted(tables)
+        for name in types:
+            data = tables[name].data if name in tables else []
+            for start in range(0, len(data), batch_size):
+                yield [json.dumps(item) for item in data[start:start + batch_size]]
+
+    async def count_resources(
+        self, resource_type: str, filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """Counts the resources of a specific type matching the filters."""
+        table = self._table(resource_type)
+        return len(self._matches(table, filters)) if table else 0
+
+
+in_memory_resource_repository = InMemoryResourceRepository()
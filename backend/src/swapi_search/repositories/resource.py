@@ -1,9 +1,51 @@
-from typing import List, Dict, Any, Optional
+import re
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Iterable, List, Dict, Any, Optional, Sequence, Tuple, Union
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, cast, String
+from sqlalchemy import Text, and_, case, cast, or_, select, func, tuple_
 
 
-from swapi_search.db.models import SwapiResource
+from swapi_search.db.models import (
+    FILTER_PATHS, NUMERIC_FIELDS, SwapiResource, json_projection, json_text,
+)
+
+
+@dataclass
+class ResourcePage:
+    """
+    A page of browse results with the total number of matching resources.
+    `next_key` holds the sort key of the last item when more items follow,
+    for keyset pagination: (swapi_id,), or (value, swapi_id) when sorted by a
+    numeric field. Results are JSON strings for resources read pre-encoded.
+    """
+    results: List[Union[Dict[str, Any], str]]
+    count: int
+    next_key: Optional[List[Any]] = None
+
+
+class TypeCountCache:
+    """
+    Unfiltered resource counts per type, which only change when the ETL
+    loads a new dataset version. All entries are dropped when the version
+    changes.
+    """
+
+    def __init__(self):
+        self._version: Optional[int] = None
+        self._counts: Dict[str, int] = {}
+
+    def get(self, resource_type: str, version: Optional[int]) -> Optional[int]:
+        if version is None or version != self._version:
+            return None
+        return self._counts.get(resource_type)
+
+    def put(self, resource_type: str, version: Optional[int], count: int):
+        if version is None:
+            return
+        if version != self._version:
+            self._version, self._counts = version, {}
+        self._counts[resource_type] = count
+
 
 class ResourceRepository:
     """
@@ -11,52 +53,247 @@ class ResourceRepository:
     The rest of the application should use this repository to interact with
     the database.
     """
-    def __init__(self, db_session: AsyncSession):
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        count_cache: Optional[TypeCountCache] = None,
+        version_provider: Callable[[], Optional[int]] = lambda: None,
+    ):
         self.db_session = db_session
+        self.count_cache = count_cache
+        self.version_provider = version_provider
+
+    @staticmethod
+    def _filter_text(key: str):
+        """
+        The text a filter matches against. Declared filter fields use the
+        same expression as their trigram index, so the planner can serve the
+        match from it; `name` uses the indexed column.
+        """
+        if key == "name":
+            return SwapiResource.name
+        return json_text(SwapiResource.data, FILTER_PATHS.get(key, (key,)))
 
     def _apply_filters(self, stmt, filters: Optional[Dict[str, Any]] = None):
         """
         A helper method to dynamically apply filters to a SQLAlchemy query.
         This function iterates through a dictionary of filters and adds
-        a WHERE clause for each one, searching within the JSONB 'data' column.
+        a WHERE clause for each one: `min_<field>`/`max_<field>` bound a
+        numeric column, anything else searches within the JSONB 'data' column.
         """
         if filters:
             for key, value in filters.items():
-                if value is not None:
-                    # This query searches within the 'data' JSONB column.
-                    # It casts the JSONB value to text to perform a case-insensitive LIKE.
-                    # e.g., data->>'director' ILIKE '%George Lucas%'
+                if value is None:
+                    continue
+                bound, _, field = key.partition("_")
+                if bound in ("min", "max") and field in NUMERIC_FIELDS:
+                    # Range filters on the typed columns; unknown values never match.
+                    column = getattr(SwapiResource, field)
+                    stmt = stmt.where(column >= value if bound == "min" else column <= value)
+                else:
+                    # A case-insensitive partial match on the field's text,
+                    # e.g. data ->> 'director' ILIKE '%George Lucas%'. LIKE
+                    # wildcards in the value are matched literally.
+                    escaped = re.sub(r"([\\%_])", r"\\\1", value)
                     stmt = stmt.where(
-                        cast(SwapiResource.data[key], String).ilike(f"%{value}%")
+                        self._filter_text(key).ilike(f"%{escaped}%", escape="\\")
                     )
         return stmt
 
-    async def get_resource_by_id(self, resource_type: str, resource_id: int) -> Optional[Dict[str, Any]]:
-        """Retrieves a single resource by its type and swapi_id."""
-        stmt = select(SwapiResource.data).where(
+    @staticmethod
+    def _data_columns(fields: Optional[Sequence[str]] = None, encoded: bool = False) -> list:
+        """
+        The columns a resource document is read from: `data`, projected down
+        to `fields` when given or, when `encoded`, the pre-encoded JSON with
+        `data` as a fallback for rows that have none.
+        """
+        if fields:
+            return [json_projection(SwapiResource.data, fields).label("data")]
+        if encoded:
+            return [
+                SwapiResource.data_json,
+                case((SwapiResource.data_json.is_(None), SwapiResource.data)).label("data"),
+            ]
+        return [SwapiResource.data]
+
+    @staticmethod
+    def _document(row, encoded: bool = False) -> Union[Dict[str, Any], str]:
+        """A row's document: its encoded JSON when read and present, else its data."""
+        if encoded and row.data_json is not None:
+            return row.data_json
+        return row.data
+
+    async def get_resource_by_id(
+        self,
+        resource_type: str,
+        resource_id: int,
+        fields: Optional[Sequence[str]] = None,
+        encoded: bool = False,
+    ) -> Optional[Union[Dict[str, Any], str]]:
+        """
+        Retrieves a single resource by its type and swapi_id, with only the
+        given top-level `fields` of its data when provided. With `encoded`
+        (and no `fields`), returns its pre-encoded JSON string instead when
+        the ETL stored one.
+        """
+        stmt = select(*self._data_columns(fields, encoded)).where(
             SwapiResource.type == resource_type,
             SwapiResource.swapi_id == resource_id
         )
-        result = (await self.db_session.execute(stmt)).scalar_one_or_none()
-        return result
+        row = (await self.db_session.execute(stmt)).one_or_none()
+        return self._document(row, encoded) if row is not None else None
+
+    async def get_resources_by_keys(
+        self, keys: Iterable[Tuple[str, int]], encoded: bool = False
+    ) -> Dict[Tuple[str, int], Union[Dict[str, Any], str]]:
+        """
+        Retrieves many resources of any types in one query, with
+        `WHERE (type, swapi_id) IN (...)` on the unique index. Returns their
+        data, or with `encoded` their pre-encoded JSON where stored, by
+        (type, swapi_id); keys with no resource are left out.
+        """
+        keys = list(keys)
+        if not keys:
+            return {}
+        stmt = select(
+            SwapiResource.type, SwapiResource.swapi_id, *self._data_columns(encoded=encoded)
+        ).where(tuple_(SwapiResource.type, SwapiResource.swapi_id).in_(keys))
+        rows = (await self.db_session.execute(stmt)).all()
+        return {(row.type, row.swapi_id): self._document(row, encoded) for row in rows}
+
+    async def get_all_resources(
+        self,
+        resource_type: str,
+        limit: int,
+        offset: int,
+        filters: Optional[Dict[str, Any]] = None,
+        after: Optional[Sequence[Any]] = None,
+        sort: Optional[str] = None,
+        descending: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        encoded: bool = False,
+    ) -> ResourcePage:
+        """
+        Retrieves a paginated list of resources of a specific type, together
+        with the total number of matching resources.
+
+        Resources are ordered by swapi_id or, with `sort`, by that numeric
+        column in either direction with unknown values last and swapi_id
+        breaking ties. Ascending pages are read in (type, column, swapi_id)
+        index order and stop after the page; descending ones, whose NULLs-last
+        order no index scan yields, are a bounded top-N sort of the type.
+
+        When `after` (a previous page's `next_key`) is given, the page seeks
+        past that key instead of skipping `offset` rows, so every page costs
+        the same regardless of depth.
+
+        With `fields`, each item's data is projected to those top-level keys
+        by the database, so the rest of the document is never transferred.
+        Otherwise, with `encoded`, results are the pre-encoded JSON strings
+        of the resources that have one, as in `get_resource_by_id`.
+
+        The total comes from the same statement, as a scalar subquery over the
+        filtered type. Unfiltered totals are served from `count_cache` for the
+        current dataset version when possible, leaving just the page query.
+        """
+        filtered = any(value is not None for value in (filters or {}).values())
+        version = self.version_provider()
+        total = None
+        if self.count_cache is not None and not filtered:
+            total = self.count_cache.get(resource_type, version)
+
+        sort_column = getattr(SwapiResource, sort) if sort else None
+        columns = [SwapiResource.swapi_id, *self._data_columns(fields, encoded)]
+        if total is None:
+            columns.append(
+                self._count_statement(resource_type, filters).scalar_subquery().label("total")
+            )
+        if sort_column is not None:
+            columns.append(sort_column.label("sort_value"))
+            direction = sort_column.desc() if descending else sort_column.asc()
+            order_by = [direction.nulls_last(), SwapiResource.swapi_id]
+        else:
+            order_by = [SwapiResource.swapi_id]
 
-    async def get_all_resources(self, resource_type: str, limit: int, offset: int, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-        """Retrieves a paginated list of resources of a specific type."""
         stmt = (
-            select(SwapiResource.data)
+            select(*columns)
             .where(SwapiResource.type == resource_type)
-            .order_by(SwapiResource.swapi_id)
-            .limit(limit)
-            .offset(offset)
+            .order_by(*order_by)
+            .limit(limit + 1)
         )
+        if after is not None:
+            stmt = stmt.where(self._seek(sort_column, descending, after))
+        else:
+            stmt = stmt.offset(offset)
         stmt = self._apply_filters(stmt, filters)
 
-        result = await self.db_session.execute(stmt)
-        return [row[0] for row in result.all()]
+        rows = (await self.db_session.execute(stmt)).all()
+        if total is None:
+            # Past the last page no row carries the total, so count on its own.
+            total = rows[0].total if rows else await self.count_resources(resource_type, filters)
+            if self.count_cache is not None and not filtered:
+                self.count_cache.put(resource_type, version, total)
+
+        next_key = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_key = [last.swapi_id] if sort_column is None else [last.sort_value, last.swapi_id]
+        return ResourcePage(
+            results=[self._document(row, encoded) for row in rows], count=total, next_key=next_key
+        )
+
+    @staticmethod
+    def _seek(sort_column, descending: bool, after: Sequence[Any]):
+        """
+        The condition selecting rows that sort after the `after` key, for
+        the ordering built in `get_all_resources` (NULLs last, then swapi_id).
+        """
+        if sort_column is None:
+            return SwapiResource.swapi_id > after[0]
+        last_value, last_id = after
+        if last_value is None:
+            return and_(sort_column.is_(None), SwapiResource.swapi_id > last_id)
+        beyond = sort_column < last_value if descending else sort_column > last_value
+        return or_(
+            beyond,
+            and_(sort_column == last_value, SwapiResource.swapi_id > last_id),
+            sort_column.is_(None),
+        )
+
+    async def stream_resources(
+        self, resource_type: Optional[str] = None, batch_size: int = 500
+    ) -> AsyncIterator[List[str]]:
+        """
+        Streams the data of every resource, or every resource of a type, in
+        (type, swapi_id) order as batches of JSON documents.
+
+        Rows are read through a server-side cursor `batch_size` at a time and
+        the next batch is only fetched once the caller asks for it, so memory
+        stays flat however large the table is and a slow consumer slows the
+        read down. Documents are rendered to text by PostgreSQL and never
+        decoded here.
+        """
+        stmt = (
+            select(cast(SwapiResource.data, Text))
+            .order_by(SwapiResource.type, SwapiResource.swapi_id)
+            .execution_options(yield_per=batch_size)
+        )
+        if resource_type is not None:
+            stmt = stmt.where(SwapiResource.type == resource_type)
+        result = await self.db_session.stream_scalars(stmt)
+        async for batch in result.partitions():
+            yield list(batch)
+
+    def _count_statement(self, resource_type: str, filters: Optional[Dict[str, Any]] = None):
+        stmt = select(func.count(SwapiResource.id)).where(SwapiResource.type == resource_type)
+        return self._apply_filters(stmt, filters)
 
     async def count_resources(self, resource_type: str, filters: Optional[Dict[str, Any]] = None) -> int:
         """Counts the total number of resources of a specific type."""
-        count_stmt = select(func.count(SwapiResource.id)).where(SwapiResource.type == resource_type)
-        count_stmt = self._apply_filters(count_stmt, filters)
+        count_stmt = self._count_statement(resource_type, filters)
         total_count = (await self.db_session.execute(count_stmt)).scalar_one()
-        return total_count
\ No newline at end of file
+        return total_count
+
+
+type_count_cache = TypeCountCache()
\ No newline at end of file
@@ -0,0 +1,109 @@
+import logging
+import re
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_WORD = re.compile(r"\w+")
+
+
+def _normalize(text: str) -> str:
+    """Lowercases and collapses whitespace, as keys are stored."""
+    return " ".join(text.lower().split())
+
+
+class _SortedKeys:
+    """Parallel sorted arrays of lowercase keys and suggestion positions."""
+
+    def __init__(self, entries: List[Tuple[str, int]]):
+        entries.sort()
+        self.keys = [key for key, _ in entries]
+        self.positions = [position for _, position in entries]
+
+    def scan(self, prefix: str):
+        """Yields the positions of all keys starting with `prefix`, in key order."""
+        start = bisect_left(self.keys, prefix)
+        for i in range(start, len(self.keys)):
+            if not self.keys[i].startswith(prefix):
+                break
+            yield self.positions[i]
+
+
+class PrefixIndex:
+    """
+    An immutable prefix index over resource names.
+
+    Each name is stored under its full lowercase form and under the suffix
+    starting at every later word (so "sky" finds "Luke Skywalker" and "wan"
+    finds "Obi-Wan Kenobi"). Keys live in sorted arrays, one set for all
+    resources and one per type, and a lookup is a binary search followed by a
+    short forward scan. Full-name matches are returned before word matches.
+    """
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.suggestions: List[Dict[str, str]] = [
+            {"name": row["name"], "type": row["type"], "url": row["data"].get("url", "")}
+            for row in sorted(rows, key=lambda row: row["id"])
+        ]
+
+        names: Dict[Optional[str], List[Tuple[str, int]]] = {None: []}
+        words: Dict[Optional[str], List[Tuple[str, int]]] = {None: []}
+        for position, suggestion in enumerate(self.suggestions):
+            name = _normalize(suggestion["name"])
+            resource_type = suggestion["type"]
+            word_keys = {name[m.start():] for m in _WORD.finditer(name) if m.start() > 0}
+
+            for scope in (None, resource_type):
+                names.setdefault(scope, []).append((name, position))
+                words.setdefault(scope, []).extend((key, position) for key in word_keys)
+
+        self._names = {scope: _SortedKeys(entries) for scope, entries in names.items()}
+        self._words = {scope: _SortedKeys(entries) for scope, entries in words.items()}
+
+    def __len__(self) -> int:
+        return len(self.suggestions)
+
+    def lookup(self, prefix: str, resource_type: Optional[str] = None, limit: int = 10) -> List[Dict[str, str]]:
+        """Returns up to `limit` suggestions whose name or a word in it starts with `prefix`."""
+        prefix = _normalize(prefix)
+        if not prefix or resource_type not in self._names:
+            return []
+
+        seen = set()
+        results = []
+        for keys in (self._names[resource_type], self._words[resource_type]):
+            for position in keys.scan(prefix):
+                if position in seen:
+                    continue
+                seen.add(position)
+                results.append(self.suggestions[position])
+                if len(results) == limit:
+                    return results
+        return results
+
+
+class Autocompleter:
+    """
+    Serves type-ahead suggestions from an in-memory `PrefixIndex` that is
+    rebuilt by `load` whenever a new dataset version is loaded.
+    """
+
+    def __init__(self):
+        self._index: Optional[PrefixIndex] = None
+
+    def load(self, rows: List[Dict[str, Any]]):
+        """Builds a new prefix index from the given rows and swaps it in atomically."""
+        index = PrefixIndex(rows)
+        self._index = index
+        logger.info(f"Autocomplete index built with {len(index)} names.")
+
+    def suggest(self, prefix: str, resource_type: Optional[str] = None, limit: int = 10) -> List[Dict[str, str]]:
+        index = self._index
+        if index is None:
+            logger.warning("Autocomplete index is not loaded yet.")
+            return []
+        return index.lookup(prefix, resource_type=resource_type, limit=limit)
+
+
+autocompleter = Autocompleter()
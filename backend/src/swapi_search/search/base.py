@@ -1,5 +1,56 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from dataclasses import dataclass
+from enum import Enum
+from typing import FrozenSet, List, Optional, Dict, Any, Sequence, Union
+
+
+class SearchMode(str, Enum):
+    """
+    The matching strategies a search engine may support.
+
+    - substring: case-insensitive partial match, name matches ranked first.
+    - fulltext: word-based full-text match ranked by weighted relevance, with
+      the last word treated as a prefix for type-ahead.
+    - fuzzy: typo-tolerant match ranked by trigram similarity.
+    """
+    substring = "substring"
+    fulltext = "fulltext"
+    fuzzy = "fuzzy"
+
+
+class UnsupportedSearchModeError(ValueError):
+    """Raised when a search engine is asked for a mode it does not implement."""
+
+
+@dataclass
+class SearchPage:
+    """
+    A single page of search results together with the total number of
+    matches for the query.
+
+    `count_is_exact` is False when the engine capped or estimated the total
+    instead of counting every match. `next_key` is the (relevance, id) sort
+    key of the last result when more results follow, for keyset pagination.
+    `mode` is the mode that produced the results, which may differ from the
+    requested one when an engine falls back to another strategy. `facets`
+    maps each resource type to its number of matches, ignoring the type
+    filter, when facets were requested.
+    """
+    results: List[Dict[str, Any]]
+    count: int
+    count_is_exact: bool = True
+    next_key: Optional[List[Any]] = None
+    mode: Optional[SearchMode] = None
+    facets: Optional[Dict[str, int]] = None
+
+
+def project(result: Dict[str, Any], fields: Optional[Sequence[str]]) -> Dict[str, Any]:
+    """A result document reduced to the given top-level fields, if any."""
+    if not fields:
+        return result
+    return {field: result.get(field) for field in fields}
+
 
 class BaseSearchEngine(ABC):
     """
@@ -8,6 +59,24 @@ class BaseSearchEngine(ABC):
     allowing for swappable backends (e.g., PostgreSQL, Elasticsearch).
     """
 
+    supported_modes: FrozenSet[SearchMode] = frozenset({SearchMode.substring})
+    default_mode: SearchMode = SearchMode.substring
+    # How many searches of a batch may run at once. Engines bound to a single
+    # database session must run them one at a time.
+    max_concurrency: int = 8
+
+    def resolve_mode(self, mode: Optional[SearchMode]) -> SearchMode:
+        """
+        Returns the mode to run a search with, falling back to the engine's
+        default, or raises UnsupportedSearchModeError.
+        """
+        mode = mode or self.default_mode
+        if mode not in self.supported_modes:
+            raise UnsupportedSearchModeError(
+                f"Search mode '{mode.value}' is not supported by {type(self).__name__}."
+            )
+        return mode
+
     @abstractmethod
     async def search(
         self,
@@ -15,7 +84,11 @@ class BaseSearchEngine(ABC):
         resource_type: Optional[str] = None,
         limit: int = 10,
         offset: int = 0,
-    ) -> List[Dict[str, Any]]:
+        mode: Optional[SearchMode] = None,
+        after: Optional[Sequence[Any]] = None,
+        facets: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SearchPage:
         """
         Performs a search for resources.
 
@@ -24,8 +97,43 @@ class BaseSearchEngine(ABC):
             resource_type: Optional filter to restrict search to a specific type.
             limit: The maximum number of results to return.
             offset: The starting point for pagination.
+            mode: The matching strategy; None selects the engine's default.
+            after: A (relevance, id) key from a previous page's `next_key`.
+                When given, results start right after it and `offset` is
+                ignored.
+            facets: Whether to also count matches per resource type.
+            fields: Top-level fields to return for each result; None
+                returns whole documents.
+
+        Returns:
+            A page of search results and the total number of matches.
+        """
+        pass
+
+    async def _search_isolated(self, request: Dict[str, Any]) -> Union[SearchPage, Exception]:
+        """Runs one search of a batch, returning its exception instead of raising."""
+        try:
+            return await self.search(**request)
+        except Exception as e:
+            return e
+
+    async def search_many(
+        self, requests: Sequence[Dict[str, Any]]
+    ) -> List[Union[SearchPage, Exception]]:
+        """
+        Runs several searches with at most `max_concurrency` in flight.
+
+        Args:
+            requests: Keyword arguments for `search`, one dict per search.
 
         Returns:
-            A list of search results.
+            One entry per request, in order: its page, or the exception it
+            raised, so a failing search does not fail the whole batch.
         """
-        pass
\ No newline at end of file
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(request: Dict[str, Any]) -> Union[SearchPage, Exception]:
+            async with semaphore:
+                return await self._search_isolated(request)
+
+        return list(await asyncio.gather(*(run(request) for request in requests)))
@@ -0,0 +1,249 @@
+import logging
+import math
+import re
+from bisect import bisect_left
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from swapi_search.core.config import settings
+from swapi_search.search.base import BaseSearchEngine, SearchMode, SearchPage, project
+
+logger = logging.getLogger(__name__)
+
+_TOKEN = re.compile(r"\w+")
+# The most vocabulary terms a trailing partial word may expand to.
+_MAX_PREFIX_EXPANSIONS = 50
+
+
+def _numpy():
+    """
+    Returns the numpy module, or None when it is not installed. numpy is an
+    optional dependency (the "bm25" extra), imported where an index is built
+    or used so processes that never use BM25 do not load it.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def tokenize(text: str) -> List[str]:
+    """Splits text into lowercase word tokens."""
+    return _TOKEN.findall(text.lower())
+
+
+class _FieldPostings:
+    """
+    Term statistics for one field in compressed sparse row (CSR) form.
+
+    The postings of term `t` are `doc_ids[indptr[t]:indptr[t + 1]]` with the
+    matching term frequencies in `tfs`; `doc_lengths` holds the token count
+    of every document.
+    """
+
+    def __init__(self, docs_tokens: List[List[str]], vocabulary: Dict[str, int]):
+        term_docs: List[List[int]] = [[] for _ in vocabulary]
+        term_tfs: List[List[int]] = [[] for _ in vocabulary]
+        for doc, tokens in enumerate(docs_tokens):
+            for term, tf in Counter(tokens).items():
+                term_docs[vocabulary[term]].append(doc)
+                term_tfs[vocabulary[term]].append(tf)
+
+        np = _numpy()
+        self.indptr = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+        np.cumsum([len(postings) for postings in term_docs], out=self.indptr[1:])
+        n_postings = int(self.indptr[-1])
+        self.doc_ids = np.fromiter(
+            (doc for postings in term_docs for doc in postings), dtype=np.int32, count=n_postings
+        )
+        self.tfs = np.fromiter(
+            (tf for postings in term_tfs for tf in postings), dtype=np.float32, count=n_postings
+        )
+        self.doc_lengths = np.array([len(tokens) for tokens in docs_tokens], dtype=np.float32)
+        self.avg_length = float(self.doc_lengths.mean()) if len(docs_tokens) else 0.0
+
+
+class BM25Index:
+    """
+    An immutable BM25 index over the swapi_resource rows.
+
+    `searchable_text` and `name` are indexed as separate fields sharing one
+    vocabulary. A query is scored by adding, for each of its terms, the
+    vectorized BM25 contribution of that term's postings to a dense score
+    array, with the name field's contribution multiplied by `name_boost`.
+    """
+
+    def __init__(
+        self,
+        rows: List[Dict[str, Any]],
+        k1: float = 1.2,
+        b: float = 0.75,
+        name_boost: float = 2.0,
+    ):
+        np = _numpy()
+        if np is None:
+            raise RuntimeError(
+                "The BM25 search engine requires numpy; install the 'bm25' extra."
+            )
+
+        rows = sorted(rows, key=lambda row: row["id"])
+        self.k1, self.b, self.name_boost = k1, b, name_boost
+        self.data: List[Dict[str, Any]] = [row["data"] for row in rows]
+        self.ids = np.array([row["id"] for row in rows], dtype=np.int64)
+
+        self.type_names: List[str] = sorted({row["type"] for row in rows})
+        type_codes = {name: code for code, name in enumerate(self.type_names)}
+        self.types = np.array([type_codes[row["type"]] for row in rows], dtype=np.int8)
+
+        text_tokens = [tokenize(row["searchable_text"]) for row in rows]
+        name_tokens = [tokenize(row["name"]) for row in rows]
+        self.terms: List[str] = sorted({t for tokens in text_tokens + name_tokens for t in tokens})
+        self.vocabulary: Dict[str, int] = {term: i for i, term in enumerate(self.terms)}
+
+        self.fields: List[Tuple[_FieldPostings, float]] = [
+            (_FieldPostings(text_tokens, self.vocabulary), 1.0),
+            (_FieldPostings(name_tokens, self.vocabulary), name_boost),
+        ]
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def query_terms(self, query: str) -> List[int]:
+        """
+        Maps a query to vocabulary term ids. A trailing word that is not
+        followed by whitespace also matches the terms it is a prefix of, so
+        partially typed words still score.
+        """
+        tokens = tokenize(query)
+        term_ids = {self.vocabulary[t] for t in tokens if t in self.vocabulary}
+        if tokens and query[-1:].isalnum():
+            prefix = tokens[-1]
+            start = bisect_left(self.terms, prefix)
+            for i in range(start, min(start + _MAX_PREFIX_EXPANSIONS, len(self.terms))):
+                if not self.terms[i].startswith(prefix):
+                    break
+                term_ids.add(i)
+        return sorted(term_ids)
+
+    def score(self, term_ids: Sequence[int]):
+        """Returns a dense float64 array of BM25 scores, one per document."""
+        np = _numpy()
+        scores = np.zeros(len(self.data), dtype=np.float64)
+        n_docs = len(self.data)
+        for postings, weight in self.fields:
+            if postings.avg_length == 0:
+                continue
+            for t in term_ids:
+                start, end = postings.indptr[t], postings.indptr[t + 1]
+                if start == end:
+                    continue
+                docs = postings.doc_ids[start:end]
+                tf = postings.tfs[start:end]
+                df = end - start
+                idf = math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+                length_ratio = postings.doc_lengths[docs] / postings.avg_length
+                norm = self.k1 * (1.0 - self.b + self.b * length_ratio)
+                # Each document appears once per term, so fancy-indexed += is safe.
+                scores[docs] += weight * idf * tf * (self.k1 + 1.0) / (tf + norm)
+        return scores
+
+
+class BM25SearchEngine(BaseSearchEngine):
+    """
+    A search engine that ranks results with BM25 over an in-process index,
+    so multi-word queries get graded relevance without a database round trip.
+
+    Documents matching any query term are returned by descending score, ties
+    broken by id. Only the top `offset + limit` candidates are ordered, picked
+    with `argpartition` instead of sorting every match.
+    """
+
+    supported_modes = frozenset({SearchMode.fulltext})
+    default_mode = SearchMode.fulltext
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, name_boost: float = 2.0):
+        self.k1, self.b, self.name_boost = k1, b, name_boost
+        self._index: Optional[BM25Index] = None
+
+    def load(self, rows: List[Dict[str, Any]]):
+        """Builds a new BM25 index from the given rows and swaps it in atomically."""
+        index = BM25Index(rows, k1=self.k1, b=self.b, name_boost=self.name_boost)
+        self._index = index
+        logger.info(f"BM25 index built with {len(index)} documents and {len(index.terms)} terms.")
+
+    async def search(
+        self,
+        query: str,
+        resource_type: Optional[str] = None,
+        limit: int = 10,
+        offset: int = 0,
+        mode: Optional[SearchMode] = None,
+        after: Optional[Sequence[Any]] = None,
+        facets: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SearchPage:
+        """
+        Scores every document for the query and returns the requested page.
+        """
+        mode = self.resolve_mode(mode)
+        index = self._index
+        if index is None:
+            logger.warning("BM25 search index is not loaded yet.")
+            return SearchPage(results=[], count=0, mode=mode, facets={} if facets else None)
+
+        np = _numpy()
+        scores = index.score(index.query_terms(query))
+        matched = scores > 0
+
+        type_counts = None
+        if facets:
+            counts = np.bincount(index.types[matched], minlength=len(index.type_names))
+            type_counts = {name: int(n) for name, n in zip(index.type_names, counts) if n}
+
+        if resource_type:
+            if resource_type not in index.type_names:
+                return SearchPage(results=[], count=0, mode=mode, facets=type_counts)
+            matched &= index.types == index.type_names.index(resource_type)
+
+        candidates = np.flatnonzero(matched)
+        total = len(candidates)
+        if after is not None:
+            last_score, last_id = after
+            candidate_scores, candidate_ids = scores[candidates], index.ids[candidates]
+            candidates = candidates[
+                (candidate_scores < last_score)
+                | ((candidate_scores == last_score) & (candidate_ids > last_id))
+            ]
+            offset = 0
+
+        end = offset + limit
+        has_more = end < len(candidates)
+        if has_more:
+            # Only the best `end` candidates are ordered. argpartition may cut
+            # through a run of tied scores, so the cut-off score's ties are
+            # kept in full and the id tie-break stays exact.
+            candidate_scores = scores[candidates]
+            kth = np.argpartition(-candidate_scores, end - 1)[end - 1]
+            candidates = candidates[candidate_scores >= candidate_scores[kth]]
+        order = np.lexsort((index.ids[candidates], -scores[candidates]))
+        page = candidates[order[offset:end]]
+
+        next_key = None
+        if has_more and len(page):
+            next_key = [float(scores[page[-1]]), int(index.ids[page[-1]])]
+
+        return SearchPage(
+            results=[project(index.data[i], fields) for i in page],
+            count=total,
+            next_key=next_key,
+            mode=mode,
+            facets=type_counts,
+        )
+
+
+bm25_search_engine = BM25SearchEngine(
+    k1=settings.SEARCH_BM25_K1,
+    b=settings.SEARCH_BM25_B,
+    name_boost=settings.SEARCH_BM25_NAME_BOOST,
+)
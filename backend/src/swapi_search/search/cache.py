@@ -0,0 +1,181 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Optional, Sequence, Tuple, Union
+
+from swapi_search.core.config import settings
+from swapi_search.search.base import BaseSearchEngine, SearchMode, SearchPage
+
+
+class SearchResultCache:
+    """
+    A bounded LRU cache of search pages with a time-to-live.
+
+    Every entry is tagged with the dataset version it was computed from. A
+    lookup under a different version is a miss and drops the stale entry, so
+    a new ETL load invalidates cached results as soon as the version changes
+    instead of waiting for the TTL to run out.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[Optional[int], float, SearchPage]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable, version: Optional[int]) -> Optional[SearchPage]:
+        """Returns the cached page for a key, or None on a miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        entry_version, expires_at, page = entry
+        if entry_version != version or expires_at <= self._clock():
+            del self._entries[key]
+            self.invalidations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return page
+
+    def put(self, key: Hashable, version: Optional[int], page: SearchPage):
+        """Stores a page, evicting the least recently used entries if full."""
+        self._entries[key] = (version, self._clock() + self.ttl_seconds, page)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns the cache's size and hit/miss/eviction counters."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class CachedSearchEngine(BaseSearchEngine):
+    """
+    Wraps any search engine with a shared `SearchResultCache`.
+
+    Keys are built from the lowercased query and the remaining search
+    arguments; all supported modes match case-insensitively, so "Luke" and
+    "luke" share an entry.
+    """
+
+    def __init__(
+        self,
+        engine: BaseSearchEngine,
+        cache: SearchResultCache,
+        version_provider: Callable[[], Optional[int]],
+    ):
+        self.engine = engine
+        self.cache = cache
+        self.version_provider = version_provider
+
+    @property
+    def supported_modes(self) -> FrozenSet[SearchMode]:
+        return self.engine.supported_modes
+
+    @property
+    def default_mode(self) -> SearchMode:
+        return self.engine.default_mode
+
+    @property
+    def max_concurrency(self) -> int:
+        return self.engine.max_concurrency
+
+    @staticmethod
+    def _key(
+        query: str,
+        resource_type: Optional[str] = None,
+        limit: int = 10,
+        offset: int = 0,
+        mode: SearchMode = SearchMode.substring,
+        after: Optional[Sequence[Any]] = None,
+        facets: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Tuple:
+        """Builds a cache key; queries are lowercased as all modes ignore case."""
+        return (
+            query.lower(),
+            resource_type,
+            limit,
+            offset if after is None else None,
+            mode.value,
+            tuple(after) if after is not None else None,
+            facets,
+            tuple(fields) if fields else None,
+        )
+
+    async def search(
+        self,
+        query: str,
+        resource_type: Optional[str] = None,
+        limit: int = 10,
+        offset: int = 0,
+        mode: Optional[SearchMode] = None,
+        after: Optional[Sequence[Any]] = None,
+        facets: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SearchPage:
+        """Serves a search from the cache, delegating to the wrapped engine on a miss."""
+        mode = self.resolve_mode(mode)
+        key = self._key(query, resource_type, limit, offset, mode, after, facets, fields)
+        version = self.version_provider()
+
+        page = self.cache.get(key, version)
+        if page is None:
+            page = await self.engine.search(
+                query=query,
+                resource_type=resource_type,
+                limit=limit,
+                offset=offset,
+                mode=mode,
+                after=after,
+                facets=facets,
+                fields=fields,
+            )
+            self.cache.put(key, version, page)
+        return page
+
+    async def _search_isolated(self, request: Dict[str, Any]) -> Union[SearchPage, Exception]:
+        """Serves a batch item from the cache, isolating misses like the wrapped engine does."""
+        try:
+            mode = self.resolve_mode(request.get("mode"))
+        except Exception as e:
+            return e
+        key, version = self._key(**{**request, "mode": mode}), self.version_provider()
+        page = self.cache.get(key, version)
+        if page is None:
+            page = await self.engine._search_isolated({**request, "mode": mode})
+            if isinstance(page, SearchPage):
+                self.cache.put(key, version, page)
+        return page
+
+
+search_result_cache = SearchResultCache(
+    max_entries=settings.SEARCH_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.SEARCH_CACHE_TTL_SECONDS,
+)
@@ -1,6 +1,6 @@
-from typing import List, Optional, Dict, Any
+from typing import Any, Optional, Sequence
 
-from swapi_search.search.base import BaseSearchEngine
+from swapi_search.search.base import BaseSearchEngine, SearchMode, SearchPage
 
 
 class ElasticSearchEngine(BaseSearchEngine):
@@ -15,7 +15,11 @@ class ElasticSearchEngine(BaseSearchEngine):
         resource_type: Optional[str] = None,
         limit: int = 10,
         offset: int = 0,
-    ) -> List[Dict[str, Any]]:
+        mode: Optional[SearchMode] = None,
+        after: Optional[Sequence[Any]] = None,
+        facets: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SearchPage:
         """
         This method would contain the logic to query an Elasticsearch index.
         """
@@ -23,4 +27,4 @@ class ElasticSearchEngine(BaseSearchEngine):
             "Elasticsearch engine is not implemented. "
             "This is a placeholder for future extension."
         )
-        return []
\ No newline at end of file
+        return SearchPage(results=[], count=0, facets={} if facets else None)
\ No newline at end of file
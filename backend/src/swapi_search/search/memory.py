@@ -0,0 +1,145 @@
+import logging
+from bisect import bisect_right
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+
+from swapi_search.search.base import BaseSearchEngine, SearchMode, SearchPage, project
+
+logger = logging.getLogger(__name__)
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Returns the set of 3-character substrings of a string."""
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class TrigramIndex:
+    """
+    An immutable, in-process trigram index over the swapi_resource rows.
+
+    Every row's lowercase `searchable_text` is split into trigrams and each
+    trigram maps to a posting list of row positions. Rows are kept in `id`
+    order, so posting lists and match lists are naturally sorted by id.
+    """
+
+    def __init__(self, rows: Iterable[Dict[str, Any]]):
+        rows = sorted(rows, key=lambda row: row["id"])
+        self.ids: List[int] = [row["id"] for row in rows]
+        self.types: List[str] = [row["type"] for row in rows]
+        self.names: List[str] = [row["name"].lower() for row in rows]
+        self.texts: List[str] = [row["searchable_text"].lower() for row in rows]
+        self.data: List[Dict[str, Any]] = [row["data"] for row in rows]
+
+        postings: Dict[str, List[int]] = {}
+        for position, text in enumerate(self.texts):
+            for gram in _trigrams(text):
+                postings.setdefault(gram, []).append(position)
+        self.postings: Dict[str, tuple] = {
+            gram: tuple(positions) for gram, positions in postings.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def match(self, query: str) -> List[int]:
+        """
+        Returns the positions of all rows whose searchable text contains the
+        (lowercase) query, in id order.
+
+        Queries of three or more characters intersect the posting lists of
+        their trigrams, rarest first, and verify the survivors with a
+        substring check. Shorter queries fall back to a linear scan.
+        """
+        grams = _trigrams(query)
+        if not grams:
+            candidates: Iterable[int] = range(len(self.texts))
+        else:
+            posting_lists = sorted((self.postings.get(g, ()) for g in grams), key=len)
+            if not posting_lists[0]:
+                return []
+            survivors = set(posting_lists[0])
+            for positions in posting_lists[1:]:
+                survivors.intersection_update(positions)
+                if not survivors:
+                    return []
+            candidates = sorted(survivors)
+
+        return [p for p in candidates if query in self.texts[p]]
+
+
+class InMemorySearchEngine(BaseSearchEngine):
+    """
+    A search engine that answers queries from an in-process trigram index
+    instead of the database. It mirrors `PostgresSearchEngine`: a
+    case-insensitive substring match on `searchable_text`, with name matches
+    ranked first and ties broken by id.
+
+    The index is rebuilt from a full dataset snapshot by `load` and swapped in
+    with a single reference assignment, so concurrent searches always see
+    either the old or the new index, never a partial one.
+    """
+
+    def __init__(self):
+        self._index: Optional[TrigramIndex] = None
+
+    def load(self, rows: List[Dict[str, Any]]):
+        """Builds a new index from the given rows and swaps it in atomically."""
+        index = TrigramIndex(rows)
+        self._index = index
+        logger.info(
+            f"In-memory search index built with {len(index)} documents "
+            f"and {len(index.postings)} trigrams."
+        )
+
+    async def search(
+        self,
+        query: str,
+        resource_type: Optional[str] = None,
+        limit: int = 10,
+        offset: int = 0,
+        mode: Optional[SearchMode] = None,
+        after: Optional[Sequence[Any]] = None,
+        facets: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SearchPage:
+        """
+        Searches the in-memory index, ranking results that match the 'name'
+        field higher than those that match in other fields.
+        """
+        mode = self.resolve_mode(mode)
+        index = self._index
+        if index is None:
+            logger.warning("In-memory search index is not loaded yet.")
+            return SearchPage(results=[], count=0, mode=mode, facets={} if facets else None)
+
+        term = query.lower()
+        matches = index.match(term)
+        type_counts = dict(Counter(index.types[p] for p in matches)) if facets else None
+        if resource_type:
+            matches = [p for p in matches if index.types[p] == resource_type]
+
+        name_matches = [p for p in matches if term in index.names[p]]
+        other_matches = [p for p in matches if term not in index.names[p]]
+        ranked = name_matches + other_matches
+        # Sort keys as (-relevance, id), so `ranked` is in ascending key order.
+        keys = [(-2, index.ids[p]) for p in name_matches] + [
+            (-1, index.ids[p]) for p in other_matches
+        ]
+
+        start = offset if after is None else bisect_right(keys, (-after[0], after[1]))
+        end = start + limit
+        next_key = None
+        if end < len(ranked):
+            relevance, last_id = keys[end - 1]
+            next_key = [-relevance, last_id]
+
+        return SearchPage(
+            results=[project(index.data[p], fields) for p in ranked[start:end]],
+            count=len(ranked),
+            next_key=next_key,
+            mode=mode,
+            facets=type_counts,
+        )
+
+
+in_memory_search_engine = InMemorySearchEngine()
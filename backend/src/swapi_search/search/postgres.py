@@ -1,19 +1,184 @@
-from typing import List, Optional, Dict, Any
-from sqlalchemy import select, text, case
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from sqlalchemy import JSON, and_, or_, select, case, func
 
-from swapi_search.db.models import SwapiResource
-from swapi_search.search.base import BaseSearchEngine
+from swapi_search.core.config import settings
+from swapi_search.db.models import SEARCH_TS_CONFIG, SwapiResource, json_projection
+from swapi_search.search.base import BaseSearchEngine, SearchMode, SearchPage
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# The last word of a full-text query, and an 'or' operator ending its head.
+_TRAILING_WORD = re.compile(r"(\w+)$")
+_TRAILING_OR = re.compile(r"(?:^|\s)or\s*$", re.IGNORECASE)
+
+
+def _trailing_term(query: str) -> Optional[Tuple[str, str]]:
+    """
+    Splits a full-text query ending in a plain term into the text before it
+    and the term. Returns None when it does not end in one: when it ends in
+    whitespace or a quote, or its last word is negated ('-'), inside quotes,
+    an 'or' operand or the 'or' operator itself.
+    """
+    trailing = _TRAILING_WORD.search(query)
+    if trailing is None:
+        return None
+    head, term = query[: trailing.start()], trailing.group(1)
+    if (
+        head.endswith("-")
+        or head.count('"') % 2
+        or term.lower() == "or"
+        or _TRAILING_OR.search(head)
+    ):
+        return None
+    return head.strip(), term
+
 
 class PostgresSearchEngine(BaseSearchEngine):
     """
-    A search engine implementation that uses PostgreSQL's ILIKE for
-    case-insensitive, partial-text search, with a relevance-ranking system.
+    A search engine implementation backed by PostgreSQL. It supports three modes:
+
+    - substring: ILIKE for case-insensitive, partial-text search, with a
+      relevance-ranking system that favours name matches.
+    - fulltext: the weighted `search_vector` column matched with
+      `websearch_to_tsquery` and ranked with `ts_rank_cd`, so both filtering
+      and ranking are served from its GIN index.
+    - fuzzy: typo-tolerant pg_trgm word similarity over searchable_text,
+      served by its trigram GIN index.
     """
 
-    def __init__(self, db_session: AsyncSession):
+    supported_modes = frozenset({SearchMode.substring, SearchMode.fulltext, SearchMode.fuzzy})
+    # All searches share one AsyncSession, which runs one statement at a time.
+    max_concurrency = 1
+
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        count_cap: Optional[int] = None,
+        fuzzy_threshold: Optional[float] = None,
+        fuzzy_fallback_min_hits: Optional[int] = None,
+    ):
         self.db_session = db_session
+        self.count_cap = count_cap if count_cap is not None else settings.SEARCH_COUNT_CAP
+        self.fuzzy_threshold = (
+            fuzzy_threshold if fuzzy_threshold is not None else settings.SEARCH_FUZZY_THRESHOLD
+        )
+        self.fuzzy_fallback_min_hits = (
+            fuzzy_fallback_min_hits
+            if fuzzy_fallback_min_hits is not None
+            else settings.SEARCH_FUZZY_FALLBACK_MIN_HITS
+        )
+
+    def _capped_count(self, conditions: List):
+        """
+        A scalar subquery counting matches that stops after `count_cap + 1`
+        rows, so large result sets never cost more to count than to page.
+        """
+        limited = select(SwapiResource.id).where(*conditions).limit(self.count_cap + 1)
+        return select(func.count()).select_from(limited.subquery()).scalar_subquery()
+
+    async def _count(self, conditions: List) -> int:
+        """Counts matches on their own; only used when a page comes back empty."""
+        if self.count_cap is not None:
+            stmt = select(self._capped_count(conditions))
+        else:
+            stmt = select(func.count(SwapiResource.id)).where(*conditions)
+        return (await self.db_session.execute(stmt)).scalar_one()
+
+    def _facet_counts(self, conditions: List):
+        """
+        A scalar subquery returning a JSON object of match counts per type.
+        It is uncorrelated, so PostgreSQL evaluates it once per statement.
+        """
+        counts = (
+            select(SwapiResource.type, func.count().label("matches"))
+            .where(*conditions)
+            .group_by(SwapiResource.type)
+            .subquery()
+        )
+        return select(
+            func.json_object_agg(counts.c.type, counts.c.matches, type_=JSON)
+        ).scalar_subquery()
+
+    def _page(
+        self,
+        rows: List,
+        total: int,
+        mode: SearchMode,
+        next_key: Optional[List[Any]] = None,
+        facets: Optional[Dict[str, int]] = None,
+    ) -> SearchPage:
+        if self.count_cap is not None and total > self.count_cap:
+            return SearchPage(
+                results=rows, count=self.count_cap, count_is_exact=False,
+                next_key=next_key, mode=mode, facets=facets,
+            )
+        return SearchPage(
+            results=rows, count=total, next_key=next_key, mode=mode, facets=facets
+        )
+
+    def _substring_clauses(self, query: str) -> Tuple[List, object]:
+        """
+        Matches the term anywhere in the searchable text, ranking results
+        that match the 'name' field higher than those that match elsewhere.
+        """
+        search_term = f"%{query}%"
+        relevance = case(
+            (SwapiResource.name.ilike(search_term), 2),
+            else_=1
+        )
+        return [SwapiResource.searchable_text.ilike(search_term)], relevance
+
+    def _fulltext_clauses(self, query: str) -> Tuple[List, object]:
+        """
+        Matches words with `websearch_to_tsquery` (quotes, 'or' and '-' work
+        as on web search engines). A trailing plain term is matched as a
+        prefix and ANDed with the rest, so partially typed words still find
+        results; a query ending in anything else is left to
+        `websearch_to_tsquery` whole, so operators keep their meaning.
+        """
+        split = _trailing_term(query)
+        if split:
+            head, term = split
+            tsquery = func.to_tsquery(SEARCH_TS_CONFIG, f"{term}:*")
+            if head:
+                tsquery = func.websearch_to_tsquery(SEARCH_TS_CONFIG, head).op("&&")(tsquery)
+        else:
+            tsquery = func.websearch_to_tsquery(SEARCH_TS_CONFIG, query)
+
+        relevance = func.ts_rank_cd(SwapiResource.search_vector, tsquery)
+        return [SwapiResource.search_vector.op("@@")(tsquery)], relevance
+
+    def _fuzzy_clauses(self, query: str) -> Tuple[List, object]:
+        """
+        Matches text containing a word similar to the term (`<%`, written
+        here as its commutator `%>`), which the trigram GIN index on
+        searchable_text serves. Results are ranked by word similarity, with
+        similarity to the name counted on top so close name matches lead.
+        """
+        relevance = (
+            func.word_similarity(query, SwapiResource.name)
+            + func.word_similarity(query, SwapiResource.searchable_text)
+        )
+        return [SwapiResource.searchable_text.op("%>")(query)], relevance
+
+    async def _set_fuzzy_threshold(self):
+        """Applies the similarity threshold used by `%>` to the current transaction."""
+        await self.db_session.execute(
+            select(func.set_config(
+                "pg_trgm.word_similarity_threshold", str(self.fuzzy_threshold), True
+            ))
+        )
+
+    async def _search_isolated(self, request: Dict[str, Any]) -> Union[SearchPage, Exception]:
+        """
+        Runs one search of a batch inside a savepoint, so a failing statement
+        does not abort the transaction shared with the rest of the batch.
+        """
+        try:
+            async with self.db_session.begin_nested():
+                return await self.search(**request)
+        except Exception as e:
+            return e
 
     async def search(
         self,
@@ -21,26 +186,127 @@ class PostgresSearchEngine(BaseSearchEngine):
         resource_type: Optional[str] = None,
         limit: int = 10,
         offset: int = 0,
-    ) -> List[Dict[str, Any]]:
-        """
-        Searches the swapi_resource table, ranking results that match
-        the 'name' field higher than those that match in other fields.
+        mode: Optional[SearchMode] = None,
+        after: Optional[Sequence[Any]] = None,
+        facets: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SearchPage:
         """
-        search_term = f"%{query}%"
+        Searches the swapi_resource table in the requested mode, ordering by
+        relevance and then by id.
 
-        relevance = case(
-            (SwapiResource.name.ilike(search_term), 2),
-            else_=1
-        ).label("relevance")
+        A substring search that finds fewer than `fuzzy_fallback_min_hits`
+        matches is retried in fuzzy mode, so typos still find results while
+        clean queries run a single statement.
+        """
+        mode = self.resolve_mode(mode)
+        if mode == SearchMode.fuzzy:
+            await self._set_fuzzy_threshold()
+            conditions, relevance = self._fuzzy_clauses(query)
+        elif mode == SearchMode.fulltext:
+            conditions, relevance = self._fulltext_clauses(query)
+        else:
+            conditions, relevance = self._substring_clauses(query)
 
-        stmt = select(SwapiResource.data, relevance).where(
-            SwapiResource.searchable_text.ilike(search_term)
+        page = await self._execute(
+            conditions, relevance, resource_type, limit, offset, after, mode, facets, fields
         )
+        if mode == SearchMode.substring and page.count < self.fuzzy_fallback_min_hits:
+            return await self.search(
+                query, resource_type, limit, offset,
+                mode=SearchMode.fuzzy, after=after, facets=facets, fields=fields,
+            )
+        return page
+
+    async def _execute(
+        self,
+        conditions: List,
+        relevance,
+        resource_type: Optional[str],
+        limit: int,
+        offset: int,
+        after: Optional[Sequence[Any]],
+        mode: SearchMode,
+        facets: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SearchPage:
+        """
+        Runs a search statement for the given match conditions and relevance.
 
+        The total is computed in the same statement as the page: an exact
+        `count(*) OVER ()` over the narrow (id, relevance) ranking, or a capped
+        count when SEARCH_COUNT_CAP is set. Only the rows of the page are
+        joined back to fetch their `data`. With `after`, the page seeks past
+        that (relevance, id) key instead of sorting and discarding an offset.
+        Facet counts, when requested, are another scalar subquery over the
+        matches without the type filter. With `fields`, the joined `data` is
+        projected to those keys in the database.
+        """
+        relevance = relevance.label("relevance")
+        facet_counts = self._facet_counts(conditions) if facets else None
         if resource_type:
-            stmt = stmt.where(SwapiResource.type == resource_type)
+            conditions = conditions + [SwapiResource.type == resource_type]
+
+        if self.count_cap is not None:
+            total_count = self._capped_count(conditions)
+        else:
+            total_count = func.count().over()
+
+        candidates = select(
+            SwapiResource.id, relevance, total_count.label("total_count")
+        ).where(*conditions)
+
+        # One extra row is fetched to tell whether another page follows.
+        if after is None:
+            ranked = (
+                candidates
+                .order_by(relevance.desc(), SwapiResource.id)
+                .limit(limit + 1)
+                .offset(offset)
+                .subquery()
+            )
+        else:
+            # The seek is applied outside the window so the total still
+            # covers every match, while no skipped rows are sorted or returned.
+            scored = candidates.subquery()
+            last_relevance, last_id = after
+            ranked = (
+                select(scored)
+                .where(
+                    or_(
+                        scored.c.relevance < last_relevance,
+                        and_(scored.c.relevance == last_relevance, scored.c.id > last_id),
+                    )
+                )
+                .order_by(scored.c.relevance.desc(), scored.c.id)
+                .limit(limit + 1)
+                .subquery()
+            )
+
+        data = json_projection(SwapiResource.data, fields) if fields else SwapiResource.data
+        columns = [data, ranked.c.total_count, ranked.c.relevance, ranked.c.id]
+        if facet_counts is not None:
+            columns.append(facet_counts.label("facets"))
+        stmt = (
+            select(*columns)
+            .join(ranked, SwapiResource.id == ranked.c.id)
+            .order_by(ranked.c.relevance.desc(), ranked.c.id)
+        )
 
-        stmt = stmt.order_by(relevance.desc(), SwapiResource.id).limit(limit).offset(offset)
+        result = (await self.db_session.execute(stmt)).all()
+        if result:
+            next_key = None
+            if len(result) > limit:
+                result = result[:limit]
+                next_key = [result[-1][2], result[-1][3]]
+            type_counts = (result[0][4] or {}) if facets else None
+            return self._page(
+                [row[0] for row in result], result[0][1], mode, next_key, type_counts
+            )
 
-        result = await self.db_session.execute(stmt)
-        return [row[0] for row in result.all()]
\ No newline at end of file
+        # Past the last page the statement returns no rows to carry the totals.
+        total = await self._count(conditions) if offset > 0 or after is not None else 0
+        type_counts = None
+        if facets:
+            type_counts = (await self.db_session.execute(select(facet_counts))).scalar_one() or {}
+        return self._page([], total, mode, facets=type_counts)
@@ -0,0 +1,207 @@
+import asyncio
+import logging
+import random
+import time
+from contextlib import AbstractAsyncContextManager
+from typing import Any, Callable, Dict, FrozenSet, Hashable, List, Optional, Sequence, Set, Union
+
+from swapi_search.core.metrics import LatencyHistogram
+from swapi_search.search.base import BaseSearchEngine, SearchMode, SearchPage
+
+logger = logging.getLogger(__name__)
+
+
+def _result_key(result: Dict[str, Any]) -> Hashable:
+    """Identifies a result across engines by its API url, or type and name."""
+    return result.get("url") or (result.get("type"), result.get("name"))
+
+
+def top_k_overlap(primary: List[Dict[str, Any]], secondary: List[Dict[str, Any]]) -> float:
+    """
+    The share of the larger of the two result pages found in both, ignoring
+    order. Two empty pages agree fully.
+    """
+    size = max(len(primary), len(secondary))
+    if not size:
+        return 1.0
+    shared = {_result_key(r) for r in primary} & {_result_key(r) for r in secondary}
+    return len(shared) / size
+
+
+class ShadowStats:
+    """Latency and agreement measurements of a primary and a shadow engine."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.latency: Dict[str, LatencyHistogram] = {
+            "primary": LatencyHistogram(),
+            "secondary": LatencyHistogram(),
+        }
+        self.comparisons = 0
+        self.overlap_sum = 0.0
+        self.full_overlaps = 0
+        self.count_mismatches = 0
+        self.secondary_errors = 0
+        self.skipped = 0
+        self.dropped = 0
+        self.default_mode_replays = 0
+
+    def record_comparison(self, primary: SearchPage, secondary: SearchPage):
+        overlap = top_k_overlap(primary.results, secondary.results)
+        self.comparisons += 1
+        self.overlap_sum += overlap
+        self.full_overlaps += overlap == 1.0
+        self.count_mismatches += primary.count != secondary.count
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "latency": {name: hist.snapshot() for name, hist in self.latency.items()},
+            "comparisons": self.comparisons,
+            "mean_top_k_overlap": (
+                self.overlap_sum / self.comparisons if self.comparisons else None
+            ),
+            "full_overlaps": self.full_overlaps,
+            "count_mismatches": self.count_mismatches,
+            "secondary_errors": self.secondary_errors,
+            "skipped": self.skipped,
+            "dropped": self.dropped,
+            "default_mode_replays": self.default_mode_replays,
+        }
+
+
+class ShadowSearchEngine(BaseSearchEngine):
+    """
+    Serves every search from a primary engine and replays a sample of them
+    against a secondary engine in the background.
+
+    The secondary search runs as a detached task once the primary page is
+    ready, so it never adds to request latency or affects the response;
+    its failures are only counted. Searches in a mode the secondary does not
+    support are replayed in its default mode, so an engine with other modes
+    (BM25 only ranks full-text) is still compared on the same queries.
+    Cursor pages are skipped, as their keyset is on the primary's relevance
+    scale. At most `max_pending` replays run at once, with any excess
+    dropped rather than queued.
+
+    `secondary` is a factory returning an async context manager that yields
+    the engine, so an engine needing a database session gets its own instead
+    of the request's, which is closed before the replay finishes.
+    """
+
+    def __init__(
+        self,
+        primary: BaseSearchEngine,
+        secondary: Callable[[], AbstractAsyncContextManager],
+        stats: ShadowStats,
+        sample_rate: float = 1.0,
+        max_pending: int = 16,
+    ):
+        self.primary = primary
+        self.secondary = secondary
+        self.stats = stats
+        self.sample_rate = sample_rate
+        self.max_pending = max_pending
+
+    @property
+    def supported_modes(self) -> FrozenSet[SearchMode]:
+        return self.primary.supported_modes
+
+    @property
+    def default_mode(self) -> SearchMode:
+        return self.primary.default_mode
+
+    @property
+    def max_concurrency(self) -> int:
+        return self.primary.max_concurrency
+
+    async def search(
+        self,
+        query: str,
+        resource_type: Optional[str] = None,
+        limit: int = 10,
+        offset: int = 0,
+        mode: Optional[SearchMode] = None,
+        after: Optional[Sequence[Any]] = None,
+        facets: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SearchPage:
+        """Runs the search on the primary engine and schedules its replay."""
+        request = dict(
+            query=query, resource_type=resource_type, limit=limit, offset=offset,
+            mode=self.resolve_mode(mode), after=after, facets=facets, fields=fields,
+        )
+        started = time.perf_counter()
+        page = await self.primary.search(**request)
+        self._record_primary(started, request, page)
+        return page
+
+    async def _search_isolated(self, request: Dict[str, Any]) -> Union[SearchPage, Exception]:
+        """Runs a batch item on the primary engine and replays it if it succeeded."""
+        try:
+            request = {**request, "mode": self.resolve_mode(request.get("mode"))}
+        except Exception as e:
+            return e
+        started = time.perf_counter()
+        page = await self.primary._search_isolated(request)
+        if isinstance(page, SearchPage):
+            self._record_primary(started, request, page)
+        return page
+
+    def _record_primary(self, started: float, request: Dict[str, Any], page: SearchPage):
+        self.stats.latency["primary"].record((time.perf_counter() - started) * 1000)
+        if random.random() < self.sample_rate:
+            _schedule(self._replay(request, page), self.max_pending, self.stats)
+
+    async def _replay(self, request: Dict[str, Any], primary_page: SearchPage):
+        """Runs the search on the secondary engine and records how it compares."""
+        fields = request.get("fields")
+        if fields and "url" not in fields:
+            # Results are matched across engines by url, which is not returned.
+            self.stats.skipped += 1
+            return
+        if request.get("after") is not None:
+            # The cursor's (relevance, id) key means nothing to another engine.
+            self.stats.skipped += 1
+            return
+        try:
+            async with self.secondary() as engine:
+                # Shadow the mode that actually served the response, which
+                # differs from the requested one after a fuzzy fallback.
+                mode = primary_page.mode or request["mode"]
+                if mode not in engine.supported_modes:
+                    mode = engine.default_mode
+                    self.stats.default_mode_replays += 1
+                started = time.perf_counter()
+                page = await engine.search(**{**request, "mode": mode})
+                self.stats.latency["secondary"].record((time.perf_counter() - started) * 1000)
+        except Exception as e:
+            self.stats.secondary_errors += 1
+            logger.warning(f"Shadow search for '{request['query']}' failed: {e}")
+            return
+        self.stats.record_comparison(primary_page, page)
+
+
+# Replays in flight; holding a reference keeps the tasks from being
+# garbage-collected before they finish.
+_pending: Set[asyncio.Task] = set()
+
+
+def _schedule(replay, max_pending: int, stats: ShadowStats):
+    if len(_pending) >= max_pending:
+        replay.close()
+        stats.dropped += 1
+        return
+    task = asyncio.get_running_loop().create_task(replay)
+    _pending.add(task)
+    task.add_done_callback(_pending.discard)
+
+
+async def drain_pending():
+    """Waits for replays in flight, e.g. at shutdown or in tests."""
+    if _pending:
+        await asyncio.gather(*list(_pending), return_exceptions=True)
+
+
+shadow_stats = ShadowStats()
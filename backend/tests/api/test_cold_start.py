@@ -0,0 +1,90 @@
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from scripts.build_openapi import build_openapi
+from scripts.profile_startup import parse_importtime, profile_cold_start
+from swapi_search.core.config import settings
+from swapi_search.core.startup import schema_revision_path, warm_up
+from swapi_search.main import create_app
+
+# Budgets for importing the app in a fresh interpreter, with headroom over
+# what it takes today (about 1s and 65MB); a regression past them means a
+# heavy import or eager setup crept into the startup path.
+COLD_START_BUDGET_SECONDS = 3.0
+COLD_START_BUDGET_MB = 128
+
+
+def test_app_cold_starts_within_time_and_memory_budgets():
+    profile = profile_cold_start(env={"DOCS_ENABLED": "false"}, import_profile=False)
+
+    assert profile["import_seconds"] < COLD_START_BUDGET_SECONDS
+    assert profile["peak_rss_mb"] < COLD_START_BUDGET_MB
+    # Engines and optional heavy dependencies wait for their first use.
+    assert profile["engines_created"] == []
+    assert not profile["numpy_loaded"]
+
+
+def test_parse_importtime_skips_the_header():
+    output = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   json.decoder\n"
+        "import time:       300 |        420 | json\n"
+    )
+
+    assert parse_importtime(output) == [("json.decoder", 120, 120), ("json", 300, 420)]
+
+
+def test_prebuilt_schema_is_served_and_docs_can_be_disabled(tmp_path, monkeypatch):
+    schema_path = tmp_path / "openapi.json"
+    build_openapi(str(schema_path))
+    monkeypatch.setattr(settings, "DOCS_ENABLED", False)
+    monkeypatch.setattr(settings, "OPENAPI_SCHEMA_PATH", str(schema_path))
+    app = create_app()
+    client = TestClient(app)
+
+    response = client.get("/api/v1/openapi.json")
+
+    assert response.status_code == 200
+    assert response.json() == json.loads(schema_path.read_text())
+    assert "/api/v1/people" in response.json()["paths"]
+    assert client.get("/docs").status_code == 404
+    assert client.get("/redoc").status_code == 404
+
+
+@pytest.mark.parametrize("revision", [None, "built-from-other-code"])
+def test_prebuilt_schema_without_a_matching_revision_is_generated_instead(
+    tmp_path, monkeypatch, revision
+):
+    schema_path = tmp_path / "openapi.json"
+    schema_path.write_text('{"info": {"title": "stale", "version": "1.0.0"}, "paths": {}}')
+    if revision is not None:
+        schema_revision_path(str(schema_path)).write_text(revision)
+    monkeypatch.setattr(settings, "OPENAPI_SCHEMA_PATH", str(schema_path))
+
+    schema = TestClient(create_app()).get("/api/v1/openapi.json").json()
+
+    assert schema["info"]["title"] != "stale"
+    assert "/api/v1/people" in schema["paths"]
+
+
+@pytest.mark.asyncio
+async def test_warm_up_requests_each_path_and_survives_failures():
+    app = FastAPI()
+    requested = []
+
+    @app.get("/ok")
+    async def ok():
+        requested.append("/ok")
+        return {}
+
+    @app.get("/broken")
+    async def broken():
+        requested.append("/broken")
+        raise RuntimeError("boom")
+
+    await warm_up(app, ["/broken", "/ok"])
+
+    assert requested == ["/broken", "/ok"]
@@ -0,0 +1,124 @@
+import gzip
+import re
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.datastructures import QueryParams
+
+from swapi_search.api.v1.compression import (
+    CompressedResponseCache,
+    PrecompressedResponseMiddleware,
+    admission_policy,
+    negotiate_encoding,
+)
+
+BODY = {"results": [{"name": "Luke Skywalker"}] * 100}
+
+
+def make_client(version=1, min_size=64):
+    app = FastAPI()
+    app.state.calls = 0
+    app.state.cache = CompressedResponseCache(max_bytes=1_000_000)
+    app.add_middleware(
+        PrecompressedResponseMiddleware,
+        path_pattern=re.compile(r"/api/v1/(search|people(?:/[^/]+)?)"),
+        version_provider=lambda: version,
+        cache=app.state.cache,
+        admission=admission_policy(["people"], hot_search_requests=2),
+        min_size=min_size,
+    )
+
+    @app.get("/api/v1/people")
+    async def people(name: str = None):
+        app.state.calls += 1
+        return BODY
+
+    @app.get("/api/v1/search")
+    async def search(q: str):
+        app.state.calls += 1
+        return BODY
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip, deflate", "gzip"),
+    ("gzip;q=0, identity", None),
+    ("*", "gzip"),
+    ("deflate", None),
+    (None, None),
+])
+def test_negotiate_encoding(header, expected):
+    assert negotiate_encoding(header, ("gzip",)) == expected
+
+
+def test_negotiate_encoding_prefers_higher_weight_then_server_order():
+    assert negotiate_encoding("gzip;q=1.0, br;q=0.5", ("br", "gzip")) == "gzip"
+    assert negotiate_encoding("gzip, br", ("br", "gzip")) == "br"
+
+
+def test_admission_policy():
+    policy = admission_policy(["people"], hot_search_requests=3)
+
+    assert policy("/api/v1/people/1", QueryParams("")) == 1
+    assert policy("/api/v1/people", QueryParams("limit=100&offset=0")) == 1
+    assert policy("/api/v1/people", QueryParams("name=luke")) is None
+    assert policy("/api/v1/search", QueryParams("q=luke")) == 3
+
+
+def test_unfiltered_page_is_compressed_once_and_served_from_cache():
+    client = make_client()
+
+    first = client.get("/api/v1/people?limit=100", headers={"Accept-Encoding": "gzip"})
+    second = client.get("/api/v1/people?limit=100", headers={"Accept-Encoding": "gzip"})
+
+    assert first.headers["content-encoding"] == second.headers["content-encoding"] == "gzip"
+    assert "accept-encoding" in first.headers["vary"].lower()
+    assert first.json() == second.json() == BODY
+    assert client.app.state.calls == 1
+    assert client.app.state.cache.hits == 1
+
+
+def test_identity_filtered_and_small_responses_are_not_compressed():
+    client = make_client(min_size=10**6)
+
+    identity = client.get("/api/v1/people", headers={"Accept-Encoding": "identity"})
+    filtered = make_client().get("/api/v1/people?name=l", headers={"Accept-Encoding": "gzip"})
+    small = client.get("/api/v1/people", headers={"Accept-Encoding": "gzip"})
+
+    for response in (identity, filtered, small):
+        assert "content-encoding" not in response.headers
+        assert "accept-encoding" in response.headers["vary"].lower()
+        assert response.json() == BODY
+
+
+def test_searches_are_cached_once_hot():
+    client = make_client()
+    headers = {"Accept-Encoding": "gzip"}
+
+    cold = client.get("/api/v1/search?q=luke", headers=headers)
+    hot = client.get("/api/v1/search?q=luke", headers=headers)
+    cached = client.get("/api/v1/search?q=luke", headers=headers)
+
+    assert "content-encoding" not in cold.headers
+    assert hot.headers["content-encoding"] == cached.headers["content-encoding"] == "gzip"
+    assert client.app.state.calls == 2
+
+
+def test_new_dataset_version_drops_cached_variants():
+    cache = CompressedResponseCache(max_bytes=100)
+    cache.put("a", 1, [], b"x" * 60)
+    cache.put("b", 1, [], b"x" * 60)
+
+    assert cache.get("a", 1) is None  # evicted to stay within max_bytes
+    assert cache.get("b", 1) == ([], b"x" * 60)
+    assert cache.get("b", 2) is None
+    assert cache.size_bytes == 0
+
+
+def test_gzip_variants_are_deterministic():
+    from swapi_search.api.v1.compression import compress
+
+    assert compress(b"luke" * 100, "gzip") == compress(b"luke" * 100, "gzip")
+    assert gzip.decompress(compress(b"luke", "gzip")) == b"luke"
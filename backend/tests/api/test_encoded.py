@@ -0,0 +1,41 @@
+import json
+
+from swapi_search.api.v1.encoded import encoded_page_response
+from swapi_search.api.v1.schemas import PaginatedResponse, PlanetResponse
+
+TATOOINE = {
+    "name": "Tatooine",
+    "rotation_period": "23",
+    "orbital_period": "304",
+    "diameter": "10465",
+    "climate": "arid",
+    "gravity": "1 standard",
+    "terrain": "desert",
+    "surface_water": "1",
+    "population": "200000",
+    "residents": [{"url": "/api/v1/people/1", "name": "Luke Skywalker"}],
+    "films": [{"url": "/api/v1/films/1", "title": "A New Hope"}],
+    "url": "/api/v1/planets/1",
+    "type": "planets",
+}
+
+
+def test_spliced_page_matches_the_response_model_serialization():
+    """Pre-encoded and per-request encoded items produce the same bytes as the model."""
+    pre_encoded = PlanetResponse.model_validate(TATOOINE).model_dump_json()
+    expected = PaginatedResponse[PlanetResponse](
+        count=2, limit=2, offset=0, next_cursor="abc", results=[TATOOINE, TATOOINE]
+    ).model_dump_json()
+
+    response = encoded_page_response(PlanetResponse, 2, 2, 0, "abc", [pre_encoded, TATOOINE])
+
+    assert response.body.decode() == expected
+    assert response.media_type == "application/json"
+
+
+def test_spliced_empty_last_page_is_valid_json():
+    response = encoded_page_response(PlanetResponse, 0, 10, 30, None, [])
+
+    assert json.loads(response.body) == {
+        "count": 0, "limit": 10, "offset": 30, "next_cursor": None, "results": [],
+    }
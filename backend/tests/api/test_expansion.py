@@ -0,0 +1,84 @@
+import json
+
+import pytest
+from fastapi import HTTPException
+
+from swapi_search.api.v1.expansion import expand_relations, parse_expand, relation_fields
+from swapi_search.api.v1.schemas import PersonResponse
+
+LUKE = {
+    "name": "Luke Skywalker",
+    "homeworld": {"url": "https://swapi.info/api/planets/1/", "name": "Tatooine"},
+    "films": [
+        {"url": "https://swapi.info/api/films/1/", "title": "A New Hope"},
+        {"url": "https://swapi.info/api/films/2/", "title": "The Empire Strikes Back"},
+    ],
+}
+LEIA = {
+    "name": "Leia Organa",
+    "homeworld": {"url": "https://swapi.info/api/planets/2/", "name": "Alderaan"},
+    "films": [{"url": "https://swapi.info/api/films/1/", "title": "A New Hope"}],
+}
+
+
+# A film the ETL stored without pre-encoded JSON, with keys its response omits.
+A_NEW_HOPE = {
+    "title": "A New Hope",
+    "episode_id": 4,
+    "opening_crawl": "It is a period of civil war...",
+    "director": "George Lucas",
+    "producer": "Gary Kurtz, Rick McCallum",
+    "release_date": "1977-05-25",
+    "characters": [], "planets": [], "starships": [], "vehicles": [], "species": [],
+    "url": "/api/v1/films/1",
+    "type": "films",
+}
+
+
+class FakeRepository:
+    """Serves related resources by key and records each batched lookup."""
+
+    def __init__(self, resources):
+        self.resources = resources
+        self.lookups = []
+
+    async def get_resources_by_keys(self, keys, encoded=False):
+        assert encoded
+        self.lookups.append(set(keys))
+        return {key: self.resources[key] for key in keys if key in self.resources}
+
+
+def test_relation_fields():
+    assert relation_fields(PersonResponse) == ["homeworld", "films", "species", "vehicles", "starships"]
+
+
+def test_parse_expand_rejects_non_relations():
+    assert parse_expand("films, homeworld", PersonResponse) == ["films", "homeworld"]
+    with pytest.raises(HTTPException):
+        parse_expand("height", PersonResponse)
+    with pytest.raises(HTTPException):
+        parse_expand("films", PersonResponse, fields=["name"])
+
+
+@pytest.mark.asyncio
+async def test_page_relations_are_resolved_in_one_lookup():
+    repo = FakeRepository({
+        ("planets", 1): json.dumps({"name": "Tatooine", "climate": "arid"}),
+        ("planets", 2): json.dumps({"name": "Alderaan", "climate": "temperate"}),
+        ("films", 1): A_NEW_HOPE,
+    })
+
+    expanded = await expand_relations([LUKE, LEIA], ["homeworld", "films"], repo)
+
+    assert repo.lookups == [
+        {("planets", 1), ("planets", 2), ("films", 1), ("films", 2)}
+    ]
+    assert expanded[0]["homeworld"]["climate"] == "arid"
+    assert expanded[1]["homeworld"]["climate"] == "temperate"
+    assert expanded[0]["films"][0]["episode_id"] == 4
+    # Resources are shaped as their detail endpoint sends them.
+    assert "opening_crawl" not in expanded[0]["films"][0]
+    assert "type" not in expanded[0]["films"][0]
+    # Unresolved relations are kept as references, and the inputs are untouched.
+    assert expanded[0]["films"][1] == LUKE["films"][1]
+    assert "climate" not in LUKE["homeworld"]
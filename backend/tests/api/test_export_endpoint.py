@@ -0,0 +1,44 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from swapi_search.core.config import settings
+from swapi_search.repositories.memory import in_memory_resource_repository
+
+
+@pytest.fixture
+def dataset(monkeypatch):
+    monkeypatch.setattr(settings, "RESOURCE_REPOSITORY", "memory")
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 2)
+    in_memory_resource_repository.load([
+        {"id": i, "swapi_id": i, "type": "people", "name": f"P{i}", "data": {"name": f"P{i}"}}
+        for i in (3, 1, 2)
+    ] + [{"id": 9, "swapi_id": 1, "type": "films", "name": "F1", "data": {"title": "F1"}}])
+    yield
+    in_memory_resource_repository._tables = None
+
+
+def test_export_streams_one_document_per_line(client: TestClient, dataset):
+    response = client.get("/api/v1/export", params={"type": "people"}, headers={"Accept-Encoding": "identity"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert "swapi-people.ndjson" in response.headers["content-disposition"]
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        {"name": "P1"}, {"name": "P2"}, {"name": "P3"},
+    ]
+
+
+def test_export_of_everything_is_gzipped_when_accepted(client: TestClient, dataset):
+    response = client.get("/api/v1/export", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    # httpx decodes the body; check the lines survive the chunked compression.
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        {"title": "F1"}, {"name": "P1"}, {"name": "P2"}, {"name": "P3"},
+    ]
+
+
+def test_export_rejects_unknown_types(client: TestClient):
+    assert client.get("/api/v1/export", params={"type": "droids"}).status_code == 422
@@ -0,0 +1,27 @@
+import pytest
+from fastapi import HTTPException
+
+from swapi_search.api.v1.fieldsets import parse_fields, projected_model
+from swapi_search.api.v1.schemas import FilmResponse
+
+
+def test_parse_fields_keeps_request_order_without_duplicates():
+    assert parse_fields(" title,url,title ", FilmResponse.model_fields) == ["title", "url"]
+    assert parse_fields(None, FilmResponse.model_fields) is None
+
+
+@pytest.mark.parametrize("fields", ["title,opening_crawl_typo", ",", ""])
+def test_parse_fields_rejects_unknown_or_empty_fields(fields):
+    with pytest.raises(HTTPException) as exc_info:
+        parse_fields(fields, FilmResponse.model_fields)
+    assert exc_info.value.status_code == 400
+
+
+def test_projected_model_only_validates_requested_fields():
+    Model = projected_model(FilmResponse, ["url", "title"])
+
+    item = Model.model_validate({"title": "A New Hope", "url": "/api/v1/films/1"})
+
+    assert set(Model.model_fields) == {"title", "url"}
+    assert item.model_dump() == {"title": "A New Hope", "url": "/api/v1/films/1"}
+    assert projected_model(FilmResponse, ["title", "url"]) is Model
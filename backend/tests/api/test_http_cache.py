@@ -0,0 +1,118 @@
+import gzip
+import re
+from datetime import datetime, timezone
+
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+from swapi_search.api.v1.http_cache import DatasetCacheMiddleware
+from swapi_search.core.config import settings
+from swapi_search.core.startup import build_revision
+
+LOADED_AT = datetime(2025, 7, 22, 10, 41, 7, 500000, tzinfo=timezone.utc)
+
+
+def make_client(version=3):
+    app = FastAPI()
+    app.state.calls = 0
+    app.add_middleware(
+        DatasetCacheMiddleware,
+        path_pattern=re.compile(r"/api/v1/(search|films(?:/[^/]+)?)"),
+        version_provider=lambda: version,
+        loaded_at_provider=lambda: LOADED_AT,
+        max_age=120,
+        revision="1.0.0",
+    )
+
+    @app.get("/api/v1/films")
+    async def films():
+        app.state.calls += 1
+        return {"results": []}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    return TestClient(app)
+
+
+def test_responses_carry_validators_for_the_dataset_version():
+    response = make_client().get("/api/v1/films")
+
+    assert response.status_code == 200
+    assert response.headers["etag"] == '"1.0.0-3"'
+    assert response.headers["cache-control"] == "public, max-age=120"
+    assert response.headers["last-modified"] == "Tue, 22 Jul 2025 10:41:07 GMT"
+    assert "etag" not in make_client().get("/health").headers
+
+
+def test_matching_etag_is_answered_before_the_route_runs():
+    client = make_client()
+
+    response = client.get("/api/v1/films", headers={"If-None-Match": 'W/"x", "1.0.0-3"'})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == '"1.0.0-3"'
+    assert client.app.state.calls == 0
+
+
+def test_stale_validators_get_a_full_response():
+    client = make_client(version=4)
+
+    stale_etag = client.get("/api/v1/films", headers={"If-None-Match": '"1.0.0-3"'})
+    # If-Modified-Since is ignored when If-None-Match is present.
+    both = client.get(
+        "/api/v1/films",
+        headers={"If-None-Match": '"1.0.0-3"', "If-Modified-Since": "Tue, 22 Jul 2025 10:41:07 GMT"},
+    )
+
+    assert stale_etag.status_code == both.status_code == 200
+    assert client.app.state.calls == 2
+
+
+def test_if_modified_since_compares_whole_seconds():
+    client = make_client()
+
+    fresh = client.get("/api/v1/films", headers={"If-Modified-Since": "Tue, 22 Jul 2025 10:41:07 GMT"})
+    stale = client.get("/api/v1/films", headers={"If-Modified-Since": "Tue, 22 Jul 2025 10:41:06 GMT"})
+    invalid = client.get("/api/v1/films", headers={"If-Modified-Since": "yesterday"})
+
+    assert fresh.status_code == 304
+    assert stale.status_code == invalid.status_code == 200
+
+
+def test_unknown_version_passes_requests_through():
+    response = make_client(version=None).get("/api/v1/films", headers={"If-None-Match": "*"})
+
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+
+
+def test_compressed_variants_get_their_own_etag():
+    app = FastAPI()
+    app.add_middleware(
+        DatasetCacheMiddleware,
+        path_pattern=re.compile(r"/api/v1/films"),
+        version_provider=lambda: 3,
+    )
+
+    @app.get("/api/v1/films")
+    async def films():
+        return Response(gzip.compress(b"{}"), headers={"Content-Encoding": "gzip"})
+
+    client = TestClient(app)
+    response = client.get("/api/v1/films")
+    revalidated = client.get("/api/v1/films", headers={"If-None-Match": '"3-gzip"'})
+
+    assert response.headers["etag"] == '"3-gzip"'
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == '"3-gzip"'
+
+
+def test_revision_is_the_build_id_or_a_source_digest(monkeypatch):
+    monkeypatch.setattr(settings, "BUILD_ID", None)
+    assert re.fullmatch(r"[0-9a-f]{16}", build_revision())
+
+    monkeypatch.setattr(settings, "BUILD_ID", "4f2c1e9")
+    assert build_revision() == "4f2c1e9"
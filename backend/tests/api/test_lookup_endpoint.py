@@ -0,0 +1,77 @@
+from fastapi.testclient import TestClient
+import pytest
+
+from swapi_search.main import app
+from swapi_search.api.v1.dependencies import get_resource_repository
+from swapi_search.api.v1.schemas import PlanetResponse
+
+# A resource the ETL stored without pre-encoded JSON, with internal keys.
+TATOOINE = {
+    "name": "Tatooine",
+    "rotation_period": "23",
+    "orbital_period": "304",
+    "diameter": "10465",
+    "climate": "arid",
+    "gravity": "1 standard",
+    "terrain": "desert",
+    "surface_water": "1",
+    "population": "200000",
+    "residents": [{"url": "/api/v1/people/1", "name": "Luke Skywalker"}],
+    "films": [{"url": "/api/v1/films/1", "title": "A New Hope"}],
+    "url": "/api/v1/planets/1",
+    "type": "planets",
+}
+
+
+class FakeRepository:
+    """Serves resources by (type, swapi_id) and records each batched lookup."""
+
+    resources = {
+        ("people", 1): '{"name":"Luke Skywalker"}',
+        ("planets", 1): TATOOINE,
+    }
+
+    def __init__(self):
+        self.lookups = []
+
+    async def get_resources_by_keys(self, keys, encoded=False):
+        assert encoded
+        self.lookups.append(set(keys))
+        return {key: self.resources[key] for key in keys if key in self.resources}
+
+
+@pytest.fixture
+def repo():
+    repo = FakeRepository()
+    app.dependency_overrides[get_resource_repository] = lambda: repo
+    yield repo
+    app.dependency_overrides.clear()
+
+
+def test_lookup_preserves_order_and_reports_misses(client: TestClient, repo: FakeRepository):
+    items = [
+        {"type": "planets", "id": 1},
+        {"type": "people", "id": 99},
+        {"type": "people", "id": 1},
+        {"type": "planets", "id": 1},
+    ]
+
+    response = client.post("/api/v1/resources/lookup", json={"items": items})
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [(r["type"], r["id"], r["found"]) for r in results] == [
+        ("planets", 1, True), ("people", 99, False), ("people", 1, True), ("planets", 1, True),
+    ]
+    assert results[1]["data"] is None
+    assert results[2]["data"] == {"name": "Luke Skywalker"}
+    # Resources are shaped as their detail endpoint sends them.
+    assert results[0]["data"] == PlanetResponse.model_validate(TATOOINE).model_dump(mode="json")
+    assert "type" not in results[0]["data"]
+    assert repo.lookups == [{("planets", 1), ("people", 99), ("people", 1)}]
+
+
+def test_lookup_rejects_unknown_types(client: TestClient, repo: FakeRepository):
+    response = client.post("/api/v1/resources/lookup", json={"items": [{"type": "droids", "id": 1}]})
+
+    assert response.status_code == 422
@@ -1,3 +1,5 @@
+from typing import Generator
+
 from fastapi.testclient import TestClient
 import pytest
 
@@ -57,7 +59,7 @@ def test_search_pagination_limit(client: TestClient):
 
     assert response.status_code == 200
     data = response.json()
-    assert data["count"] == 2 
+    assert data["count"] == 5
     assert len(data["results"]) == 2
     assert data["results"][0]["name"] == "Luke Skywalker"
     assert data["results"][1]["name"] == "Leia Organa"
@@ -84,4 +86,52 @@ def test_search_endpoint_invalid_type_filter(client: TestClient):
     """Tests that an invalid 'type' enum value returns a 422 error."""
     response = client.get("/api/v1/search?q=test&type=invalid_type")
     assert response.status_code == 422
-    assert "Input should be" in response.text
\ No newline at end of file
+    assert "Input should be" in response.text
+
+def test_search_facets_ignore_type_filter(client: TestClient):
+    """Tests that facet counts cover every type, regardless of the type filter."""
+    response = client.get("/api/v1/search?q=test&type=people&facets=true")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 2
+    assert data["facets"] == {
+        "films": 0, "people": 2, "planets": 1, "species": 0, "starships": 1, "vehicles": 1,
+    }
+
+
+class FlakySearchEngine(MockSearchEngine):
+    """A mock engine whose searches for 'boom' fail."""
+
+    async def search(self, query: str, *args, **kwargs):
+        if query == "boom":
+            raise ValueError("Simulated search engine error")
+        return await super().search(query, *args, **kwargs)
+
+
+@pytest.fixture
+def flaky_search_engine() -> Generator[FlakySearchEngine, None, None]:
+    """Serves searches from a FlakySearchEngine, clearing its results afterwards."""
+    FlakySearchEngine.set_results(MOCK_RESULTS)
+    engine = FlakySearchEngine()
+    app.dependency_overrides[get_search_engine] = lambda: engine
+    yield engine
+    FlakySearchEngine.clear()
+
+
+def test_search_batch_returns_results_in_order(
+    client: TestClient, flaky_search_engine: FlakySearchEngine
+):
+    """Tests that a batch runs every query and isolates per-item failures."""
+    response = client.post("/api/v1/search/batch", json={"queries": [
+        {"q": "luke", "type": "people", "limit": 1},
+        {"q": "boom"},
+        {"q": "tatooine", "type": "planets"},
+    ]})
+
+    assert response.status_code == 200
+    items = response.json()["results"]
+    assert [item["status"] for item in items] == [200, 500, 200]
+    assert items[0]["result"]["count"] == 2
+    assert items[0]["result"]["results"][0]["name"] == "Luke Skywalker"
+    assert items[2]["result"]["results"][0]["name"] == "Tatooine"
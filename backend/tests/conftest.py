@@ -1,9 +1,9 @@
 import pytest
-from typing import AsyncGenerator
+from typing import Generator
 
 from fastapi.testclient import TestClient
 from swapi_search.main import app
-from swapi_search.search.base import BaseSearchEngine
+from swapi_search.search.base import BaseSearchEngine, SearchMode, SearchPage, project
 
 @pytest.fixture(scope="module")
 def client() -> TestClient:
@@ -15,7 +15,7 @@ class MockSearchEngine(BaseSearchEngine):
     _results = []
     _should_raise_error = False
     
-    async def search(self, query: str, resource_type: str | None = None, limit: int = 10, offset: int = 0):
+    async def search(self, query: str, resource_type: str | None = None, limit: int = 10, offset: int = 0, mode: SearchMode | None = None, after=None, facets: bool = False, fields=None):
         if self._should_raise_error:
             raise ValueError("Simulated search engine error")
         
@@ -23,7 +23,17 @@ class MockSearchEngine(BaseSearchEngine):
         if resource_type:
             filtered_results = [r for r in self._results if r.get("type") == resource_type]
             
-        return filtered_results[offset : offset + limit]
+        type_counts = None
+        if facets:
+            type_counts = {}
+            for r in self._results:
+                type_counts[r.get("type")] = type_counts.get(r.get("type"), 0) + 1
+
+        return SearchPage(
+            results=[project(r, fields) for r in filtered_results[offset : offset + limit]],
+            count=len(filtered_results),
+            facets=type_counts,
+        )
 
     @classmethod
     def set_results(cls, results):
@@ -35,7 +45,7 @@ class MockSearchEngine(BaseSearchEngine):
         cls._should_raise_error = False
 
 @pytest.fixture
-async def mock_search_engine() -> AsyncGenerator[MockSearchEngine, None]:
+def mock_search_engine() -> Generator[MockSearchEngine, None, None]:
     """
     Provides a clean instance of the MockSearchEngine for each test.
     """
@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+from swapi_search.db import dataset
+from swapi_search.db.dataset import DATASET_CHANNEL, DatasetWatcher
+
+
+class ListenConnection:
+    """A stand-in asyncpg connection that can be dropped by the server."""
+
+    def __init__(self):
+        self.channels = []
+        self.closed = False
+        self._on_termination = []
+
+    def add_termination_listener(self, callback):
+        self._on_termination.append(callback)
+
+    async def add_listener(self, channel, callback):
+        self.channels.append(channel)
+
+    def drop(self):
+        for callback in self._on_termination:
+            callback(self)
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_listener_holds_its_own_connection_and_reconnects_when_it_is_lost(monkeypatch):
+    connections = []
+    connected = asyncio.Event()
+
+    async def connect_unpooled():
+        connections.append(ListenConnection())
+        connected.set()
+        return connections[-1]
+
+    monkeypatch.setattr(dataset, "connect_unpooled", connect_unpooled)
+    watcher = DatasetWatcher(poll_interval=60, listen=True)
+    task = asyncio.create_task(watcher._listen())
+
+    await connected.wait()
+    connected.clear()
+    connections[0].drop()
+    await connected.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert len(connections) == 2
+    assert all(connection.channels == [DATASET_CHANNEL] for connection in connections)
+    assert all(connection.closed for connection in connections)
@@ -0,0 +1,73 @@
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import create_engine, exc, text
+from sqlalchemy.pool import NullPool, QueuePool
+
+from swapi_search.core.config import Settings, settings
+from swapi_search.db.session import (
+    PoolMetrics, _count_invalidations, _instrumented, engine_options,
+)
+
+
+def test_queue_mode_sizes_the_pool_and_pings_connections(monkeypatch):
+    monkeypatch.setattr(settings, "DB_POOL_MODE", "queue")
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 3)
+
+    options = engine_options(async_=False, metrics=PoolMetrics())
+
+    assert issubclass(options["poolclass"], QueuePool)
+    assert options["pool_size"] == 3
+    assert options["pool_pre_ping"] is True
+    assert options["pool_recycle"] == settings.DB_POOL_RECYCLE_SECONDS
+
+
+def test_null_mode_keeps_no_connections(monkeypatch):
+    monkeypatch.setattr(settings, "DB_POOL_MODE", "null")
+    monkeypatch.setattr(settings, "DB_STATEMENT_CACHE_ENABLED", False)
+
+    options = engine_options(async_=True, metrics=PoolMetrics())
+
+    assert issubclass(options["poolclass"], NullPool)
+    assert "pool_size" not in options
+    assert options["connect_args"]["statement_cache_size"] == 0
+
+
+@pytest.mark.parametrize("pool_mode, listen", [("queue", True), ("null", False)])
+def test_dataset_listen_defaults_to_on_only_with_a_connection_pool(pool_mode, listen):
+    assert Settings(DB_POOL_MODE=pool_mode).DATASET_LISTEN_ENABLED is listen
+
+
+def test_dataset_listen_is_rejected_without_a_connection_pool():
+    with pytest.raises(ValidationError, match="DATASET_LISTEN_ENABLED"):
+        Settings(DB_POOL_MODE="null", DATASET_LISTEN_ENABLED=True)
+
+
+def test_instrumented_pool_records_checkouts_and_timeouts():
+    metrics = PoolMetrics()
+    engine = create_engine(
+        "sqlite://",
+        poolclass=_instrumented(QueuePool, metrics),
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.01,
+    )
+    _count_invalidations(engine.pool, metrics)
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        assert metrics.in_use == 1
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+
+    snapshot = metrics.snapshot(engine.pool)
+    assert snapshot["in_use"] == 0
+    assert snapshot["peak_in_use"] == 1
+    assert snapshot["timeouts"] == 1
+    assert snapshot["checkout_wait"]["count"] == 2
+    assert snapshot["pool_size"] == 1
+    assert snapshot["idle"] == 1
+
+    with engine.connect() as conn:
+        conn.invalidate()
+    assert metrics.invalidations == 1
+    assert metrics.in_use == 0
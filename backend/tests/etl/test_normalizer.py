@@ -1,4 +1,6 @@
-from scripts.etl.normalizer import DataNormalizer
+import json
+
+from scripts.etl.normalizer import DataNormalizer, encode_resource, parse_number
 
 # Sample raw data mimicking the structure from SWAPI
 SAMPLE_RAW_DATA = {
@@ -79,4 +81,32 @@ def test_data_normalizer_structure():
     assert "name" in first_record
     assert "data" in first_record
     assert "searchable_text" in first_record
-    assert isinstance(first_record["data"], dict)
\ No newline at end of file
+    assert isinstance(first_record["data"], dict)
+
+def test_parse_number():
+    """
+    Tests that SWAPI's numeric strings are parsed and unknown values are not.
+    """
+    assert parse_number("1,000") == 1000
+    assert parse_number("78.2") == 78.2
+    assert parse_number("200000") == 200000
+    assert parse_number("unknown") is None
+    assert parse_number("n/a") is None
+    assert parse_number("30-165") is None
+    assert parse_number(None) is None
+
+def test_encode_resource_validates_with_the_response_model():
+    """
+    Tests that resources are encoded as the API serves them, and left to the
+    API when they do not validate.
+    """
+    film = {
+        "title": "A New Hope", "episode_id": 4, "director": "George Lucas",
+        "producer": "Gary Kurtz", "release_date": "1977-05-25", "characters": [],
+        "planets": [], "starships": [], "vehicles": [], "species": [],
+        "url": "/api/v1/films/1", "type": "films", "opening_crawl": "...",
+    }
+    assert json.loads(encode_resource("films", film)) == {
+        key: value for key, value in film.items() if key not in ("type", "opening_crawl")
+    }
+    assert encode_resource("films", {"title": "A New Hope"}) is None
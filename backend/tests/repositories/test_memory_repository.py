@@ -0,0 +1,90 @@
+import pytest
+
+from swapi_search.repositories.memory import InMemoryResourceRepository
+
+
+def person(swapi_id, name, height=None, homeworld="Tatooine", gender="male"):
+    return {
+        "id": swapi_id,
+        "swapi_id": swapi_id,
+        "type": "people",
+        "name": name,
+        "data": {
+            "name": name,
+            "gender": gender,
+            "homeworld": {"url": "http://x/planets/1/", "name": homeworld},
+        },
+        "height": height,
+    }
+
+
+@pytest.fixture
+def repo():
+    repo = InMemoryResourceRepository()
+    repo.load([
+        person(3, "R2-D2", height=96, gender="n/a", homeworld="Naboo"),
+        person(1, "Luke Skywalker", height=172),
+        person(4, "Darth Vader", height=202),
+        person(2, "C-3PO", height=None),
+        {"id": 5, "swapi_id": 1, "type": "films", "name": "A New Hope",
+         "data": {"title": "A New Hope", "director": "George Lucas"}},
+    ])
+    return repo
+
+
+@pytest.mark.asyncio
+async def test_browse_orders_by_swapi_id_and_pages_by_cursor(repo):
+    first = await repo.get_all_resources("people", limit=2, offset=0)
+    assert [r["name"] for r in first.results] == ["Luke Skywalker", "C-3PO"]
+    assert first.count == 4
+    assert first.next_key == [2]
+
+    second = await repo.get_all_resources("people", limit=2, offset=0, after=first.next_key)
+    assert [r["name"] for r in second.results] == ["R2-D2", "Darth Vader"]
+    assert second.next_key is None
+
+
+@pytest.mark.asyncio
+async def test_filters_are_case_insensitive_substrings(repo):
+    page = await repo.get_all_resources(
+        "people", limit=10, offset=0, filters={"homeworld": "TATOO", "name": "d"}
+    )
+    assert [r["name"] for r in page.results] == ["Darth Vader"]
+    assert page.count == 1
+    assert await repo.count_resources("films", {"director": "lucas"}) == 1
+    assert await repo.count_resources("people", {"min_height": 100, "max_height": 180}) == 1
+
+
+@pytest.mark.asyncio
+async def test_sort_puts_unknown_values_last_in_both_directions(repo):
+    asc = await repo.get_all_resources("people", limit=10, offset=0, sort="height")
+    desc = await repo.get_all_resources(
+        "people", limit=2, offset=0, sort="height", descending=True
+    )
+    assert [r["name"] for r in asc.results] == ["R2-D2", "Luke Skywalker", "Darth Vader", "C-3PO"]
+    assert [r["name"] for r in desc.results] == ["Darth Vader", "Luke Skywalker"]
+    assert desc.next_key == [172, 1]
+
+    rest = await repo.get_all_resources(
+        "people", limit=2, offset=0, sort="height", descending=True, after=desc.next_key
+    )
+    assert [r["name"] for r in rest.results] == ["R2-D2", "C-3PO"]
+
+
+@pytest.mark.asyncio
+async def test_detail_lookup_and_projection(repo):
+    assert await repo.get_resource_by_id("people", 3, fields=["name"]) == {"name": "R2-D2"}
+    assert await repo.get_resource_by_id("people", 99) is None
+    found = await repo.get_resources_by_keys([("films", 1), ("people", 99)])
+    assert list(found) == [("films", 1)]
+
+
+@pytest.mark.asyncio
+async def test_reload_swaps_the_whole_dataset():
+    repo = InMemoryResourceRepository()
+    assert (await repo.get_all_resources("people", limit=10, offset=0)).count == 0
+
+    repo.load([person(1, "Luke Skywalker")])
+    repo.load([person(2, "C-3PO")])
+    assert await repo.get_resource_by_id("people", 1) is None
+    assert await repo.count_resources("people") == 1
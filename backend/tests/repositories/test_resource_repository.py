@@ -0,0 +1,187 @@
+from collections import namedtuple
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from swapi_search.db.models import SwapiResource
+from swapi_search.repositories.resource import ResourceRepository, TypeCountCache
+
+
+def compile_filters(filters) -> str:
+    """Compiles filters as sent to asyncpg, with the keys rendered as literals."""
+    stmt = ResourceRepository(db_session=None)._apply_filters(select(SwapiResource.id), filters)
+    return str(
+        stmt.compile(dialect=postgresql.asyncpg.dialect(), compile_kwargs={"render_postcompile": True})
+    )
+
+
+def test_filters_match_the_indexed_expressions():
+    """Filters compare the same `->>` text their trigram indexes are built on."""
+    sql = compile_filters(
+        {"director": "Lucas", "homeworld": "Tatooine", "name": "Luke", "producer": None}
+    )
+
+    # The keys must be literals for the expression indexes to be usable.
+    assert "swapi_resource.data ->> 'director' ILIKE $1" in sql
+    assert "(swapi_resource.data -> 'homeworld')) ->> 'name' ILIKE $2" in sql
+    assert "swapi_resource.name ILIKE" in sql
+    assert "CAST" not in sql
+    assert sql.count("ILIKE") == 3
+
+
+def test_filter_wildcards_are_escaped():
+    stmt = ResourceRepository(db_session=None)._apply_filters(
+        select(SwapiResource.id), {"director": "100%_sure"}
+    )
+    params = stmt.compile(dialect=postgresql.dialect()).params
+
+    assert "%100\\%\\_sure%" in params.values()
+
+
+PageRow = namedtuple("PageRow", "swapi_id data total")
+SortedRow = namedtuple("SortedRow", "swapi_id data sort_value")
+
+
+class RecordingSession:
+    """A stand-in AsyncSession that returns canned rows and records statements."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+        return self
+
+    def all(self):
+        return self.rows
+
+    def scalar_one(self):
+        return 0
+
+
+@pytest.mark.asyncio
+async def test_browse_page_and_total_come_from_one_statement():
+    session = RecordingSession(
+        [PageRow(1, {"name": "A New Hope"}, 6), PageRow(2, {"name": "Empire"}, 6)]
+    )
+    cache = TypeCountCache()
+    repo = ResourceRepository(session, count_cache=cache, version_provider=lambda: 3)
+
+    page = await repo.get_all_resources("films", limit=1, offset=0)
+
+    assert len(session.statements) == 1
+    assert "count(swapi_resource.id)" in session.statements[0]
+    assert page.count == 6
+    assert page.results == [{"name": "A New Hope"}]
+    assert page.next_key == [1]
+    assert cache.get("films", 3) == 6
+
+
+@pytest.mark.asyncio
+async def test_unfiltered_totals_are_served_from_the_cache():
+    session = RecordingSession([PageRow(1, {"name": "A New Hope"}, None)])
+    cache = TypeCountCache()
+    cache.put("films", 3, 6)
+    repo = ResourceRepository(session, count_cache=cache, version_provider=lambda: 3)
+
+    page = await repo.get_all_resources("films", limit=10, offset=0)
+
+    assert page.count == 6
+    assert "count(" not in session.statements[0]
+
+
+def test_count_cache_drops_entries_of_other_versions():
+    cache = TypeCountCache()
+    cache.put("films", 1, 6)
+    cache.put("people", 2, 82)
+
+    assert cache.get("films", 1) is None
+    assert cache.get("people", 2) == 82
+    assert cache.get("people", None) is None
+
+
+def test_range_filters_bound_the_numeric_columns():
+    sql = compile_filters({"min_height": 150, "max_height": None, "max_mass": 80})
+
+    assert "swapi_resource.height >=" in sql
+    assert "swapi_resource.mass <=" in sql
+    assert "ILIKE" not in sql
+
+
+@pytest.mark.asyncio
+async def test_sorted_pages_seek_past_the_last_value_with_nulls_last():
+    session = RecordingSession(
+        [SortedRow(4, {"name": "Darth Vader"}, 202.0), SortedRow(13, {"name": "Chewbacca"}, 228.0)]
+    )
+    cache = TypeCountCache()
+    cache.put("people", 1, 82)
+    repo = ResourceRepository(session, count_cache=cache, version_provider=lambda: 1)
+
+    page = await repo.get_all_resources(
+        "people", limit=1, offset=0, sort="height", descending=True, after=[228.0, 13]
+    )
+
+    sql = session.statements[0]
+    assert "ORDER BY swapi_resource.height DESC NULLS LAST, swapi_resource.swapi_id" in sql
+    assert "swapi_resource.height < " in sql
+    assert "swapi_resource.height IS NULL" in sql
+    assert page.next_key == [202.0, 4]
+
+
+@pytest.mark.asyncio
+async def test_resources_by_keys_use_one_tuple_in_query():
+    KeyRow = namedtuple("KeyRow", "type swapi_id data")
+    session = RecordingSession([KeyRow("planets", 1, {"name": "Tatooine"})])
+
+    found = await ResourceRepository(session).get_resources_by_keys([("planets", 1), ("films", 9)])
+
+    assert found == {("planets", 1): {"name": "Tatooine"}}
+    assert "(swapi_resource.type, swapi_resource.swapi_id) IN" in session.statements[0]
+
+
+@pytest.mark.asyncio
+async def test_resources_by_keys_can_be_read_pre_encoded():
+    KeyRow = namedtuple("KeyRow", "type swapi_id data_json data")
+    session = RecordingSession([
+        KeyRow("planets", 1, '{"name":"Tatooine"}', None),
+        KeyRow("films", 1, None, {"title": "A New Hope"}),
+    ])
+
+    found = await ResourceRepository(session).get_resources_by_keys(
+        [("planets", 1), ("films", 1)], encoded=True
+    )
+
+    assert found == {("planets", 1): '{"name":"Tatooine"}', ("films", 1): {"title": "A New Hope"}}
+    assert "swapi_resource.data_json" in session.statements[0]
+
+
+class StreamingSession:
+    """A stand-in AsyncSession whose `stream_scalars` yields canned batches."""
+
+    def __init__(self, batches):
+        self.batches = batches
+        self.statement = None
+
+    async def stream_scalars(self, stmt):
+        self.statement = stmt
+        return self
+
+    async def partitions(self):
+        for batch in self.batches:
+            yield batch
+
+
+@pytest.mark.asyncio
+async def test_stream_resources_reads_json_text_through_a_server_side_cursor():
+    session = StreamingSession([['{"name": "Luke"}'], ['{"name": "Leia"}']])
+    repo = ResourceRepository(db_session=session)
+
+    batches = [batch async for batch in repo.stream_resources("people", batch_size=1)]
+    sql = str(session.statement.compile(dialect=postgresql.dialect()))
+
+    assert batches == [['{"name": "Luke"}'], ['{"name": "Leia"}']]
+    assert session.statement.get_execution_options()["yield_per"] == 1
+    assert "CAST(swapi_resource.data AS TEXT)" in sql
+    assert "ORDER BY swapi_resource.type, swapi_resource.swapi_id" in sql
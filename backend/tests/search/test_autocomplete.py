@@ -0,0 +1,28 @@
+from swapi_search.search.autocomplete import PrefixIndex
+
+SAMPLE_ROWS = [
+    {"id": 1, "type": "people", "name": "Luke Skywalker", "data": {"url": "/people/1"}},
+    {"id": 2, "type": "people", "name": "Obi-Wan Kenobi", "data": {"url": "/people/10"}},
+    {"id": 3, "type": "starships", "name": "Skyhopper", "data": {"url": "/starships/99"}},
+    {"id": 4, "type": "planets", "name": "Tatooine", "data": {"url": "/planets/1"}},
+]
+
+
+def test_full_name_matches_come_before_word_matches():
+    index = PrefixIndex(SAMPLE_ROWS)
+    assert [s["name"] for s in index.lookup("SKY")] == ["Skyhopper", "Luke Skywalker"]
+
+
+def test_word_starts_inside_names():
+    index = PrefixIndex(SAMPLE_ROWS)
+    assert [s["name"] for s in index.lookup("wan")] == ["Obi-Wan Kenobi"]
+    assert [s["name"] for s in index.lookup("luke  sky")] == ["Luke Skywalker"]
+
+
+def test_type_filter_and_limit():
+    index = PrefixIndex(SAMPLE_ROWS)
+    assert index.lookup("sky", resource_type="people") == [
+        {"name": "Luke Skywalker", "type": "people", "url": "/people/1"}
+    ]
+    assert len(index.lookup("sky", limit=1)) == 1
+    assert index.lookup("sky", resource_type="vehicles") == []
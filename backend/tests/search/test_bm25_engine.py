@@ -0,0 +1,104 @@
+import pytest
+
+from swapi_search.search.base import SearchMode, UnsupportedSearchModeError
+from swapi_search.search.bm25 import BM25SearchEngine
+
+pytest.importorskip("numpy")
+
+# Rows as loaded from the swapi_resource table by the DatasetWatcher.
+SAMPLE_ROWS = [
+    {
+        "id": 1, "swapi_id": 1, "type": "films", "name": "A New Hope",
+        "data": {"name": "A New Hope", "type": "films"},
+        "searchable_text": "a new hope george lucas luke skywalker tatooine",
+    },
+    {
+        "id": 2, "swapi_id": 1, "type": "people", "name": "Luke Skywalker",
+        "data": {"name": "Luke Skywalker", "type": "people"},
+        "searchable_text": "luke skywalker tatooine a new hope",
+    },
+    {
+        "id": 3, "swapi_id": 1, "type": "planets", "name": "Tatooine",
+        "data": {"name": "Tatooine", "type": "planets"},
+        "searchable_text": "tatooine luke skywalker a new hope",
+    },
+    {
+        "id": 4, "swapi_id": 2, "type": "people", "name": "Anakin Skywalker",
+        "data": {"name": "Anakin Skywalker", "type": "people"},
+        "searchable_text": "anakin skywalker tatooine",
+    },
+]
+
+
+@pytest.fixture
+def engine() -> BM25SearchEngine:
+    engine = BM25SearchEngine()
+    engine.load(SAMPLE_ROWS)
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_name_matches_rank_first(engine: BM25SearchEngine):
+    """Documents matching every term in their name outrank the others."""
+    page = await engine.search("luke skywalker ")
+
+    assert page.mode == SearchMode.fulltext
+    assert page.count == 4
+    assert page.results[0]["name"] == "Luke Skywalker"
+
+
+@pytest.mark.asyncio
+async def test_trailing_word_is_matched_as_prefix(engine: BM25SearchEngine):
+    """A partially typed last word matches the terms it starts."""
+    page = await engine.search("anak")
+
+    assert [r["name"] for r in page.results] == ["Anakin Skywalker"]
+    assert (await engine.search("anak ")).count == 0
+
+
+@pytest.mark.asyncio
+async def test_type_filter_and_facets(engine: BM25SearchEngine):
+    """Facets count every match; the type filter only narrows the page."""
+    page = await engine.search("tatooine ", resource_type="people", facets=True)
+
+    assert page.count == 2
+    assert {r["type"] for r in page.results} == {"people"}
+    assert page.facets == {"films": 1, "people": 2, "planets": 1}
+
+
+@pytest.mark.asyncio
+async def test_pages_match_full_ranking(engine: BM25SearchEngine):
+    """Offset and cursor pages are slices of the full ranking, with no gaps or repeats."""
+    ranking = [r["name"] for r in (await engine.search("tatooine ", limit=10)).results]
+
+    by_offset = []
+    for offset in range(0, 4, 2):
+        page = await engine.search("tatooine ", limit=2, offset=offset)
+        by_offset += [r["name"] for r in page.results]
+
+    by_cursor, after = [], None
+    while True:
+        page = await engine.search("tatooine ", limit=1, after=after)
+        by_cursor += [r["name"] for r in page.results]
+        if page.next_key is None:
+            break
+        after = page.next_key
+
+    assert len(ranking) == 4
+    assert by_offset == ranking
+    assert by_cursor == ranking
+
+
+@pytest.mark.asyncio
+async def test_unsupported_mode_is_rejected(engine: BM25SearchEngine):
+    with pytest.raises(UnsupportedSearchModeError):
+        await engine.search("luke", mode=SearchMode.substring)
+
+
+@pytest.mark.asyncio
+async def test_search_before_load_returns_empty_page():
+    page = await BM25SearchEngine().search("luke", facets=True)
+
+    assert page.results == []
+    assert page.count == 0
+    assert page.facets == {}
@@ -0,0 +1,74 @@
+import pytest
+
+from swapi_search.search.base import SearchPage
+from swapi_search.search.cache import CachedSearchEngine, SearchResultCache
+from tests.conftest import MockSearchEngine
+
+
+class CountingSearchEngine(MockSearchEngine):
+    """A mock engine that records how many searches reached it."""
+
+    calls = 0
+
+    async def search(self, *args, **kwargs) -> SearchPage:
+        CountingSearchEngine.calls += 1
+        return await super().search(*args, **kwargs)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def inner() -> CountingSearchEngine:
+    CountingSearchEngine.calls = 0
+    engine = CountingSearchEngine()
+    engine.set_results([{"name": "Luke Skywalker", "type": "people"}])
+    yield engine
+    engine.clear()
+
+
+@pytest.mark.asyncio
+async def test_hits_are_case_insensitive(inner: CountingSearchEngine):
+    cache = SearchResultCache(max_entries=10, ttl_seconds=60)
+    engine = CachedSearchEngine(inner, cache, version_provider=lambda: 1)
+
+    first = await engine.search("Luke")
+    second = await engine.search("LUKE")
+
+    assert second is first
+    assert inner.calls == 1
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_new_dataset_version_invalidates(inner: CountingSearchEngine):
+    version = {"current": 1}
+    cache = SearchResultCache(max_entries=10, ttl_seconds=60)
+    engine = CachedSearchEngine(inner, cache, version_provider=lambda: version["current"])
+
+    await engine.search("luke")
+    version["current"] = 2
+    await engine.search("luke")
+
+    assert inner.calls == 2
+    assert cache.stats()["invalidations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_ttl_and_lru_eviction(inner: CountingSearchEngine):
+    clock = FakeClock()
+    cache = SearchResultCache(max_entries=2, ttl_seconds=10, clock=clock)
+    engine = CachedSearchEngine(inner, cache, version_provider=lambda: 1)
+
+    for query in ("luke", "leia", "han"):
+        await engine.search(query)
+    assert cache.stats()["evictions"] == 1
+
+    clock.now = 11
+    await engine.search("han")
+    assert inner.calls == 4
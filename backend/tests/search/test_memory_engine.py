@@ -0,0 +1,101 @@
+import pytest
+
+from swapi_search.search.base import SearchMode, UnsupportedSearchModeError
+from swapi_search.search.memory import InMemorySearchEngine
+
+# Rows as loaded from the swapi_resource table by the DatasetWatcher.
+SAMPLE_ROWS = [
+    {
+        "id": 1, "swapi_id": 1, "type": "films", "name": "A New Hope",
+        "data": {"name": "A New Hope", "type": "films"},
+        "searchable_text": "a new hope george lucas luke skywalker tatooine",
+    },
+    {
+        "id": 2, "swapi_id": 1, "type": "people", "name": "Luke Skywalker",
+        "data": {"name": "Luke Skywalker", "type": "people"},
+        "searchable_text": "luke skywalker tatooine a new hope",
+    },
+    {
+        "id": 3, "swapi_id": 1, "type": "planets", "name": "Tatooine",
+        "data": {"name": "Tatooine", "type": "planets"},
+        "searchable_text": "tatooine luke skywalker a new hope",
+    },
+    {
+        "id": 4, "swapi_id": 2, "type": "people", "name": "Anakin Skywalker",
+        "data": {"name": "Anakin Skywalker", "type": "people"},
+        "searchable_text": "anakin skywalker tatooine",
+    },
+]
+
+
+@pytest.fixture
+def engine() -> InMemorySearchEngine:
+    engine = InMemorySearchEngine()
+    engine.load(SAMPLE_ROWS)
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_name_matches_rank_first(engine: InMemorySearchEngine):
+    """Name matches come first, each group ordered by id."""
+    page = await engine.search("SKYWALKER")
+    assert page.count == 4
+    assert [r["name"] for r in page.results] == [
+        "Luke Skywalker", "Anakin Skywalker", "A New Hope", "Tatooine",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_type_filter_and_pagination(engine: InMemorySearchEngine):
+    page = await engine.search("tatooine", resource_type="people", limit=1, offset=1)
+    assert page.count == 2
+    assert [r["name"] for r in page.results] == ["Anakin Skywalker"]
+
+
+@pytest.mark.asyncio
+async def test_short_and_missing_queries(engine: InMemorySearchEngine):
+    assert (await engine.search("a")).count == 4
+    assert (await engine.search("vader")).results == []
+
+
+@pytest.mark.asyncio
+async def test_load_swaps_index(engine: InMemorySearchEngine):
+    engine.load(SAMPLE_ROWS[:1])
+    page = await engine.search("skywalker")
+    assert [r["name"] for r in page.results] == ["A New Hope"]
+
+
+@pytest.mark.asyncio
+async def test_unsupported_mode_is_rejected(engine: InMemorySearchEngine):
+    with pytest.raises(UnsupportedSearchModeError):
+        await engine.search("luke", mode=SearchMode.fulltext)
+
+
+@pytest.mark.asyncio
+async def test_keyset_pages_match_offset_pages(engine: InMemorySearchEngine):
+    """Walking next_key cursors yields the same order as offset paging."""
+    expected = [r["name"] for r in (await engine.search("skywalker", limit=10)).results]
+
+    names, after = [], None
+    while True:
+        page = await engine.search("skywalker", limit=1, after=after)
+        names.extend(r["name"] for r in page.results)
+        if page.next_key is None:
+            break
+        after = page.next_key
+
+    assert names == expected
+
+
+@pytest.mark.asyncio
+async def test_facets_count_every_type(engine: InMemorySearchEngine):
+    page = await engine.search("tatooine", resource_type="planets", facets=True)
+    assert page.count == 1
+    assert page.facets == {"films": 1, "people": 2, "planets": 1}
+
+
+@pytest.mark.asyncio
+async def test_results_are_projected_to_fields(engine: InMemorySearchEngine):
+    page = await engine.search("luke", fields=["name"])
+
+    assert page.results[0] == {"name": "Luke Skywalker"}
@@ -0,0 +1,110 @@
+import re
+from collections import namedtuple
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from swapi_search.core.config import settings
+from swapi_search.search.base import SearchMode
+from swapi_search.search.postgres import PostgresSearchEngine
+
+
+def compile_fulltext(query: str) -> str:
+    """Compiles the full-text match condition with its parameters inlined."""
+    conditions, _ = PostgresSearchEngine(db_session=None)._fulltext_clauses(query)
+    compiled = conditions[0].compile(dialect=postgresql.dialect())
+    return re.sub(r"%\((\w+)\)s", lambda m: repr(compiled.params[m.group(1)]), compiled.string)
+
+
+def test_trailing_plain_term_is_matched_as_prefix():
+    assert compile_fulltext("luke sky") == (
+        "swapi_resource.search_vector @@ (websearch_to_tsquery('simple', 'luke')"
+        " && to_tsquery('simple', 'sky:*'))"
+    )
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "luke ",  # a finished word
+        '"luke skywalker"',  # a phrase
+        '"luke sky',  # a phrase still being typed
+        "luke -vader",  # an excluded word
+        "luke or sky",  # an alternative
+        "luke or",
+    ],
+)
+def test_queries_not_ending_in_a_plain_term_keep_websearch_semantics(query: str):
+    assert compile_fulltext(query) == (
+        f"swapi_resource.search_vector @@ websearch_to_tsquery('simple', {query!r})"
+    )
+
+
+SearchRow = namedtuple("SearchRow", "data total_count relevance id")
+
+
+class RecordingSession:
+    """
+    A stand-in AsyncSession that records statements and returns the next
+    canned list of rows for each statement whose rows are read.
+    """
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+        return self
+
+    def all(self):
+        return self.results.pop(0)
+
+    def scalar_one(self):
+        return 0
+
+
+@pytest.mark.asyncio
+async def test_fuzzy_search_sets_threshold_then_ranks_by_word_similarity():
+    session = RecordingSession([SearchRow({"name": "Luke Skywalker"}, 1, 1.5, 1)])
+    engine = PostgresSearchEngine(session, fuzzy_threshold=0.4)
+
+    page = await engine.search("lukr", mode=SearchMode.fuzzy)
+
+    assert len(session.statements) == 2
+    assert "set_config" in session.statements[0]
+    # `%` is doubled for the driver's paramstyle.
+    assert "swapi_resource.searchable_text %%> " in session.statements[1]
+    assert "word_similarity" in session.statements[1]
+    assert page.mode == SearchMode.fuzzy
+    assert page.results == [{"name": "Luke Skywalker"}]
+
+
+@pytest.mark.asyncio
+async def test_substring_search_with_too_few_hits_is_retried_as_fuzzy(monkeypatch):
+    monkeypatch.setattr(settings, "SEARCH_FUZZY_FALLBACK_MIN_HITS", 2)
+    session = RecordingSession(
+        [SearchRow({"name": "Lukr"}, 1, 2, 9)],
+        [SearchRow({"name": "Luke Skywalker"}, 2, 1.5, 1), SearchRow({"name": "Lukr"}, 2, 1.0, 9)],
+    )
+
+    page = await PostgresSearchEngine(session).search("lukr", mode=SearchMode.substring)
+
+    assert len(session.statements) == 3
+    assert "ILIKE" in session.statements[0]
+    assert "set_config" in session.statements[1]
+    assert "%%>" in session.statements[2]
+    assert page.mode == SearchMode.fuzzy
+    assert page.count == 2
+
+
+@pytest.mark.asyncio
+async def test_fuzzy_fallback_is_disabled_by_zero_min_hits(monkeypatch):
+    monkeypatch.setattr(settings, "SEARCH_FUZZY_FALLBACK_MIN_HITS", 0)
+    session = RecordingSession([])
+
+    page = await PostgresSearchEngine(session).search("lukr", mode=SearchMode.substring)
+
+    assert len(session.statements) == 1
+    assert page.mode == SearchMode.substring
+    assert page.count == 0
@@ -0,0 +1,145 @@
+from contextlib import asynccontextmanager
+
+import pytest
+
+from swapi_search.api.v1.dependencies import shadow_replay_limit
+from swapi_search.core.config import settings
+from swapi_search.search.base import BaseSearchEngine, SearchMode, SearchPage
+from swapi_search.search.shadow import (
+    LatencyHistogram,
+    ShadowSearchEngine,
+    ShadowStats,
+    drain_pending,
+    top_k_overlap,
+)
+
+LUKE = {"url": "/api/v1/people/1", "name": "Luke Skywalker", "type": "people"}
+LEIA = {"url": "/api/v1/people/5", "name": "Leia Organa", "type": "people"}
+TATOOINE = {"url": "/api/v1/planets/1", "name": "Tatooine", "type": "planets"}
+
+
+class FixedSearchEngine(BaseSearchEngine):
+    """A mock engine that always returns the same results."""
+
+    def __init__(self, results, fail: bool = False):
+        self.fixed_results = results
+        self.fail = fail
+
+    async def search(self, query, *args, mode=None, **kwargs) -> SearchPage:
+        if self.fail:
+            raise RuntimeError("secondary is down")
+        return SearchPage(results=self.fixed_results, count=len(self.fixed_results), mode=mode)
+
+
+def shadowing(primary, secondary, stats, **kwargs) -> ShadowSearchEngine:
+    @asynccontextmanager
+    async def factory():
+        yield secondary
+
+    return ShadowSearchEngine(primary, factory, stats, **kwargs)
+
+
+def test_top_k_overlap():
+    assert top_k_overlap([LUKE, LEIA], [LEIA, LUKE]) == 1.0
+    assert top_k_overlap([LUKE, LEIA], [LUKE, TATOOINE]) == 0.5
+    assert top_k_overlap([LUKE], []) == 0.0
+    assert top_k_overlap([], []) == 1.0
+
+
+def test_histogram_percentiles_use_bucket_bounds():
+    histogram = LatencyHistogram(buckets_ms=(1, 10, 100))
+    for elapsed in (0.5, 3, 4, 50, 500):
+        histogram.record(elapsed)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["count"] == 5
+    assert snapshot["p50_ms"] == 10
+    assert snapshot["p99_ms"] == 500
+    assert snapshot["buckets"] == {"le_1": 1, "le_10": 2, "le_100": 1, "le_inf": 1}
+
+
+@pytest.mark.asyncio
+async def test_serves_primary_and_records_comparison():
+    stats = ShadowStats()
+    engine = shadowing(
+        FixedSearchEngine([LUKE, LEIA]), FixedSearchEngine([LUKE, TATOOINE]), stats
+    )
+
+    page = await engine.search("sky")
+    await drain_pending()
+
+    assert page.results == [LUKE, LEIA]
+    snapshot = stats.snapshot()
+    assert snapshot["comparisons"] == 1
+    assert snapshot["mean_top_k_overlap"] == 0.5
+    assert snapshot["latency"]["primary"]["count"] == 1
+    assert snapshot["latency"]["secondary"]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_secondary_failures_do_not_reach_the_response():
+    stats = ShadowStats()
+    engine = shadowing(FixedSearchEngine([LUKE]), FixedSearchEngine([], fail=True), stats)
+
+    page = await engine.search("luke")
+    await drain_pending()
+
+    assert page.results == [LUKE]
+    assert stats.secondary_errors == 1
+    assert stats.comparisons == 0
+
+
+@pytest.mark.asyncio
+async def test_unsupported_modes_are_replayed_in_the_secondary_default_mode():
+    stats = ShadowStats()
+    primary = FixedSearchEngine([LUKE])
+    primary.supported_modes = frozenset({SearchMode.substring, SearchMode.fuzzy})
+    secondary = FixedSearchEngine([LUKE])
+    secondary.supported_modes = frozenset({SearchMode.fulltext})
+    secondary.default_mode = SearchMode.fulltext
+    engine = shadowing(primary, secondary, stats)
+
+    await engine.search("luke", mode=SearchMode.fuzzy)
+    await drain_pending()
+
+    assert stats.default_mode_replays == 1
+    assert stats.comparisons == 1
+    assert stats.skipped == 0
+
+
+@pytest.mark.asyncio
+async def test_cursor_pages_are_skipped():
+    stats = ShadowStats()
+    engine = shadowing(FixedSearchEngine([LUKE]), FixedSearchEngine([LEIA]), stats)
+
+    await engine.search("luke", after=[0.5, 1])
+    await drain_pending()
+
+    assert stats.skipped == 1
+    assert stats.comparisons == 0
+
+
+@pytest.mark.asyncio
+async def test_excess_replays_are_dropped():
+    stats = ShadowStats()
+    engine = shadowing(
+        FixedSearchEngine([LUKE]), FixedSearchEngine([LUKE]), stats, max_pending=1
+    )
+
+    await engine.search("luke")
+    await engine.search("leia")
+    await drain_pending()
+
+    assert stats.comparisons == 1
+    assert stats.dropped == 1
+
+
+@pytest.mark.parametrize(
+    "secondary, pool_size, expected", [("memory", 5, 16), ("postgres", 5, 2), ("postgres", 1, 1)]
+)
+def test_database_replays_are_held_below_the_pool_size(monkeypatch, secondary, pool_size, expected):
+    monkeypatch.setattr(settings, "SEARCH_SHADOW_ENGINE", secondary)
+    monkeypatch.setattr(settings, "SEARCH_SHADOW_MAX_PENDING", 16)
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", pool_size)
+
+    assert shadow_replay_limit() == expected